@@ -0,0 +1,14 @@
+#!/bin/sh
+# Без внешнего общего кэша (REDIS_URL) запускает локальный Redis
+# без сохранения на диск, чтобы процессы gunicorn делили кэш Django.
+set -e
+
+if [ -z "$REDIS_URL" ]; then
+    redis-server --daemonize yes --bind 127.0.0.1 --port 6379 \
+        --save '' --appendonly no \
+        --maxmemory "${REDIS_MAXMEMORY:-256mb}" \
+        --maxmemory-policy allkeys-lru
+    export REDIS_URL=redis://127.0.0.1:6379/0
+fi
+
+exec "$@"
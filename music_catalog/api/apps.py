@@ -1,6 +1,31 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self) -> None:
+        from . import signals
+        from music.signals import catalog_changed
+
+        for signal in (post_save, post_delete):
+            signal.connect(signals.musician_changed, sender='music.Musician')
+            signal.connect(signals.album_changed, sender='music.Album')
+            signal.connect(
+                signals.album_song_changed, sender='music.AlbumSong'
+            )
+        post_save.connect(signals.song_changed, sender='music.Song')
+        for signal in (post_save, post_delete):
+            for model in ('music.Musician', 'music.Album', 'music.Song'):
+                signal.connect(signals.slug_changed, sender=model)
+        for signal in (post_save, post_delete):
+            signal.connect(
+                signals.user_changed, sender=settings.AUTH_USER_MODEL
+            )
+        catalog_changed.connect(signals.catalog_bulk_changed)
+        post_migrate.connect(
+            signals.schema_changed, sender=self.apps.get_app_config('music')
+        )
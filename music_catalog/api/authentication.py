@@ -0,0 +1,87 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import (
+    JWTStatelessUserAuthentication
+)
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from music.models import User
+
+AUTH_STATE_PREFIX = 'catalog:auth:'
+
+
+def auth_state_key(user_id: Any) -> str:
+    """Возвращает ключ кэша состояния пользователя."""
+    return f'{AUTH_STATE_PREFIX}{user_id}'
+
+
+def get_auth_state(user_id: Any) -> dict[str, Any]:
+    """
+    Возвращает хэш пароля и флаги пользователя, закэшированные
+    на 'AUTH_STATE_CACHE_TIMEOUT' секунд. Отсутствующий пользователь
+    кэшируется пустым словарем. Состояние читается из основной базы,
+    чтобы отстающая реплика не вернула его в кэш после изменения.
+    """
+    key: str = auth_state_key(user_id)
+    state: dict[str, Any] | None = cache.get(key)
+    if state is None:
+        user: dict[str, Any] | None = User.objects.using(
+            DEFAULT_DB_ALIAS
+        ).filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        ).values('password', 'is_active', 'is_staff').first()
+        state = {
+            'password': get_md5_hash_password(user['password']),
+            'is_active': user['is_active'],
+            'is_staff': user['is_staff'],
+        } if user else {}
+        cache.set(key, state, timeout=settings.AUTH_STATE_CACHE_TIMEOUT)
+    return state
+
+
+def reset_auth_state(user_id: Any) -> None:
+    """Удаляет состояние пользователя из кэша."""
+    cache.delete(auth_state_key(user_id))
+
+
+class CatalogJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Аутентификация по JWT без запроса пользователя из базы данных.
+    Права берутся из подписанного утверждения 'is_staff' токена,
+    выданного 'AdminLoginView'. Токен отклоняется, если пользователь
+    удален, деактивирован, лишен прав администратора или сменил пароль.
+    Эти изменения проверяются по кэшу состояния пользователя,
+    который сбрасывается сигналами модели пользователя.
+    """
+    def get_user(self, validated_token: Token) -> TokenUser:
+        """Проверяет токен по состоянию пользователя в кэше."""
+        user: TokenUser = super().get_user(validated_token)
+        state: dict[str, Any] = get_auth_state(user.id)
+        if not state:
+            raise AuthenticationFailed(
+                'Пользователь не найден.', code='user_not_found'
+            )
+        if not state['is_active']:
+            raise AuthenticationFailed(
+                'Пользователь неактивен.', code='user_inactive'
+            )
+        if validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != state['password'] or user.is_staff and not state['is_staff']:
+            raise AuthenticationFailed(
+                'Токен отозван.', code='token_revoked'
+            )
+        return user
+
+
+class CatalogJWTScheme(SimpleJWTScheme):
+    """Схема OpenAPI для 'CatalogJWTAuthentication'."""
+    target_class = 'api.authentication.CatalogJWTAuthentication'
@@ -0,0 +1,424 @@
+from dataclasses import dataclass, field
+from random import Random
+from statistics import mean, quantiles
+from time import perf_counter
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, QuerySet
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import BaseSerializer
+from rest_framework.test import APIClient
+
+from .renderers import CatalogJSONRenderer
+from .serializers import (
+    AlbumSerialiser, AlbumValuesSerializer, MusicianSerializer,
+    MusicianValuesSerializer, SongSerialiser, SongValuesSerializer,
+    ValuesSerializer
+)
+from constants import CURSOR_PAGINATION_MODE, SONGS_IN_ALBUM
+from music.models import User, Musician, Album, Song, AlbumSong
+
+BENCHMARK_USERNAME = 'benchmark'
+BENCHMARK_PASSWORD = 'benchmark-password'
+
+
+@dataclass
+class CatalogScale:
+    """Размер синтетического каталога."""
+    musicians: int = 100
+    albums: int = 10
+    songs: int = 10
+
+    def __post_init__(self) -> None:
+        if not 0 < self.songs <= SONGS_IN_ALBUM:
+            raise ValueError(
+                f'Количество песен в альбоме должно быть от 1 '
+                f'до {SONGS_IN_ALBUM}.'
+            )
+        if self.musicians < 1 or self.albums < 1:
+            raise ValueError(
+                'Количество исполнителей и альбомов должно быть больше 0.'
+            )
+
+    def as_dict(self) -> dict[str, int]:
+        """Возвращает размер каталога с количеством строк 'AlbumSong'."""
+        return {
+            'musicians': self.musicians,
+            'albums': self.musicians * self.albums,
+            'songs': self.musicians * self.albums * self.songs,
+        }
+
+
+def seed_catalog(scale: CatalogScale, batch_size: int = 500) -> None:
+    """
+    Заполняет базу синтетическим каталогом через 'bulk_create'
+    частями по 'batch_size' исполнителей. Слаги строятся по номерам,
+    поэтому адреса запросов вычисляются без обращения к базе.
+    Счетчики заполняются сразу, сигналы не отправляются.
+    """
+    for start in range(0, scale.musicians, batch_size):
+        numbers: range = range(
+            start, min(start + batch_size, scale.musicians)
+        )
+        with transaction.atomic():
+            musicians: list[Musician] = Musician.objects.bulk_create(
+                Musician(
+                    name=f'Musician {m}', slug=f'musician-{m}',
+                    total_albums=scale.albums,
+                    total_songs=scale.albums * scale.songs
+                )
+                for m in numbers
+            )
+            albums: list[Album] = Album.objects.bulk_create(
+                Album(
+                    name=f'Album {m}-{a}', slug=f'album-{m}-{a}',
+                    musician=musician, year_of_release=1960 + a % 60,
+                    total_songs=scale.songs
+                )
+                for m, musician in zip(numbers, musicians)
+                for a in range(scale.albums)
+            )
+            songs: list[Song] = Song.objects.bulk_create(
+                Song(name=f'Song {album.slug[6:]}-{s}',
+                     slug=f'song-{album.slug[6:]}-{s}')
+                for album in albums
+                for s in range(1, scale.songs + 1)
+            )
+            AlbumSong.objects.bulk_create(
+                AlbumSong(
+                    album=albums[index // scale.songs], song=song,
+                    number_in_album=index % scale.songs + 1
+                )
+                for index, song in enumerate(songs)
+            )
+    User.objects.create_superuser(
+        username=BENCHMARK_USERNAME, password=BENCHMARK_PASSWORD
+    )
+
+
+@dataclass
+class Scenario:
+    """
+    Запрос к эндпоинту с допустимым количеством SQL-запросов.
+    'sorts_in_memory' разрешает сортировку без индекса
+    для запросов, которые сортируют ограниченную выборку.
+    """
+    name: str
+    url: Callable[[Random, CatalogScale], str]
+    max_queries: int
+    method: str = 'get'
+    data: dict[str, Any] | None = None
+    sorts_in_memory: bool = False
+
+
+def musician(rng: Random, scale: CatalogScale) -> str:
+    """Возвращает слаг случайного исполнителя."""
+    return f'musician-{rng.randrange(scale.musicians)}'
+
+
+def album(rng: Random, scale: CatalogScale) -> str:
+    """Возвращает путь случайного альбома случайного исполнителя."""
+    m: int = rng.randrange(scale.musicians)
+    return f'musician-{m}/albums/album-{m}-{rng.randrange(scale.albums)}'
+
+
+def song(rng: Random, scale: CatalogScale) -> str:
+    """Возвращает путь случайной песни случайного альбома."""
+    m: int = rng.randrange(scale.musicians)
+    a: int = rng.randrange(scale.albums)
+    return (
+        f'musician-{m}/albums/album-{m}-{a}/songs/'
+        f'song-{m}-{a}-{rng.randrange(1, scale.songs + 1)}'
+    )
+
+
+def random_page(rng: Random, size: int) -> int:
+    """Возвращает случайный номер страницы списка из 'size' записей."""
+    return rng.randrange(1, max(size // 5, 1) + 1)
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario('musicians-list', lambda rng, scale: (
+        '/api/v1/musicians/'
+        f'?page={random_page(rng, scale.musicians)}'
+    ), 3),
+    Scenario('musicians-list-cursor', lambda rng, scale: (
+        f'/api/v1/musicians/?pagination={CURSOR_PAGINATION_MODE}'
+    ), 2),
+    Scenario('musicians-search', lambda rng, scale: (
+        f'/api/v1/musicians/?search=Musician+{rng.randrange(scale.musicians)}'
+    ), 3, sorts_in_memory=True),
+    Scenario('musician-detail', lambda rng, scale: (
+        f'/api/v1/musicians/{musician(rng, scale)}/'
+    ), 2),
+    Scenario('musician-detail-expanded', lambda rng, scale: (
+        f'/api/v1/musicians/{musician(rng, scale)}/?expand=albums'
+    ), 3),
+    Scenario('albums-list', lambda rng, scale: (
+        f'/api/v1/musicians/{musician(rng, scale)}/albums/'
+        f'?page={random_page(rng, scale.albums)}'
+    ), 3),
+    Scenario('album-detail', lambda rng, scale: (
+        f'/api/v1/musicians/{album(rng, scale)}/'
+    ), 2),
+    Scenario('album-detail-expanded', lambda rng, scale: (
+        f'/api/v1/musicians/{album(rng, scale)}/?expand=songs'
+    ), 3),
+    Scenario('songs-list', lambda rng, scale: (
+        f'/api/v1/musicians/{album(rng, scale)}/songs/'
+        f'?page={random_page(rng, scale.songs)}'
+    ), 4, sorts_in_memory=True),
+    Scenario('song-detail', lambda rng, scale: (
+        f'/api/v1/musicians/{song(rng, scale)}/'
+    ), 3),
+    Scenario('admin-login', lambda rng, scale: '/api/v1/login/', 1, 'post', {
+        'username': BENCHMARK_USERNAME, 'password': BENCHMARK_PASSWORD,
+    }),
+)
+
+
+@dataclass
+class ScenarioResult:
+    """Измерения одного сценария."""
+    name: str
+    max_queries: int
+    statuses: dict[int, int] = field(default_factory=dict)
+    queries: list[int] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)
+    plans: list[dict[str, Any]] = field(default_factory=list)
+    plan_problems: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Возвращает SQL-запросы, перцентили задержки и пропускную способность."""
+        if len(self.latencies) > 1:
+            percentiles: list[float] = quantiles(
+                self.latencies, n=100, method='inclusive'
+            )
+        else:
+            percentiles = self.latencies * 99
+        result: dict[str, Any] = {
+            'requests': len(self.latencies),
+            'statuses': self.statuses,
+            'latency_ms': {
+                'p50': round(percentiles[49] * 1000, 3),
+                'p95': round(percentiles[94] * 1000, 3),
+                'max': round(max(self.latencies) * 1000, 3),
+            },
+            'requests_per_second': round(
+                len(self.latencies) / sum(self.latencies), 1
+            ),
+        }
+        if self.queries:
+            result['queries'] = {
+                'mean': round(mean(self.queries), 2),
+                'max': max(self.queries),
+                'budget': self.max_queries,
+            }
+        if self.plans:
+            result['plans'] = self.plans
+            result['plan_problems'] = self.plan_problems
+        return result
+
+
+def explain(sql: str, params: Any) -> list[str]:
+    """Возвращает строки плана выполнения SQL-запроса."""
+    prefix: str = (
+        'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql, params)
+        return [str(row[-1]) for row in cursor.fetchall()]
+
+
+def plan_problems(plan: list[str], sorts_in_memory: bool) -> list[str]:
+    """
+    Возвращает строки плана SQLite с полным просмотром таблицы
+    без индекса и, если сценарий этого не допускает, с сортировкой
+    во временном B-дереве. Планы других СУБД только сохраняются.
+    """
+    if connection.vendor != 'sqlite':
+        return []
+    return [
+        line for line in plan
+        if line.startswith('SCAN ') and 'USING' not in line
+        and 'VIRTUAL TABLE' not in line
+        or 'USE TEMP B-TREE' in line and not sorts_in_memory
+    ]
+
+
+def capture_plans(
+    request: Callable[[], Any], sorts_in_memory: bool = False
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """
+    Выполняет запрос и возвращает планы выполнения его SELECT-запросов
+    и найденные в них проблемы.
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def capture(
+        execute: Callable[..., Any], sql: str,
+        params: Any, many: bool, context: dict[str, Any]
+    ) -> Any:
+        if sql.lstrip().upper().startswith('SELECT'):
+            statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(capture):
+        request()
+    plans: list[dict[str, Any]] = []
+    problems: list[str] = []
+    for sql, params in statements:
+        plan: list[str] = explain(sql, params)
+        plans.append({'sql': sql, 'plan': plan})
+        problems += [
+            f'{line}: {sql}' for line in plan_problems(plan, sorts_in_memory)
+        ]
+    return plans, problems
+
+
+def run_scenario(
+    scenario: Scenario, scale: CatalogScale, requests: int,
+    rng: Random, warm_cache: bool = False, plans: bool = False
+) -> ScenarioResult:
+    """
+    Выполняет запросы сценария через тестовый клиент и измеряет
+    количество SQL-запросов и время каждого запроса.
+    Без 'warm_cache' кэш очищается перед каждым запросом,
+    чтобы измерялась работа с базой данных.
+    С 'plans' сохраняются планы выполнения SELECT-запросов
+    первого запроса и найденные в них проблемы.
+    """
+    client = APIClient()
+    result = ScenarioResult(scenario.name, scenario.max_queries)
+    if plans:
+        cache.clear()
+        result.plans, result.plan_problems = capture_plans(
+            lambda: getattr(client, scenario.method)(
+                scenario.url(rng, scale), data=scenario.data, format='json'
+            ),
+            scenario.sorts_in_memory
+        )
+    for _ in range(requests):
+        url: str = scenario.url(rng, scale)
+        if not warm_cache:
+            cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            started: float = perf_counter()
+            response = getattr(client, scenario.method)(
+                url, data=scenario.data, format='json'
+            )
+            result.latencies.append(perf_counter() - started)
+        result.queries.append(len(context.captured_queries))
+        result.statuses[response.status_code] = (
+            result.statuses.get(response.status_code, 0) + 1
+        )
+    return result
+
+
+@dataclass
+class SerializerBenchmark:
+    """
+    Сериализаторы списка одной модели: текущий сериализатор модели
+    с 'JSONRenderer' и быстрый сериализатор строк '.values()'
+    с 'CatalogJSONRenderer'.
+    """
+    name: str
+    queryset: Callable[[], QuerySet]
+    serializer: type[BaseSerializer]
+    values_serializer: type[ValuesSerializer]
+
+
+SERIALIZER_BENCHMARKS: tuple[SerializerBenchmark, ...] = (
+    SerializerBenchmark(
+        'musicians', lambda: Musician.objects.all(),
+        MusicianSerializer, MusicianValuesSerializer
+    ),
+    SerializerBenchmark(
+        'albums', lambda: Album.objects.select_related('musician'),
+        AlbumSerialiser, AlbumValuesSerializer
+    ),
+    SerializerBenchmark(
+        'songs', lambda: Song.objects.annotate(
+            number_in_album=F('songs__number_in_album')
+        ),
+        SongSerialiser, SongValuesSerializer
+    ),
+)
+
+
+def best_time(function: Callable[[], Any], repeat: int) -> float:
+    """Возвращает лучшее время из 'repeat' вызовов 'function'."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        started: float = perf_counter()
+        function()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def run_serializer_benchmark(
+    benchmark: SerializerBenchmark, rows: int, repeat: int = 5
+) -> dict[str, Any]:
+    """
+    Измеряет количество строк в секунду при выборке 'rows' строк
+    и формировании JSON текущим и быстрым сериализаторами.
+    Время включает выполнение запроса, поэтому учитывает и создание
+    объектов моделей, которого нет у быстрого сериализатора.
+    """
+    queryset: QuerySet = benchmark.queryset()[:rows]
+    values: QuerySet = benchmark.queryset().values(
+        *benchmark.values_serializer.values_fields.values()
+    )[:rows]
+    count: int = queryset.count()
+    current: float = best_time(lambda: JSONRenderer().render(
+        benchmark.serializer(list(queryset.all()), many=True).data
+    ), repeat)
+    fast: float = best_time(lambda: CatalogJSONRenderer().render(
+        benchmark.values_serializer(list(values.all()), many=True).data
+    ), repeat)
+    return {
+        'rows': count,
+        'current_rows_per_second': round(count / current),
+        'fast_rows_per_second': round(count / fast),
+        'speedup': round(current / fast, 2),
+    }
+
+
+def check_budgets(
+    results: dict[str, dict[str, Any]],
+    budgets: dict[str, dict[str, float]] | None = None
+) -> list[str]:
+    """
+    Возвращает нарушения бюджетов: лишние SQL-запросы, ответы
+    с ошибками, проблемы планов выполнения и, если заданы в 'budgets',
+    превышения 'queries' и 'p95_ms' для отдельных сценариев.
+    """
+    budgets = budgets or {}
+    violations: list[str] = []
+    for name, result in results.items():
+        budget: dict[str, float] = budgets.get(name, {})
+        max_queries: float = budget.get('queries', result['queries']['budget'])
+        if result['queries']['max'] > max_queries:
+            violations.append(
+                f'{name}: {result["queries"]["max"]} SQL-запросов '
+                f'при бюджете {max_queries}.'
+            )
+        if 'p95_ms' in budget and (
+            result['latency_ms']['p95'] > budget['p95_ms']
+        ):
+            violations.append(
+                f'{name}: p95 {result["latency_ms"]["p95"]} мс '
+                f'при бюджете {budget["p95_ms"]} мс.'
+            )
+        failed: list[int] = [
+            code for code in result['statuses'] if code >= 400
+        ]
+        if failed:
+            violations.append(f'{name}: ответы с кодами {failed}.')
+        violations += [
+            f'{name}: {problem}' for problem in result.get('plan_problems', [])
+        ]
+    return violations
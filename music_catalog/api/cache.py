@@ -0,0 +1,206 @@
+from collections import OrderedDict
+from hashlib import md5
+from threading import Lock
+from time import time_ns
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model, QuerySet
+from django.http import Http404
+from rest_framework.request import Request
+
+CACHE_VERSION_PREFIX = 'catalog:version:'
+CACHE_RESPONSE_PREFIX = 'catalog:response:'
+CACHE_HITS_KEY = 'catalog:stats:hits'
+CACHE_MISSES_KEY = 'catalog:stats:misses'
+CACHE_CHANGED_PREFIX = 'catalog:changed:'
+CACHE_SLUG_PREFIX = 'catalog:slug:'
+
+MUSICIANS_SCOPE = 'musicians'
+SCHEMA_SCOPE = 'schema'
+
+
+def musician_scope(slug: str) -> str:
+    """Возвращает область кэша альбомов исполнителя."""
+    return f'musician:{slug}'
+
+
+def album_scope(slug: str) -> str:
+    """Возвращает область кэша песен альбома."""
+    return f'album:{slug}'
+
+
+def get_versions(scopes: list[str]) -> list[int]:
+    """
+    Возвращает текущие версии областей кэша.
+    Отсутствующая версия создается из текущего времени, поэтому
+    после вытеснения ключа версии старые ответы не могут совпасть с новой.
+    """
+    keys: list[str] = [f'{CACHE_VERSION_PREFIX}{scope}' for scope in scopes]
+    versions: dict[str, int] = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_versions(scopes: Iterable[str]) -> None:
+    """
+    Делает недействительными закэшированные ответы областей.
+    При настроенных репликах области отмечаются измененными
+    на время 'REPLICA_PIN_SECONDS', пока реплики могут отставать.
+    """
+    scopes = set(scopes)
+    for scope in scopes:
+        key: str = f'{CACHE_VERSION_PREFIX}{scope}'
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time_ns(), timeout=None)
+    if settings.DATABASE_REPLICAS:
+        cache.set_many(
+            {f'{CACHE_CHANGED_PREFIX}{scope}': True for scope in scopes},
+            timeout=settings.REPLICA_PIN_SECONDS
+        )
+
+
+def recently_changed(scopes: list[str]) -> bool:
+    """Проверяет, менялись ли области за последние 'REPLICA_PIN_SECONDS'."""
+    return bool(cache.get_many(
+        [f'{CACHE_CHANGED_PREFIX}{scope}' for scope in scopes]
+    ))
+
+
+def response_cache_key(
+    request: Request, scopes: list[str], vary: Iterable[str] = ()
+) -> str:
+    """
+    Возвращает ключ ответа по адресу запроса, значениям 'vary',
+    от которых еще зависит ответ, и версиям его областей.
+    """
+    versions: str = '.'.join(map(str, get_versions(scopes)))
+    url: str = md5(
+        '\n'.join([request.build_absolute_uri(), *vary]).encode(),
+        usedforsecurity=False
+    ).hexdigest()
+    return f'{CACHE_RESPONSE_PREFIX}{url}:{versions}'
+
+
+def get_cached_data(key: str) -> Any | None:
+    """Возвращает закэшированные данные ответа и учитывает попадание."""
+    data: Any | None = cache.get(key)
+    count_key: str = CACHE_HITS_KEY if data is not None else CACHE_MISSES_KEY
+    try:
+        cache.incr(count_key)
+    except ValueError:
+        cache.add(count_key, 1, timeout=None)
+    return data
+
+
+def set_cached_data(key: str, data: Any) -> None:
+    """Сохраняет данные ответа в кэш."""
+    cache.set(key, data, timeout=settings.CATALOG_CACHE_TIMEOUT)
+
+
+def get_cache_stats() -> dict[str, int | float]:
+    """Возвращает количество попаданий и промахов кэша ответов."""
+    counters: dict[str, int] = cache.get_many(
+        [CACHE_HITS_KEY, CACHE_MISSES_KEY]
+    )
+    hits: int = counters.get(CACHE_HITS_KEY, 0)
+    misses: int = counters.get(CACHE_MISSES_KEY, 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else 0,
+    }
+
+
+class SlugCache:
+    """
+    Соответствие слагов первичным ключам объектов каталога.
+    Ключи хранятся в LRU процесса размером 'maxsize' поверх общего
+    кэша Django, поэтому найденный одним воркером ключ доступен всем.
+    Кэш может устареть в других процессах, поэтому объект по ключу
+    ищется вместе со слагом, см. 'get_by_slug'.
+    """
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self.lock = Lock()
+
+    @staticmethod
+    def cache_key(model: type[Model], slug: str) -> str:
+        """Возвращает ключ общего кэша для слага модели."""
+        digest: str = md5(slug.encode(), usedforsecurity=False).hexdigest()
+        return f'{CACHE_SLUG_PREFIX}{model._meta.label_lower}:{digest}'
+
+    def get(self, model: type[Model], slug: str) -> Any | None:
+        """Возвращает первичный ключ объекта со слагом или 'None'."""
+        entry: tuple[str, str] = (model._meta.label_lower, slug)
+        with self.lock:
+            if entry in self.entries:
+                self.entries.move_to_end(entry)
+                return self.entries[entry]
+        pk: Any | None = cache.get(self.cache_key(model, slug))
+        if pk is not None:
+            self.remember(entry, pk)
+        return pk
+
+    def set(self, model: type[Model], slug: str, pk: Any) -> None:
+        """Запоминает первичный ключ объекта со слагом."""
+        self.remember((model._meta.label_lower, slug), pk)
+        cache.set(
+            self.cache_key(model, slug), pk,
+            timeout=settings.SLUG_CACHE_TIMEOUT
+        )
+
+    def remember(self, entry: tuple[str, str], pk: Any) -> None:
+        """Сохраняет ключ в LRU процесса, вытесняя самый старый."""
+        with self.lock:
+            self.entries[entry] = pk
+            self.entries.move_to_end(entry)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, model: type[Model], slugs: Iterable[str]) -> None:
+        """Забывает слаги модели в процессе и в общем кэше."""
+        slugs = set(slugs)
+        if not slugs:
+            return
+        with self.lock:
+            for slug in slugs:
+                self.entries.pop((model._meta.label_lower, slug), None)
+        cache.delete_many([self.cache_key(model, slug) for slug in slugs])
+
+    def clear(self) -> None:
+        """Очищает LRU процесса."""
+        with self.lock:
+            self.entries.clear()
+
+
+slug_cache = SlugCache(settings.SLUG_CACHE_SIZE)
+
+
+def get_by_slug(queryset: QuerySet, slug: str, **filters: Any) -> Model:
+    """
+    Возвращает объект 'queryset' со слагом 'slug' и условиями 'filters'.
+    Если первичный ключ слага закэширован, объект ищется по нему:
+    слаг остается в условии, поэтому устаревший ключ только приводит
+    к повторному поиску по слагу. Вызывает 'Http404', если объекта нет.
+    """
+    model: type[Model] = queryset.model
+    pk: Any | None = slug_cache.get(model, slug)
+    if pk is not None:
+        try:
+            return queryset.get(pk=pk, slug=slug, **filters)
+        except model.DoesNotExist:
+            pass
+    try:
+        instance: Model = queryset.get(slug=slug, **filters)
+    except model.DoesNotExist:
+        raise Http404
+    slug_cache.set(model, slug, instance.pk)
+    return instance
@@ -0,0 +1,21 @@
+from django.db.models import QuerySet
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.views import View
+
+from music.search import search_catalog
+
+
+class CatalogSearchFilter(SearchFilter):
+    """
+    Поиск по названию через индексированный поисковый бэкенд.
+    Сохраняет параметр '?search=' и формат 'SearchFilter'.
+    """
+    def filter_queryset(
+        self, request: Request, queryset: QuerySet, view: View
+    ) -> QuerySet:
+        """Фильтрует и ранжирует записи по словам поискового запроса."""
+        terms: list[str] = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return search_catalog(queryset, terms)
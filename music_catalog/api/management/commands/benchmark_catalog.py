@@ -0,0 +1,173 @@
+import json
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import (
+    BaseCommand, CommandError, CommandParser
+)
+from django.db import connection
+from django.test.utils import (
+    override_settings, setup_test_environment, teardown_test_environment
+)
+
+from api.benchmark import (
+    SCENARIOS, SERIALIZER_BENCHMARKS, CatalogScale, check_budgets,
+    run_scenario, run_serializer_benchmark, seed_catalog
+)
+
+BENCHMARK_CACHES: dict[str, dict[str, Any]] = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'benchmark',
+    },
+}
+
+# Сценарий входа повторяет запрос с одного адреса под одним именем.
+BENCHMARK_THROTTLE_RATES: dict[str, str | None] = {
+    'login': None,
+    'login_username': None,
+}
+
+
+class Command(BaseCommand):
+    """Команда для измерения SQL-запросов и задержек эндпоинтов каталога."""
+    help = (
+        'Создает тестовую базу данных с синтетическим каталогом, '
+        'выполняет запросы к эндпоинтам через тестовый клиент и '
+        'сохраняет количество SQL-запросов, p50/p95 и пропускную '
+        'способность в JSON. Завершается ошибкой при превышении бюджетов.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--musicians', type=int, default=100,
+            help='Количество исполнителей.'
+        )
+        parser.add_argument(
+            '--albums', type=int, default=10,
+            help='Количество альбомов у каждого исполнителя.'
+        )
+        parser.add_argument(
+            '--songs', type=int, default=10,
+            help='Количество песен в каждом альбоме.'
+        )
+        parser.add_argument(
+            '--requests', type=int, default=30,
+            help='Количество запросов в каждом сценарии.'
+        )
+        parser.add_argument(
+            '--scenario', action='append', dest='scenarios',
+            choices=[scenario.name for scenario in SCENARIOS],
+            help='Выполнить только указанные сценарии.'
+        )
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help='Не очищать кэш ответов перед запросами.'
+        )
+        parser.add_argument(
+            '--explain', action='store_true',
+            help=(
+                'Сохранить планы выполнения SQL-запросов и считать '
+                'нарушением просмотр таблицы без индекса.'
+            )
+        )
+        parser.add_argument(
+            '--serializer-rows', type=int, default=0,
+            help=(
+                'Сравнить скорость текущих и быстрых сериализаторов '
+                'списков на указанном количестве строк.'
+            )
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0,
+            help='Начальное значение генератора случайных адресов.'
+        )
+        parser.add_argument(
+            '--budgets',
+            help=(
+                'JSON-файл бюджетов сценариев: '
+                '{"<сценарий>": {"queries": 3, "p95_ms": 50}}.'
+            )
+        )
+        parser.add_argument('--output', help='Путь к файлу результатов.')
+        parser.add_argument(
+            '--keepdb', action='store_true',
+            help='Не удалять тестовую базу данных после измерений.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Измеряет сценарии на тестовой базе данных и проверяет бюджеты."""
+        try:
+            scale = CatalogScale(
+                options['musicians'], options['albums'], options['songs']
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        budgets: dict[str, dict[str, float]] = {}
+        if options['budgets']:
+            budgets = json.loads(Path(options['budgets']).read_text())
+        setup_test_environment()
+        old_name: str = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options['keepdb']
+        )
+        try:
+            with override_settings(
+                CACHES=BENCHMARK_CACHES,
+                REST_FRAMEWORK={
+                    **settings.REST_FRAMEWORK,
+                    'DEFAULT_THROTTLE_RATES': BENCHMARK_THROTTLE_RATES,
+                }
+            ):
+                report: dict[str, Any] = self.run(scale, options)
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options['keepdb']
+            )
+            teardown_test_environment()
+        report['violations'] = check_budgets(report['scenarios'], budgets)
+        output: str = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            Path(options['output']).write_text(output, encoding='utf-8')
+        else:
+            self.stdout.write(output)
+        if report['violations']:
+            raise CommandError(
+                'Превышены бюджеты:\n' + '\n'.join(report['violations'])
+            )
+
+    def run(
+        self, scale: CatalogScale, options: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Заполняет каталог и выполняет сценарии."""
+        started: float = perf_counter()
+        seed_catalog(scale)
+        report: dict[str, Any] = {
+            'scale': scale.as_dict(),
+            'database': connection.vendor,
+            'requests': options['requests'],
+            'warm_cache': options['warm_cache'],
+            'seed_seconds': round(perf_counter() - started, 3),
+            'scenarios': {},
+        }
+        rng = Random(options['seed'])
+        for scenario in SCENARIOS:
+            if options['scenarios'] and (
+                scenario.name not in options['scenarios']
+            ):
+                continue
+            self.stderr.write(f'{scenario.name}...')
+            report['scenarios'][scenario.name] = run_scenario(
+                scenario, scale, options['requests'], rng,
+                warm_cache=options['warm_cache'], plans=options['explain']
+            ).as_dict()
+        if options['serializer_rows'] > 0:
+            report['serializers'] = {
+                benchmark.name: run_serializer_benchmark(
+                    benchmark, options['serializer_rows']
+                )
+                for benchmark in SERIALIZER_BENCHMARKS
+            }
+        return report
@@ -0,0 +1,108 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from pathlib import Path
+from random import Random
+from threading import local
+from time import perf_counter
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.core.management.base import (
+    BaseCommand, CommandError, CommandParser
+)
+
+from api.benchmark import SCENARIOS, CatalogScale, ScenarioResult
+
+READ_SCENARIOS: tuple[str, ...] = tuple(
+    scenario.name for scenario in SCENARIOS if scenario.method == 'get'
+)
+
+
+class Command(BaseCommand):
+    """Команда для нагрузочного тестирования запущенного сервера."""
+    help = (
+        'Выполняет параллельные GET-запросы сценариев benchmark_catalog '
+        'к запущенному серверу и выводит p50/p95 и пропускную способность '
+        'в JSON. Каталог сервера заполняется командой seed_catalog '
+        'с тем же размером.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('url', help='Адрес сервера.')
+        parser.add_argument(
+            '--concurrency', type=int, default=16,
+            help='Количество параллельных соединений.'
+        )
+        parser.add_argument(
+            '--requests', type=int, default=500,
+            help='Количество запросов в каждом сценарии.'
+        )
+        parser.add_argument(
+            '--scenario', action='append', dest='scenarios',
+            choices=READ_SCENARIOS,
+            help='Выполнить только указанные сценарии.'
+        )
+        parser.add_argument('--musicians', type=int, default=100)
+        parser.add_argument('--albums', type=int, default=10)
+        parser.add_argument('--songs', type=int, default=10)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Путь к файлу результатов.')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Выполняет сценарии и выводит результаты."""
+        url = urlsplit(options['url'])
+        if url.scheme != 'http' or not url.hostname:
+            raise CommandError('Ожидается адрес вида http://host:port.')
+        try:
+            scale = CatalogScale(
+                options['musicians'], options['albums'], options['songs']
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        rng = Random(options['seed'])
+        threads = local()
+
+        def fetch(path: str) -> tuple[int, float]:
+            """Выполняет запрос в постоянном соединении потока."""
+            if not hasattr(threads, 'connection'):
+                threads.connection = HTTPConnection(
+                    url.hostname, url.port or 80, timeout=30
+                )
+            started: float = perf_counter()
+            threads.connection.request('GET', path)
+            response = threads.connection.getresponse()
+            response.read()
+            return response.status, perf_counter() - started
+
+        report: dict[str, Any] = {
+            'url': options['url'],
+            'concurrency': options['concurrency'],
+            'scenarios': {},
+        }
+        with ThreadPoolExecutor(options['concurrency']) as executor:
+            for scenario in SCENARIOS:
+                if scenario.name not in (
+                    options['scenarios'] or READ_SCENARIOS
+                ):
+                    continue
+                result = ScenarioResult(scenario.name, scenario.max_queries)
+                paths: list[str] = [
+                    scenario.url(rng, scale)
+                    for _ in range(options['requests'])
+                ]
+                started: float = perf_counter()
+                for code, seconds in executor.map(fetch, paths):
+                    result.statuses[code] = result.statuses.get(code, 0) + 1
+                    result.latencies.append(seconds)
+                elapsed: float = perf_counter() - started
+                stats: dict[str, Any] = result.as_dict()
+                stats['requests_per_second'] = round(
+                    len(paths) / elapsed, 1
+                )
+                report['scenarios'][scenario.name] = stats
+        output: str = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            Path(options['output']).write_text(output, encoding='utf-8')
+        else:
+            self.stdout.write(output)
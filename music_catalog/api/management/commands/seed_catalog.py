@@ -0,0 +1,45 @@
+from typing import Any
+
+from django.core.management.base import (
+    BaseCommand, CommandError, CommandParser
+)
+
+from api.benchmark import CatalogScale, seed_catalog
+from music.models import Musician
+
+
+class Command(BaseCommand):
+    """Команда для заполнения пустой базы синтетическим каталогом."""
+    help = (
+        'Заполняет пустую базу данных синтетическим каталогом того же вида, '
+        'что и benchmark_catalog, для нагрузочного тестирования сервера.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--musicians', type=int, default=100,
+            help='Количество исполнителей.'
+        )
+        parser.add_argument(
+            '--albums', type=int, default=10,
+            help='Количество альбомов у каждого исполнителя.'
+        )
+        parser.add_argument(
+            '--songs', type=int, default=10,
+            help='Количество песен в каждом альбоме.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Заполняет каталог, если в базе еще нет исполнителей."""
+        if Musician.objects.exists():
+            raise CommandError('Каталог не пуст.')
+        try:
+            scale = CatalogScale(
+                options['musicians'], options['albums'], options['songs']
+            )
+        except ValueError as error:
+            raise CommandError(error)
+        seed_catalog(scale)
+        self.stdout.write(self.style.SUCCESS(
+            f'Каталог заполнен: {scale.as_dict()}.'
+        ))
@@ -1,7 +1,37 @@
-from rest_framework.filters import SearchFilter
-from rest_framework.permissions import IsAdminUser
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from hashlib import md5
+from time import perf_counter
+from typing import Any, Callable, Iterable
 
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Model, QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS, IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, Serializer
+from rest_framework.validators import UniqueValidator
+
+from .cache import (
+    MUSICIANS_SCOPE, get_by_slug, get_cached_data, recently_changed,
+    response_cache_key, set_cached_data
+)
+from .filters import CatalogSearchFilter
 from .permissions import IsSafeMethod
+from .profiling import RequestProfile, current_profile
+from constants import (
+    BULK_CHUNK_SIZE, BULK_MAX_ITEMS, BULK_SCHEMA, EXPAND_QUERY_PARAM
+)
+from core.routers import replica_reads, replica_reads_enabled
+from music.importer import chunked
+from music.models import Album, Musician
 
 
 class LookUpSlugFieldMixin:
@@ -18,5 +48,550 @@ class LookUpSlugFieldMixin:
 class PermissionFilterSearchMixin:
     """Добавляет общие настройки для view."""
     permission_classes = [IsSafeMethod | IsAdminUser]
-    filter_backends = [SearchFilter]
+    filter_backends = [CatalogSearchFilter]
     search_fields = ['name']
+
+
+class NestedParentMixin:
+    """
+    Получает родительские объекты вложенного адреса по слагам
+    из параметров 'parent_url_kwargs': исполнителя из 'musician'
+    и альбом из 'album'. Цепочка исполнитель - альбом выбирается
+    одним запросом с соединением, поэтому альбом другого исполнителя
+    не найден. Объекты запрашиваются один раз за запрос
+    и кэшируются в представлении, а по слагам с закэшированными
+    первичными ключами ищутся по первичному ключу.
+    """
+    parent_url_kwargs: tuple[str, ...] = ('musician',)
+
+    def get_album(self) -> Album:
+        """Возвращает альбом из адреса вместе с его исполнителем."""
+        if not hasattr(self, '_album'):
+            self._album = get_by_slug(
+                Album.objects.select_related('musician'), self.kwargs['album'],
+                musician__slug=self.kwargs['musician']
+            )
+            self._musician = self._album.musician
+        return self._album
+
+    def get_musician(self) -> Musician:
+        """
+        Возвращает исполнителя из адреса. Если в адресе есть альбом,
+        исполнитель выбирается вместе с ним.
+        """
+        if not hasattr(self, '_musician'):
+            if 'album' in self.parent_url_kwargs:
+                return self.get_album().musician
+            self._musician = get_by_slug(
+                Musician.objects.all(), self.kwargs['musician']
+            )
+        return self._musician
+
+
+class SlugLookupMixin:
+    """
+    Находит объект по слагу из адреса через кэш первичных ключей
+    слагов вместо поиска по индексу слага.
+    """
+    def get_object(self) -> Model:
+        """Возвращает объект адреса и проверяет права на него."""
+        instance: Model = get_by_slug(
+            self.filter_queryset(self.get_queryset()),
+            self.kwargs[self.lookup_url_kwarg]
+        )
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+
+class ProfilingMixin:
+    """
+    Добавляет в профиль запроса 'ProfilingMiddleware' время
+    аутентификации ('auth') и действия представления без SQL-запросов
+    ('handler'): сериализации и подготовки данных ответа. Профиль есть
+    только при включенной настройке 'CATALOG_PROFILING'.
+    """
+    def perform_authentication(self, request: Request) -> None:
+        """Аутентифицирует запрос, учитывая время в разделе 'auth'."""
+        profile: RequestProfile | None = current_profile.get()
+        if profile is None:
+            return super().perform_authentication(request)
+        with profile.section('auth'):
+            super().perform_authentication(request)
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        """Запоминает начало действия и время SQL-запросов до него."""
+        super().initial(request, *args, **kwargs)
+        profile: RequestProfile | None = current_profile.get()
+        if profile is not None:
+            self._handler_started = (perf_counter(), profile.db_seconds)
+
+    def finalize_response(
+        self, request: Request, response: HttpResponse,
+        *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """Учитывает время действия без SQL-запросов в разделе 'handler'."""
+        profile: RequestProfile | None = current_profile.get()
+        if profile is not None and hasattr(self, '_handler_started'):
+            started, db_seconds = self._handler_started
+            profile.add('handler', perf_counter() - started - (
+                profile.db_seconds - db_seconds
+            ))
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class ReplicaReadMixin:
+    """
+    Читает данные безопасных запросов с реплик.
+    После успешного изменяющего запроса клиент получает cookie,
+    с которой его запросы 'REPLICA_PIN_SECONDS' секунд читают
+    основную базу и видят свои изменения. Заголовок 'X-Use-Primary: 1'
+    закрепляет за основной базой отдельный запрос.
+    """
+    primary_cookie = 'use_primary'
+
+    def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """Выполняет запрос с чтением с реплик или с основной базы."""
+        if request.method not in SAFE_METHODS:
+            response: HttpResponse = super().dispatch(
+                request, *args, **kwargs
+            )
+            if response.status_code < status.HTTP_400_BAD_REQUEST:
+                response.set_cookie(
+                    self.primary_cookie, '1', httponly=True,
+                    max_age=settings.REPLICA_PIN_SECONDS
+                )
+            return response
+        if (
+            not settings.DATABASE_REPLICAS
+            or request.headers.get('X-Use-Primary') == '1'
+            or self.primary_cookie in request.COOKIES
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        with replica_reads():
+            return super().dispatch(request, *args, **kwargs)
+
+
+class ExpandMixin:
+    """
+    Разворачивает вложенные объекты в ответе 'retrieve' по параметру
+    'expand', например '?expand=songs'. Допустимые значения и
+    сериализаторы для них задаются в 'expand_serializers',
+    а предзагрузку вложенных объектов выполняет 'get_queryset'.
+    """
+    expand_serializers: dict[str, type[Serializer]] = {}
+
+    def get_expand(self) -> str | None:
+        """Возвращает запрошенное вложение для 'retrieve'."""
+        if self.action != 'retrieve' or self.request is None:
+            return None
+        expand: str | None = self.request.query_params.get(EXPAND_QUERY_PARAM)
+        if expand is not None and expand not in self.expand_serializers:
+            raise ValidationError({EXPAND_QUERY_PARAM: (
+                'Допустимые значения: '
+                f'{", ".join(self.expand_serializers)}.'
+            )})
+        return expand
+
+    def get_serializer_class(self) -> type[Serializer]:
+        """Возвращает сериализатор запрошенного вложения."""
+        expand: str | None = self.get_expand()
+        if expand is None:
+            return super().get_serializer_class()
+        return self.expand_serializers[expand]
+
+
+class CachedResponseMixin:
+    """
+    Кэширует данные ответов 'list' и 'retrieve'.
+    Ключ ответа включает версии областей из 'get_cache_scopes',
+    которые увеличиваются при изменении каталога.
+    """
+    def get_cache_scopes(self) -> list[str]:
+        """Возвращает области кэша, от которых зависит ответ."""
+        return [MUSICIANS_SCOPE]
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Возвращает список объектов из кэша или формирует его."""
+        return self.get_cached_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Возвращает объект из кэша или формирует его."""
+        return self.get_cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_cached_response(
+        self, action: Callable[..., Response],
+        request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """
+        Возвращает закэшированный ответ или кэширует ответ 'action'.
+        Ответ, прочитанный с реплики вскоре после изменения областей,
+        не кэшируется, так как реплика могла еще не получить изменения.
+        """
+        scopes: list[str] = self.get_cache_scopes()
+        key: str = response_cache_key(request, scopes)
+        data: Any | None = get_cached_data(key)
+        if data is not None:
+            return Response(data, headers={'X-Cache': 'HIT'})
+        response: Response = action(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and not (
+            replica_reads_enabled.get() and recently_changed(scopes)
+        ):
+            set_cached_data(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+
+class ConditionalGetMixin:
+    """
+    Отвечает '304 Not Modified' на 'If-None-Match' для 'list'
+    и 'retrieve' и на 'If-Modified-Since' для 'retrieve'.
+    Валидаторы вычисляются одним агрегирующим запросом по датам
+    изменения из 'conditional_fields' без сериализации.
+    """
+    conditional_fields: tuple[str, ...] = ('modified',)
+    conditional_lookup: str | None = None
+
+    def get_conditional_queryset(self) -> QuerySet:
+        """Возвращает записи, от изменения которых зависит ответ."""
+        return self.get_queryset()
+
+    def get_conditional_fields(self) -> tuple[str, ...]:
+        """Возвращает даты изменения, от которых зависит ответ."""
+        return self.conditional_fields
+
+    def get_validators(
+        self, request: Request
+    ) -> tuple[str, int | None] | None:
+        """
+        Возвращает ETag и Last-Modified ответа.
+        Для списка учитывается количество записей, чтобы удаление
+        тоже меняло ETag. Last-Modified для списка не возвращается:
+        удаление записи не меняет максимальную дату изменения, и ответ
+        на 'If-Modified-Since' оставил бы у клиента удаленную запись.
+        Если записей нет, валидаторы не вычисляются.
+        Для объекта даты берутся по максимуму, поэтому поля
+        могут проходить через связи 'многие'.
+        """
+        queryset: QuerySet = self.get_conditional_queryset().order_by()
+        if self.action == 'retrieve':
+            queryset = queryset.filter(**{
+                self.conditional_lookup or self.lookup_field:
+                self.kwargs[self.lookup_url_kwarg]
+            })
+        aggregate: dict[str, Any] = queryset.aggregate(
+            count=Count('pk'), **{
+                f'modified_{index}': Max(field)
+                for index, field in enumerate(self.get_conditional_fields())
+            }
+        )
+        count: int = aggregate.pop('count')
+        if not count:
+            return None
+        if self.action == 'retrieve':
+            count = 1
+        modified: list[datetime] = [
+            value for value in aggregate.values() if value is not None
+        ]
+        etag: str = md5(json.dumps([
+            request.get_full_path(), request.accepted_media_type,
+            count, [value.isoformat() for value in modified]
+        ]).encode(), usedforsecurity=False).hexdigest()
+        if self.action != 'retrieve':
+            return quote_etag(etag), None
+        return quote_etag(etag), int(max(modified).timestamp())
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Возвращает список объектов, если он изменился."""
+        return self.get_conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Возвращает объект, если он изменился."""
+        return self.get_conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+    def get_conditional_response(
+        self, action: Callable[..., Response],
+        request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Возвращает '304 Not Modified' или ответ 'action' с валидаторами."""
+        validators: tuple[str, int | None] | None = self.get_validators(
+            request
+        )
+        if validators is None:
+            return action(request, *args, **kwargs)
+        etag, last_modified = validators
+        response: Response | None = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = action(request, *args, **kwargs)
+        if response.status_code in (
+            status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+        ):
+            response.headers.setdefault('ETag', etag)
+            if last_modified is not None:
+                response.headers.setdefault(
+                    'Last-Modified', http_date(last_modified)
+                )
+        return response
+
+
+class ValuesListMixin:
+    """
+    Формирует ответ 'list' из строк 'QuerySet.values()' сериализатором
+    'values_serializer_class' без создания объектов моделей и полей DRF.
+    Кроме полей сериализатора выбираются поля сортировки пагинации
+    по ключу. Схема API строится по 'serializer_class'.
+    """
+    values_serializer_class: type[BaseSerializer] | None = None
+
+    def get_values_fields(self, queryset: QuerySet) -> list[str]:
+        """Возвращает поля строк для сериализатора и курсора страницы."""
+        fields: list[str] = list(
+            self.values_serializer_class.values_fields.values()
+        )
+        get_ordering: Callable[..., tuple[str, ...]] | None = getattr(
+            self.paginator, 'get_keyset_ordering', None
+        )
+        if get_ordering is not None:
+            fields += [
+                field.lstrip('-') for field in get_ordering(queryset, self)
+            ]
+        return list(dict.fromkeys(fields))
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Возвращает страницу списка, построенную из строк запроса."""
+        if self.values_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*self.get_values_fields(queryset))
+        page: list[dict[str, Any]] | None = self.paginate_queryset(queryset)
+        data: list[dict[str, Any]] = self.values_serializer_class(
+            queryset if page is None else page, many=True
+        ).data
+        if page is None:
+            return Response(data)
+        return self.get_paginated_response(data)
+
+
+@dataclass
+class BulkReport:
+    """Итоги массовой операции с ошибками объектов по их индексам."""
+    action: str
+    count: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def add_error(self, index: int, errors: Any) -> None:
+        """Учитывает ошибки объекта с индексом 'index'."""
+        self.errors.append({'index': index, 'errors': errors})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Возвращает количество обработанных объектов и ошибки по порядку."""
+        return {
+            self.action: self.count,
+            'error_count': len(self.errors),
+            'errors': sorted(self.errors, key=lambda error: error['index']),
+        }
+
+
+class BulkMixin:
+    """
+    Массовые операции со списком в теле запроса: POST на адрес списка
+    создает объекты, PATCH изменяет найденные по слагу, DELETE удаляет
+    объекты по списку слагов. Объекты проверяются сериализатором
+    без запросов к базе данных, а уникальность слагов - одним запросом
+    на часть из 'BULK_CHUNK_SIZE' объектов. Каждая часть записывается
+    в своей транзакции методами 'perform_bulk_create',
+    'perform_bulk_update' и 'perform_bulk_destroy'. По умолчанию они
+    сохраняют и удаляют объекты по одному с сигналами моделей,
+    представления переопределяют их для записи одним запросом.
+    Ошибки объектов возвращаются с их индексами
+    и не прерывают обработку остальных.
+    """
+    def perform_bulk_create(self, items: list[dict[str, Any]]) -> int:
+        """Создает объекты и возвращает их количество."""
+        model: type[Model] = self.get_queryset().model
+        for item in items:
+            model.objects.create(**item)
+        return len(items)
+
+    def perform_bulk_update(
+        self, objects: list[Model], fields: set[str]
+    ) -> int:
+        """Сохраняет измененные объекты и возвращает их количество."""
+        for instance in objects:
+            instance.save()
+        return len(objects)
+
+    def perform_bulk_destroy(self, queryset: QuerySet) -> int:
+        """Удаляет объекты и возвращает их количество."""
+        _, deleted = queryset.delete()
+        return deleted.get(queryset.model._meta.label, 0)
+
+    def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Со списком в теле запроса создает объекты массово."""
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
+        return super().create(request, *args, **kwargs)
+
+    def get_bulk_items(self, request: Request) -> list[Any]:
+        """Возвращает список объектов из тела запроса."""
+        if not isinstance(request.data, list):
+            raise ValidationError('Ожидается список объектов.')
+        if len(request.data) > BULK_MAX_ITEMS:
+            raise ValidationError(
+                f'Список должен содержать не больше {BULK_MAX_ITEMS} объектов.'
+            )
+        return request.data
+
+    def validate_bulk_items(
+        self, items: Iterable[tuple[int, Any]],
+        report: BulkReport, partial: bool = False
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Проверяет объекты одним экземпляром сериализатора.
+        Уникальность слага проверяется позже для всей части сразу.
+        """
+        serializer: Serializer = self.get_serializer(partial=partial)
+        slug = serializer.fields['slug']
+        slug.validators = [
+            validator for validator in slug.validators
+            if not isinstance(validator, UniqueValidator)
+        ]
+        valid: list[tuple[int, dict[str, Any]]] = []
+        for index, item in items:
+            try:
+                valid.append((index, serializer.run_validation(item)))
+            except ValidationError as error:
+                report.add_error(index, error.detail)
+        return valid
+
+    def write_bulk_chunk(
+        self, report: BulkReport, indexes: list[int],
+        write: Callable[[], int]
+    ) -> None:
+        """
+        Выполняет запись части в транзакции. Если параллельный запрос
+        занял слаг, ошибка записывается для всех объектов части.
+        """
+        if not indexes:
+            return
+        try:
+            with transaction.atomic():
+                report.count += write()
+        except IntegrityError:
+            for index in indexes:
+                report.add_error(index, [
+                    'Объекты части изменены параллельным запросом.'
+                ])
+
+    def bulk_create(self, request: Request) -> Response:
+        """Создает объекты из списка."""
+        report = BulkReport('created')
+        model: type[Model] = self.get_queryset().model
+        seen: set[str] = set()
+        for chunk in chunked(
+            enumerate(self.get_bulk_items(request)), BULK_CHUNK_SIZE
+        ):
+            valid = self.validate_bulk_items(chunk, report)
+            taken: set[str] = set(model.objects.filter(
+                slug__in=[data['slug'] for _, data in valid]
+            ).values_list('slug', flat=True)) | seen
+            items: list[tuple[int, dict[str, Any]]] = []
+            for index, data in valid:
+                if data['slug'] in taken:
+                    report.add_error(index, {
+                        'slug': ['Объект с таким слагом уже существует.']
+                    })
+                    continue
+                taken.add(data['slug'])
+                items.append((index, data))
+            seen |= taken
+            self.write_bulk_chunk(
+                report, [index for index, _ in items],
+                lambda: self.perform_bulk_create(
+                    [data for _, data in items]
+                )
+            )
+        return Response(report.as_dict())
+
+    @BULK_SCHEMA['bulk_update']
+    def bulk_update(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Изменяет объекты, найденные по слагу."""
+        report = BulkReport('updated')
+        seen: set[str] = set()
+        for chunk in chunked(
+            enumerate(self.get_bulk_items(request)), BULK_CHUNK_SIZE
+        ):
+            valid = self.validate_bulk_items(chunk, report, partial=True)
+            found: dict[str, Model] = self.get_queryset().in_bulk(
+                [data['slug'] for _, data in valid if 'slug' in data],
+                field_name='slug'
+            )
+            objects: list[tuple[int, Model]] = []
+            fields: set[str] = set()
+            for index, data in valid:
+                slug: str | None = data.pop('slug', None)
+                if slug not in found or slug in seen:
+                    report.add_error(index, {'slug': [
+                        'Обязательное поле.' if slug is None else
+                        'Объект не найден или повторяется в списке.'
+                    ]})
+                    continue
+                seen.add(slug)
+                for name, value in data.items():
+                    setattr(found[slug], name, value)
+                fields |= data.keys()
+                objects.append((index, found[slug]))
+            self.write_bulk_chunk(
+                report, [index for index, _ in objects],
+                lambda: self.perform_bulk_update(
+                    [instance for _, instance in objects], fields
+                )
+            )
+        return Response(report.as_dict())
+
+    @BULK_SCHEMA['bulk_destroy']
+    def bulk_destroy(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Удаляет объекты по списку слагов."""
+        report = BulkReport('deleted')
+        for chunk in chunked(
+            enumerate(self.get_bulk_items(request)), BULK_CHUNK_SIZE
+        ):
+            slugs: dict[str, int] = {}
+            for index, slug in chunk:
+                if not isinstance(slug, str) or slug in slugs:
+                    report.add_error(
+                        index, ['Ожидается неповторяющийся слаг.']
+                    )
+                    continue
+                slugs[slug] = index
+            found: set[str] = set(self.get_queryset().filter(
+                slug__in=slugs
+            ).values_list('slug', flat=True))
+            for slug in slugs.keys() - found:
+                report.add_error(slugs[slug], ['Объект не найден.'])
+            self.write_bulk_chunk(
+                report, [slugs[slug] for slug in found],
+                lambda: self.perform_bulk_destroy(
+                    self.get_queryset().filter(slug__in=found)
+                )
+            )
+        return Response(report.as_dict())
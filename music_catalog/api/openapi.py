@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from hashlib import md5
+from inspect import cleandoc
+from typing import Any
+
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import (
+    get_conditional_response, patch_vary_headers, quote_etag
+)
+from django.utils.text import compress_string
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
+
+from .cache import (
+    SCHEMA_SCOPE, get_cached_data, response_cache_key, set_cached_data
+)
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Проверяет, принимает ли клиент gzip, по заголовку 'Accept-Encoding'
+    с учетом q-значений: 'gzip;q=0' запрещает сжатие, а '*' задает
+    значение для кодировок, не указанных явно.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        quality: float = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
+
+@dataclass
+class RenderedSchema:
+    """Отрендеренная схема OpenAPI с заголовками и сжатой копией."""
+    content: bytes
+    compressed: bytes
+    content_type: str
+    filename: str
+
+    @classmethod
+    def render(
+        cls, data: dict[str, Any], renderer: BaseRenderer,
+        media_type: str, filename: str
+    ) -> 'RenderedSchema':
+        """Рендерит схему и сжимает ее gzip."""
+        content: bytes = renderer.render(data, media_type)
+        return cls(
+            content, compress_string(content),
+            renderer.media_type if renderer.charset is None
+            else f'{renderer.media_type}; charset={renderer.charset}',
+            filename
+        )
+
+    def get_response(self, request: Request) -> HttpResponse:
+        """
+        Возвращает схему или '304 Not Modified' по 'If-None-Match'.
+        Клиенту, принимающему gzip, отдается сжатая копия
+        со своим ETag.
+        """
+        gzip: bool = accepts_gzip(request.headers.get('Accept-Encoding', ''))
+        content: bytes = self.compressed if gzip else self.content
+        etag: str = quote_etag(
+            md5(content, usedforsecurity=False).hexdigest()
+        )
+        response: HttpResponse | None = get_conditional_response(
+            request, etag=etag
+        )
+        if response is None:
+            response = HttpResponse(content, content_type=self.content_type)
+            response['Content-Disposition'] = (
+                f'inline; filename="{self.filename}"'
+            )
+            if gzip:
+                response['Content-Encoding'] = 'gzip'
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept', 'Accept-Encoding'))
+        return response
+
+
+# Описание эндпоинта в схеме остается описанием drf-spectacular.
+@extend_schema_view(
+    get=extend_schema(description=cleandoc(SpectacularAPIView.__doc__))
+)
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    Схема OpenAPI, которая хранится в кэше ответов каталога
+    отрендеренной для каждого формата, версии и языка
+    'CATALOG_CACHE_TIMEOUT' секунд, как и другие ответы.
+    Схема зависит только от кода, поэтому ее область кэша 'schema'
+    меняется только после миграций, то есть при обновлении.
+    Для непубличной схемы, зависящей от прав пользователя,
+    кэш не используется.
+    """
+
+    def _get_schema_response(self, request: Request) -> HttpResponse:
+        """Возвращает схему из кэша или генерирует ее."""
+        if not self.serve_public:
+            return super()._get_schema_response(request)
+        version: str | None = (
+            self.api_version or request.version
+            or self._get_version_parameter(request)
+        )
+        key: str = response_cache_key(request, [SCHEMA_SCOPE], [
+            request.accepted_renderer.format, request.accepted_media_type,
+            str(version), translation.get_language() or ''
+        ])
+        schema: RenderedSchema | None = get_cached_data(key)
+        if schema is None:
+            schema = RenderedSchema.render(
+                super()._get_schema_response(request).data,
+                request.accepted_renderer, request.accepted_media_type,
+                self._get_filename(request, version)
+            )
+            set_cached_data(key, schema)
+        return schema.get_response(request)
@@ -0,0 +1,251 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db.models import Field, Model, Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import View
+
+from constants import CURSOR_PAGINATION_MODE
+from music.search import search_ordering
+
+
+class KeysetPagination(BasePagination):
+    """
+    Пагинация по ключу: страница выбирается условием по значениям
+    полей сортировки последней записи, а не смещением.
+    Стоимость страницы не зависит от ее номера и не требует COUNT(*).
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Неверный курсор.'
+
+    def __init__(self, page_size: int, ordering: tuple[str, ...]) -> None:
+        self.page_size = page_size
+        self.ordering = ordering
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: View | None = None
+    ) -> list[Model]:
+        """Возвращает записи страницы, следующие за позицией курсора."""
+        self.base_url: str = request.build_absolute_uri()
+        position, reverse = self.decode_cursor(request, queryset)
+        ordering: tuple[str, ...] = (
+            self.reverse_ordering() if reverse else self.ordering
+        )
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self.position_filter(ordering, position)
+            )
+        try:
+            results: list[Model] = list(queryset[:self.page_size + 1])
+        except OverflowError:
+            # SQLite не задает диапазон целых полей, и слишком большое
+            # число из курсора обнаруживается только при запросе.
+            raise NotFound(self.invalid_cursor_message)
+        self.page: list[Model] = results[:self.page_size]
+        has_more: bool = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_paginated_response(self, data: list[dict[str, Any]]) -> Response:
+        """Возвращает страницу со ссылками на соседние страницы."""
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self) -> str | None:
+        """Возвращает ссылку на следующую страницу."""
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), False)
+
+    def get_previous_link(self) -> str | None:
+        """Возвращает ссылку на предыдущую страницу."""
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_position(self.page[0]), True)
+
+    def reverse_ordering(self) -> tuple[str, ...]:
+        """Возвращает обратный порядок сортировки."""
+        return tuple(
+            field[1:] if field.startswith('-') else f'-{field}'
+            for field in self.ordering
+        )
+
+    def get_position(self, instance: Model | dict[str, Any]) -> list[Any]:
+        """
+        Возвращает значения полей сортировки записи:
+        объекта модели или строки 'QuerySet.values()'.
+        """
+        if isinstance(instance, dict):
+            return [instance[field.lstrip('-')] for field in self.ordering]
+        return [
+            getattr(instance, field.lstrip('-')) for field in self.ordering
+        ]
+
+    @staticmethod
+    def position_filter(ordering: tuple[str, ...], position: list[Any]) -> Q:
+        """
+        Строит условие для записей, следующих за позицией:
+        (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z).
+        """
+        condition = Q()
+        equal: dict[str, Any] = {}
+        for field, value in zip(ordering, position):
+            name: str = field.lstrip('-')
+            lookup: str = 'lt' if field.startswith('-') else 'gt'
+            condition |= Q(**equal, **{f'{name}__{lookup}': value})
+            equal[name] = value
+        return condition
+
+    @staticmethod
+    def get_field(queryset: QuerySet, name: str) -> Field:
+        """
+        Возвращает поле сортировки: поле аннотации запроса
+        или поле модели, в том числе через связи.
+        """
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        model: type[Model] = queryset.model
+        *relations, name = name.split(LOOKUP_SEP)
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+
+    def decode_cursor(
+        self, request: Request, queryset: QuerySet
+    ) -> tuple[list[Any] | None, bool]:
+        """
+        Разбирает курсор из параметров запроса. Значения позиции
+        проверяются и приводятся к типам полей сортировки, поэтому
+        на измененный курсор возвращается ответ 404, а не ошибка.
+        """
+        encoded: str | None = request.query_params.get(
+            self.cursor_query_param
+        )
+        if encoded is None:
+            return None, False
+        try:
+            cursor: dict[str, Any] = json.loads(
+                urlsafe_b64decode(encoded.encode('ascii'))
+            )
+            position: list[Any] = cursor['p']
+            reverse: bool = bool(cursor.get('r', False))
+            if not isinstance(position, list) or (
+                len(position) != len(self.ordering)
+            ):
+                raise ValueError(self.invalid_cursor_message)
+            position = [
+                self.get_field(queryset, field.lstrip('-')).clean(value, None)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (
+            DecodeError, KeyError, TypeError, ValueError, ValidationError
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position: list[Any], reverse: bool) -> str:
+        """Возвращает ссылку с закодированной позицией курсора."""
+        cursor: dict[str, Any] = {'p': position}
+        if reverse:
+            cursor['r'] = True
+        encoded: str = urlsafe_b64encode(
+            json.dumps(cursor, default=str, separators=(',', ':')).encode()
+        ).decode('ascii')
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded
+        )
+
+
+class CatalogPagination(PageNumberPagination):
+    """
+    Пагинация каталога. По умолчанию постраничная,
+    с параметром 'pagination=cursor' переключается на пагинацию по ключу.
+    Порядок ключа берется из 'keyset_ordering' представления,
+    а если он не задан - из 'Meta.ordering' модели с добавлением 'id'.
+    Результаты поиска сначала упорядочиваются по релевантности,
+    и ее ранг входит в курсор.
+    """
+    mode_query_param = 'pagination'
+    keyset: KeysetPagination | None = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view: View | None = None
+    ) -> list[Model] | None:
+        """Выбирает режим пагинации по параметрам запроса."""
+        if request.query_params.get(
+            self.mode_query_param
+        ) != CURSOR_PAGINATION_MODE:
+            return super().paginate_queryset(queryset, request, view)
+        self.keyset = KeysetPagination(
+            self.get_page_size(request),
+            self.get_keyset_ordering(queryset, view)
+        )
+        return self.keyset.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: list[dict[str, Any]]) -> Response:
+        """Возвращает ответ в формате выбранного режима пагинации."""
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_keyset_ordering(
+        self, queryset: QuerySet, view: View | None
+    ) -> tuple[str, ...]:
+        """
+        Возвращает поля сортировки ключа с уникальным 'id' в конце,
+        а для результатов поиска - с рангом релевантности в начале.
+        """
+        ordering: tuple[str, ...] | None = getattr(
+            view, 'keyset_ordering', None
+        )
+        if ordering is None:
+            ordering = (*queryset.model._meta.ordering, 'id')
+        return (*search_ordering(queryset), *ordering)
+
+    def get_schema_operation_parameters(
+        self, view: View
+    ) -> list[dict[str, Any]]:
+        """Добавляет в схему параметры пагинации по ключу."""
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    'Режим пагинации. Значение '
+                    f'"{CURSOR_PAGINATION_MODE}" включает пагинацию '
+                    'по ключу без подсчета общего количества записей.'
+                ),
+                'schema': {
+                    'type': 'string',
+                    'enum': [CURSOR_PAGINATION_MODE],
+                },
+            },
+            {
+                'name': KeysetPagination.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Курсор страницы в режиме пагинации по ключу.',
+                'schema': {
+                    'type': 'string',
+                },
+            },
+        ]
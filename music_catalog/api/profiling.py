@@ -0,0 +1,200 @@
+import json
+import logging
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Iterator
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+MAX_STATEMENTS = 1000
+MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class RequestProfile:
+    """Измерения одного запроса."""
+    view: str = ''
+    queries: Counter = field(default_factory=Counter)
+    db_seconds: float = 0
+    sections: dict[str, float] = field(default_factory=dict)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Учитывает 'seconds' секунд в разделе 'name'."""
+        self.sections[name] = self.sections.get(name, 0) + seconds
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Учитывает время выполнения блока в разделе 'name'."""
+        started: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - started)
+
+    def execute(
+        self, execute: Callable[..., Any], sql: str,
+        params: Any, many: bool, context: dict[str, Any]
+    ) -> Any:
+        """Обертка 'execute_wrapper', измеряющая время SQL-запросов."""
+        started: float = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += perf_counter() - started
+            self.queries[sql[:MAX_STATEMENT_LENGTH]] += 1
+
+
+current_profile: ContextVar[RequestProfile | None] = ContextVar(
+    'current_profile', default=None
+)
+
+
+class ProfileStats:
+    """Накопленная в процессе статистика представлений и SQL-запросов."""
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Очищает статистику."""
+        with self.lock:
+            self.views: dict[str, dict[str, float]] = {}
+            self.statements: Counter = Counter()
+
+    def add(self, profile: RequestProfile, seconds: float) -> None:
+        """Учитывает измерения запроса."""
+        with self.lock:
+            stats: dict[str, float] = self.views.setdefault(profile.view, {
+                'requests': 0, 'seconds': 0, 'max_seconds': 0,
+                'db_seconds': 0, 'queries': 0,
+            })
+            stats['requests'] += 1
+            stats['seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['db_seconds'] += profile.db_seconds
+            stats['queries'] += sum(profile.queries.values())
+            for sql, count in profile.queries.items():
+                if sql in self.statements or (
+                    len(self.statements) < MAX_STATEMENTS
+                ):
+                    self.statements[sql] += count
+
+    def as_dict(self, limit: int = 10) -> dict[str, Any]:
+        """Возвращает самые медленные представления и частые SQL-запросы."""
+        with self.lock:
+            views: list[dict[str, Any]] = [
+                {
+                    'view': view,
+                    'requests': int(stats['requests']),
+                    'mean_ms': round(
+                        stats['seconds'] / stats['requests'] * 1000, 3
+                    ),
+                    'max_ms': round(stats['max_seconds'] * 1000, 3),
+                    'mean_db_ms': round(
+                        stats['db_seconds'] / stats['requests'] * 1000, 3
+                    ),
+                    'mean_queries': round(
+                        stats['queries'] / stats['requests'], 2
+                    ),
+                }
+                for view, stats in self.views.items()
+            ]
+            statements: list[tuple[str, int]] = (
+                self.statements.most_common(limit)
+            )
+        views.sort(key=lambda stats: stats['mean_ms'], reverse=True)
+        return {
+            'slowest_views': views[:limit],
+            'repeated_queries': [
+                {'sql': sql, 'count': count} for sql, count in statements
+            ],
+        }
+
+
+profile_stats = ProfileStats()
+
+
+class ProfilingMiddleware:
+    """
+    Измеряет количество и время SQL-запросов и всего запроса,
+    а представления с 'ProfilingMixin' добавляют в профиль время
+    аутентификации и своего действия. Результаты возвращаются в заголовке
+    'Server-Timing', записываются в журнал 'api.profiling' одной строкой
+    JSON и накапливаются в 'profile_stats'.
+    Включается настройкой 'CATALOG_PROFILING'.
+    """
+    def __init__(self, get_response: Callable[..., HttpResponse]) -> None:
+        if not getattr(settings, 'CATALOG_PROFILING', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Выполняет запрос с измерениями."""
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        started: float = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(
+                        connection.execute_wrapper(profile.execute)
+                    )
+                response: HttpResponse = self.get_response(request)
+        finally:
+            current_profile.reset(token)
+        seconds: float = perf_counter() - started
+        match = request.resolver_match
+        profile.view = (
+            f'{request.method} {match.view_name if match else request.path}'
+        )
+        profile_stats.add(profile, seconds)
+        response['Server-Timing'] = self.server_timing(profile, seconds)
+        logger.info(json.dumps(
+            self.log_record(request, response, profile, seconds),
+            ensure_ascii=False
+        ))
+        return response
+
+    @staticmethod
+    def server_timing(profile: RequestProfile, seconds: float) -> str:
+        """Возвращает значение заголовка 'Server-Timing'."""
+        metrics: list[str] = [
+            f'db;dur={profile.db_seconds * 1000:.3f};'
+            f'desc="{sum(profile.queries.values())} queries"'
+        ]
+        metrics += [
+            f'{name};dur={value * 1000:.3f}'
+            for name, value in profile.sections.items()
+        ]
+        metrics.append(f'total;dur={seconds * 1000:.3f}')
+        return ', '.join(metrics)
+
+    @staticmethod
+    def log_record(
+        request: HttpRequest, response: HttpResponse,
+        profile: RequestProfile, seconds: float
+    ) -> dict[str, Any]:
+        """Возвращает запись журнала с измерениями запроса."""
+        repeated: list[tuple[str, int]] = profile.queries.most_common(1)
+        return {
+            'view': profile.view,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'total_ms': round(seconds * 1000, 3),
+            'db_ms': round(profile.db_seconds * 1000, 3),
+            'queries': sum(profile.queries.values()),
+            'max_repeated_query': repeated[0][1] if repeated else 0,
+            **{
+                f'{name}_ms': round(value * 1000, 3)
+                for name, value in profile.sections.items()
+            },
+        }
@@ -0,0 +1,48 @@
+from typing import Any
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class CatalogJSONRenderer(JSONRenderer):
+    """
+    JSON-рендерер на 'orjson', если пакет установлен.
+    Даты, десятичные числа и другие типы, которые 'orjson' не кодирует
+    так же, как DRF, передаются кодировщику DRF, поэтому ответ совпадает
+    с ответом 'JSONRenderer'. Ответы с отступами, запрошенными
+    в заголовке Accept, и ответы с 'UNICODE_JSON = False'
+    формирует 'JSONRenderer'.
+    """
+    def render(
+        self, data: Any, accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None
+    ) -> bytes:
+        """Кодирует данные ответа в JSON."""
+        if data is None:
+            return b''
+        if (
+            orjson is None
+            or not api_settings.UNICODE_JSON
+            or self.get_indent(
+                accepted_media_type or '', renderer_context or {}
+            )
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret: bytes = orjson.dumps(
+                data, default=self.encoder_class().default,
+                option=(
+                    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Как и JSONRenderer, экранирует разделители строк для JavaScript.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(
+            b'\xe2\x80\xa9', b'\\u2029'
+        )
@@ -0,0 +1,17 @@
+from rest_framework.routers import DefaultRouter, Route
+
+
+class BulkRouter(DefaultRouter):
+    """
+    Маршрутизатор, принимающий на адресе списка методы PATCH и DELETE
+    для массового изменения и удаления ('bulk_update' и 'bulk_destroy').
+    Методы подключаются только у представлений, где они определены.
+    """
+    routes: list[Route] = [
+        DefaultRouter.routes[0]._replace(mapping={
+            **DefaultRouter.routes[0].mapping,
+            'patch': 'bulk_update',
+            'delete': 'bulk_destroy',
+        }),
+        *DefaultRouter.routes[1:],
+    ]
@@ -0,0 +1,20 @@
+from drf_spectacular.openapi import AutoSchema
+
+BULK_ACTIONS: tuple[str, ...] = ('bulk_update', 'bulk_destroy')
+
+
+class CatalogAutoSchema(AutoSchema):
+    """
+    Схема OpenAPI каталога. Массовые действия на адресе списка
+    получают идентификаторы операций по имени действия, а не метода,
+    чтобы не совпадать с операциями отдельного объекта.
+    """
+    def get_operation_id(self) -> str:
+        """Возвращает идентификатор операции."""
+        operation_id: str = super().get_operation_id()
+        action: str | None = getattr(self.view, 'action', None)
+        if action in BULK_ACTIONS:
+            return operation_id.removesuffix(
+                self.method_mapping[self.method.lower()]
+            ) + action
+        return operation_id
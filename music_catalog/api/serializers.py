@@ -2,10 +2,18 @@ from typing import Any
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
 from rest_framework import serializers
 
 from .mixins import LookUpSlugFieldMixin
+from constants import SONGS_IN_ALBUM
+from jobs.handlers import save_upload
+from jobs.models import Job
+from jobs.queue import enqueue
+from music.importer import IMPORT_FORMATS, guess_format, is_utf8
 from music.models import User, Musician, Song, Album, AlbumSong
+from music.tracklist import replace_tracklist
 
 
 class AdminLoginSerializer(serializers.ModelSerializer):
@@ -43,7 +51,8 @@ class MusicianSerializer(serializers.ModelSerializer, LookUpSlugFieldMixin):
     """
     class Meta:
         model = Musician
-        fields = ('name', 'slug')
+        fields = ('name', 'slug', 'total_albums', 'total_songs')
+        read_only_fields = ('total_albums', 'total_songs')
 
 
 class SongSerialiser(serializers.ModelSerializer, LookUpSlugFieldMixin):
@@ -71,8 +80,12 @@ class SongSerialiser(serializers.ModelSerializer, LookUpSlugFieldMixin):
             )
         return value
 
+    @transaction.atomic
     def create(self, validated_data: dict[str, Any]) -> Song:
-        """Создает новую песню и связывает ее с альбомом."""
+        """
+        Создает новую песню и связывает ее с альбомом.
+        Счетчики песен обновляются в той же транзакции.
+        """
         album: Album = self.context['view'].get_album()
         number_in_album: int = validated_data['number_in_album']
         if AlbumSong.objects.filter(
@@ -89,8 +102,10 @@ class SongSerialiser(serializers.ModelSerializer, LookUpSlugFieldMixin):
             album=album, song=song,
             number_in_album=number_in_album
         )
+        song.number_in_album = number_in_album
         return song
 
+    @transaction.atomic
     def update(self, instance: Song, validated_data: dict[str, Any]) -> Song:
         """Обновляет данные песни и связанной с ней информации в альбоме."""
         album_song: AlbumSong = AlbumSong.objects.get(
@@ -98,18 +113,18 @@ class SongSerialiser(serializers.ModelSerializer, LookUpSlugFieldMixin):
         )
         album_song.number_in_album = validated_data['number_in_album']
         album_song.save()
+        instance.number_in_album = album_song.number_in_album
         return super().update(instance, validated_data)
 
     def to_representation(self, instance: Song) -> dict[str, Any]:
-        """Готовит данные для ответа клиенту."""
-        number_in_album: int = AlbumSong.objects.get(
-            song=instance,
-            album=self.context['view'].get_album()
-        ).number_in_album
+        """
+        Готовит данные для ответа клиенту.
+        Порядковый номер берется из аннотации запроса 'SongViewSet'.
+        """
         return {
             'name': instance.name,
             'slug': instance.slug,
-            'number_in_album': number_in_album
+            'number_in_album': instance.number_in_album
         }
 
 
@@ -122,7 +137,6 @@ class AlbumSerialiser(serializers.ModelSerializer, LookUpSlugFieldMixin):
         slug_field='slug',
         read_only=True
     )
-    total_songs = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Album
@@ -130,7 +144,198 @@ class AlbumSerialiser(serializers.ModelSerializer, LookUpSlugFieldMixin):
             'name', 'slug', 'musician',
             'total_songs', 'year_of_release'
         )
+        read_only_fields = ('total_songs',)
 
-    def get_total_songs(self, obj: Album) -> int:
-        """Метод для вычисления общего количества песен в альбоме."""
-        return obj.songs.count()
+
+class MusicianWithAlbumsSerializer(MusicianSerializer):
+    """Сериализатор исполнителя вместе с его альбомами."""
+    albums = AlbumSerialiser(many=True, read_only=True)
+
+    class Meta(MusicianSerializer.Meta):
+        fields = (*MusicianSerializer.Meta.fields, 'albums')
+
+
+class TrackSerializer(serializers.ModelSerializer):
+    """Сериализатор песни в списке песен альбома."""
+    name = serializers.CharField(source='song.name', read_only=True)
+    slug = serializers.SlugField(source='song.slug', read_only=True)
+
+    class Meta:
+        model = AlbumSong
+        fields = ('name', 'slug', 'number_in_album')
+        read_only_fields = ('number_in_album',)
+
+
+class AlbumWithSongsSerialiser(AlbumSerialiser):
+    """Сериализатор альбома вместе со всеми его песнями по порядку."""
+    songs = TrackSerializer(source='albums', many=True, read_only=True)
+
+    class Meta(AlbumSerialiser.Meta):
+        fields = (*AlbumSerialiser.Meta.fields, 'songs')
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Сериализатор только для чтения строк 'QuerySet.values()'.
+    Поля ответа и ключи строк, из которых они берутся, задаются
+    в 'values_fields'. Ответ строится из словарей без полей DRF
+    и объектов моделей, поэтому схема API по-прежнему описывается
+    сериализаторами моделей.
+    """
+    values_fields: dict[str, str] = {}
+
+    def to_representation(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Возвращает поля ответа из строки запроса."""
+        return {field: row[key] for field, key in self.values_fields.items()}
+
+
+class MusicianValuesSerializer(ValuesSerializer):
+    """Быстрый сериализатор списка исполнителей."""
+    values_fields = {
+        'name': 'name',
+        'slug': 'slug',
+        'total_albums': 'total_albums',
+        'total_songs': 'total_songs',
+    }
+
+
+class SongValuesSerializer(ValuesSerializer):
+    """Быстрый сериализатор списка песен альбома."""
+    values_fields = {
+        'name': 'name',
+        'slug': 'slug',
+        'number_in_album': 'number_in_album',
+    }
+
+
+class AlbumValuesSerializer(ValuesSerializer):
+    """Быстрый сериализатор списка альбомов исполнителя."""
+    values_fields = {
+        'name': 'name',
+        'slug': 'slug',
+        'musician': 'musician__slug',
+        'total_songs': 'total_songs',
+        'year_of_release': 'year_of_release',
+    }
+
+
+class TracklistSongSerializer(serializers.Serializer):
+    """Сериализатор песни в списке песен альбома для записи."""
+    name = serializers.CharField(max_length=150)
+    slug = serializers.SlugField(max_length=150)
+
+
+class AlbumTracklistSerializer(serializers.Serializer):
+    """
+    Сериализатор полного списка песен альбома.
+    Порядковые номера задаются порядком песен в списке.
+    """
+    songs = TracklistSongSerializer(many=True, max_length=SONGS_IN_ALBUM)
+
+    def validate_songs(
+        self, value: list[dict[str, str]]
+    ) -> list[dict[str, str]]:
+        """Проверяет, что песни в списке не повторяются."""
+        slugs: set[str] = {song['slug'] for song in value}
+        if len(slugs) != len(value):
+            raise serializers.ValidationError(
+                'Песни в альбоме не должны повторяться.'
+            )
+        return value
+
+    @transaction.atomic
+    def update(self, instance: Album, validated_data: dict[str, Any]) -> Album:
+        """Заменяет список песен альбома в одной транзакции."""
+        instance.tracks = replace_tracklist(instance, validated_data['songs'])
+        return instance
+
+    def to_representation(self, instance: Album) -> dict[str, Any]:
+        """Возвращает новый список песен альбома по порядку."""
+        return {'songs': TrackSerializer(instance.tracks, many=True).data}
+
+
+class UTF8FileField(serializers.FileField):
+    """
+    Поле текстового файла в кодировке UTF-8. Кодировка проверяется
+    до загрузки, чтобы файл не был загружен частично.
+    """
+    default_error_messages = {
+        'encoding': 'Файл должен быть в кодировке UTF-8.',
+    }
+
+    def to_internal_value(self, data: Any) -> UploadedFile:
+        """Проверяет кодировку файла и возвращает его с начала."""
+        file: UploadedFile = super().to_internal_value(data)
+        if not is_utf8(file.chunks()):
+            self.fail('encoding')
+        file.seek(0)
+        return file
+
+
+class CatalogImportSerializer(serializers.Serializer):
+    """Сериализатор файла для массовой загрузки каталога."""
+    file = UTF8FileField()
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False)
+    chunk_size = serializers.IntegerField(
+        min_value=1, max_value=10000, default=1000
+    )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Определяет формат файла по расширению, если он не указан."""
+        attrs.setdefault('format', guess_format(attrs['file'].name))
+        return attrs
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """Сериализатор фоновой задачи для чтения статуса и прогресса."""
+
+    class Meta:
+        model = Job
+        fields = (
+            'id', 'kind', 'params', 'status', 'progress', 'result', 'error',
+            'attempts', 'max_attempts', 'run_after', 'created', 'started',
+            'finished'
+        )
+        read_only_fields = fields
+
+
+class JobCreateSerializer(serializers.Serializer):
+    """
+    Сериализатор постановки фоновой задачи в очередь.
+    Файл нужен только для загрузки каталога и сохраняется
+    в 'JOBS_DIR' до ее выполнения.
+    """
+    kind = serializers.ChoiceField(choices=Job.Kind.choices)
+    file = UTF8FileField(required=False)
+    format = serializers.ChoiceField(choices=IMPORT_FORMATS, required=False)
+    chunk_size = serializers.IntegerField(
+        min_value=1, max_value=10000, required=False
+    )
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Проверяет файл загрузки и задает параметры по умолчанию."""
+        if attrs['kind'] == Job.Kind.IMPORT_CATALOG:
+            if 'file' not in attrs:
+                raise serializers.ValidationError(
+                    {'file': 'Файл обязателен для загрузки каталога.'}
+                )
+            attrs.setdefault('format', guess_format(attrs['file'].name))
+            attrs.setdefault('chunk_size', 1000)
+        elif attrs['kind'] == Job.Kind.EXPORT_CATALOG:
+            attrs.setdefault('format', 'ndjson')
+            attrs.setdefault('chunk_size', 500)
+        return attrs
+
+    def create(self, validated_data: dict[str, Any]) -> Job:
+        """Сохраняет загруженный файл и ставит задачу в очередь."""
+        params: dict[str, Any] = {
+            key: value for key, value in validated_data.items()
+            if key in ('format', 'chunk_size')
+        }
+        if validated_data['kind'] == Job.Kind.IMPORT_CATALOG:
+            params['file'] = save_upload(validated_data['file'])
+        return enqueue(validated_data['kind'], params)
+
+    def to_representation(self, instance: Job) -> dict[str, Any]:
+        """Возвращает созданную задачу."""
+        return JobSerializer(instance).data
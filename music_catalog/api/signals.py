@@ -0,0 +1,133 @@
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete
+
+from .authentication import reset_auth_state
+from .cache import (
+    MUSICIANS_SCOPE, SCHEMA_SCOPE, album_scope, bump_versions,
+    musician_scope, slug_cache
+)
+from music.models import Musician, Album, Song, AlbumSong
+from music.signals import deleted_with
+
+
+def bump_on_commit(scopes: Iterable[str]) -> None:
+    """
+    Сбрасывает кэш областей после фиксации транзакции: иначе
+    параллельный запрос успел бы закэшировать под новой версией
+    еще не измененные строки.
+    """
+    scopes = set(scopes)
+    transaction.on_commit(lambda: bump_versions(scopes))
+
+
+def musician_changed(
+    sender: type[Musician], instance: Musician, **kwargs: Any
+) -> None:
+    """Сбрасывает кэш исполнителей и страниц исполнителя."""
+    scopes: list[str] = [MUSICIANS_SCOPE, musician_scope(instance.slug)]
+    previous: dict[str, Any] | None = getattr(instance, '_previous', None)
+    if previous:
+        scopes.append(musician_scope(previous['slug']))
+    bump_on_commit(scopes)
+
+
+def album_changed(
+    sender: type[Album], instance: Album,
+    origin: Model | QuerySet | None = None, **kwargs: Any
+) -> None:
+    """
+    Сбрасывает кэш альбомов исполнителя и песен альбома.
+    При каскадном удалении исполнителя кэш сбрасывается его обработчиком.
+    """
+    if deleted_with(origin, Musician):
+        return
+    previous: dict[str, Any] = getattr(instance, '_previous', None) or {}
+    scopes: list[str] = [MUSICIANS_SCOPE, album_scope(instance.slug)]
+    if previous:
+        scopes.append(album_scope(previous['slug']))
+    scopes += map(musician_scope, Musician.objects.filter(
+        pk__in={instance.musician_id, previous.get('musician_id')}
+    ).values_list('slug', flat=True))
+    bump_on_commit(scopes)
+
+
+def song_changed(sender: type[Song], instance: Song, **kwargs: Any) -> None:
+    """Сбрасывает кэш песен всех альбомов, в которые входит песня."""
+    bump_on_commit(map(album_scope, Album.objects.filter(
+        songs=instance
+    ).values_list('slug', flat=True)))
+
+
+def album_song_changed(
+    sender: type[AlbumSong], instance: AlbumSong,
+    origin: Model | QuerySet | None = None, **kwargs: Any
+) -> None:
+    """
+    Сбрасывает кэш песен альбома и альбомов исполнителя.
+    При каскадном удалении альбома или исполнителя
+    кэш сбрасывается их обработчиками.
+    """
+    if deleted_with(origin, Musician, Album):
+        return
+    for slug, musician_slug in Album.objects.filter(
+        pk=instance.album_id
+    ).values_list('slug', 'musician__slug'):
+        bump_on_commit([
+            MUSICIANS_SCOPE, musician_scope(musician_slug), album_scope(slug)
+        ])
+
+
+def slug_changed(
+    sender: type[Model], instance: Model, signal: Any,
+    origin: Model | QuerySet | None = None, **kwargs: Any
+) -> None:
+    """
+    Забывает первичный ключ слага удаленного объекта или прежнего
+    слага переименованного. При каскадном удалении альбомов
+    исполнителя их устаревшие слаги отсекаются проверкой слага.
+    """
+    if signal is post_delete:
+        if not deleted_with(origin, Musician):
+            slug_cache.delete(sender, [instance.slug])
+        return
+    previous: dict[str, Any] = getattr(instance, '_previous', None) or {}
+    if previous.get('slug', instance.slug) != instance.slug:
+        slug_cache.delete(sender, [previous['slug']])
+
+
+def catalog_bulk_changed(
+    sender: type, musicians: Iterable[str] = (),
+    albums: Iterable[str] = (), **kwargs: Any
+) -> None:
+    """
+    Сбрасывает кэш исполнителей и альбомов и первичные ключи их слагов
+    после массовых изменений.
+    """
+    musicians, albums = set(musicians), set(albums)
+    bump_versions([
+        MUSICIANS_SCOPE, *map(musician_scope, musicians),
+        *map(album_scope, albums)
+    ])
+    slug_cache.delete(Musician, musicians)
+    slug_cache.delete(Album, albums)
+
+
+def user_changed(sender: type[Model], instance: Model, **kwargs: Any) -> None:
+    """
+    Сбрасывает кэшированное состояние пользователя для проверки JWT
+    после фиксации транзакции. Первичный ключ запоминается сразу:
+    после удаления у объекта он равен None.
+    """
+    user_id: Any = instance.pk
+    transaction.on_commit(lambda: reset_auth_state(user_id))
+
+
+def schema_changed(**kwargs: Any) -> None:
+    """
+    Сбрасывает кэш схемы OpenAPI после миграций: они выполняются
+    при каждом обновлении, а схема зависит от кода.
+    """
+    bump_versions([SCHEMA_SCOPE])
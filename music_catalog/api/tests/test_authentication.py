@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from music.models import User
+
+ADMIN_URL = reverse('cache-stats')
+
+
+class CatalogJWTAuthenticationTests(TestCase):
+    """Тесты проверки JWT администратора по кэшу состояния."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.admin = User.objects.create_superuser('root', password='root')
+        response = self.client.post(
+            reverse('login'), {'username': 'root', 'password': 'root'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {response.json()["access"]}'
+        )
+
+    def change_admin(self, **fields: object) -> None:
+        """Сохраняет поля администратора и фиксирует транзакцию."""
+        with self.captureOnCommitCallbacks(execute=True):
+            for name, value in fields.items():
+                setattr(self.admin, name, value)
+            self.admin.save()
+
+    def assert_rejected(self, detail: str) -> None:
+        """Проверяет, что токен отклоняется с сообщением 'detail'."""
+        response = self.client.get(ADMIN_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json()['detail'], detail)
+
+    def test_valid_token(self) -> None:
+        """
+        Состояние пользователя запрашивается один раз,
+        а дальше токен проверяется без запросов к базе.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(ADMIN_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(0):
+            response = self.client.get(ADMIN_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_password_changed(self) -> None:
+        """После смены пароля токен отклоняется."""
+        self.client.get(ADMIN_URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin.set_password('changed')
+            self.admin.save()
+        self.assert_rejected('Токен отозван.')
+
+    def test_inactive(self) -> None:
+        """Токен деактивированного пользователя отклоняется."""
+        self.client.get(ADMIN_URL)
+        self.change_admin(is_active=False)
+        self.assert_rejected('Пользователь неактивен.')
+
+    def test_staff_revoked(self) -> None:
+        """Токен пользователя, лишенного прав администратора, отклоняется."""
+        self.client.get(ADMIN_URL)
+        self.change_admin(is_staff=False, is_superuser=False)
+        self.assert_rejected('Токен отозван.')
+
+    def test_deleted(self) -> None:
+        """Токен удаленного пользователя отклоняется."""
+        self.client.get(ADMIN_URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin.delete()
+        self.assert_rejected('Пользователь не найден.')
+
+    def test_unchanged_user_saved(self) -> None:
+        """Сохранение без изменений прав и пароля не отзывает токен."""
+        self.client.get(ADMIN_URL)
+        self.change_admin(first_name='Root')
+        response = self.client.get(ADMIN_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,48 @@
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from api.mixins import BulkMixin
+from music.models import Musician, Album
+
+
+class DefaultBulkView(BulkMixin):
+    """Представление с методами записи 'BulkMixin' по умолчанию."""
+
+    def get_queryset(self) -> QuerySet[Album]:
+        """Возвращает все альбомы."""
+        return Album.objects.all()
+
+
+class BulkMixinDefaultsTests(TestCase):
+    """
+    Тесты методов записи 'BulkMixin' по умолчанию: объекты сохраняются
+    с сигналами моделей, поэтому счетчики исполнителя остаются верными.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.musician = Musician.objects.create(
+            name='Musician', slug='musician'
+        )
+
+    def test_create_update_destroy(self) -> None:
+        """Создание и удаление меняют счетчик альбомов исполнителя."""
+        view = DefaultBulkView()
+        self.assertEqual(view.perform_bulk_create([
+            {'name': f'Album {number}', 'slug': f'album-{number}',
+             'musician': self.musician, 'year_of_release': 2000}
+            for number in (1, 2, 3)
+        ]), 3)
+        self.musician.refresh_from_db()
+        self.assertEqual(self.musician.total_albums, 3)
+
+        albums: list[Album] = list(Album.objects.filter(slug='album-1'))
+        albums[0].name = 'Renamed'
+        self.assertEqual(view.perform_bulk_update(albums, {'name'}), 1)
+        self.assertTrue(Album.objects.filter(name='Renamed').exists())
+
+        self.assertEqual(view.perform_bulk_destroy(
+            Album.objects.filter(slug__in=['album-1', 'album-2'])
+        ), 2)
+        self.musician.refresh_from_db()
+        self.assertEqual(self.musician.total_albums, 1)
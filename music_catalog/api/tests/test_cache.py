@@ -0,0 +1,111 @@
+from io import StringIO
+from typing import Callable
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.cache import MUSICIANS_SCOPE, get_versions, musician_scope
+from jobs.models import Job
+from jobs.queue import enqueue, run_job
+from music.models import User, Musician, Album
+
+
+class CacheInvalidationTests(TestCase):
+    """Тесты сброса кэша ответов каталога."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+        Musician.objects.create(name='Musician', slug='musician')
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = APIClient()
+
+    def test_bump_after_commit(self) -> None:
+        """
+        Версии областей меняются только после фиксации транзакции,
+        чтобы под новой версией не закэшировались старые строки.
+        """
+        self.client.get('/api/v1/musicians/musician/')
+        scopes: list[str] = [MUSICIANS_SCOPE, musician_scope('musician')]
+        versions: list[int] = get_versions(scopes)
+        self.client.force_authenticate(self.admin)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.patch(
+                '/api/v1/musicians/musician/', {'name': 'Renamed'},
+                format='json'
+            )
+            self.assertEqual(get_versions(scopes), versions)
+        for callback in callbacks:
+            callback()
+        self.assertTrue(all(
+            new != old for new, old in zip(get_versions(scopes), versions)
+        ))
+        self.client.force_authenticate(None)
+        response = self.client.get('/api/v1/musicians/musician/')
+        self.assertEqual(response.json()['name'], 'Renamed')
+
+
+class CounterRepairCacheTests(TestCase):
+    """Тесты сброса кэша после пересчета счетчиков."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        musician = Musician.objects.create(name='Musician', slug='musician')
+        Album.objects.create(
+            name='Album', slug='album', musician=musician,
+            year_of_release=2000
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = APIClient()
+
+    def counters(self) -> tuple[int, int]:
+        """
+        Возвращает количество альбомов исполнителя и песен альбома
+        из ответов API.
+        """
+        musician = self.client.get('/api/v1/musicians/musician/').json()
+        album = self.client.get(
+            '/api/v1/musicians/musician/albums/album/'
+        ).json()
+        return musician['total_albums'], album['total_songs']
+
+    def assert_repaired(self, repair: Callable[[], None]) -> None:
+        """Проверяет, что после 'repair' API отдает верные счетчики."""
+        Musician.objects.update(total_albums=5)
+        Album.objects.update(total_songs=7)
+        self.assertEqual(self.counters(), (5, 7))
+        with self.captureOnCommitCallbacks(execute=True):
+            repair()
+        self.assertEqual(self.counters(), (1, 0))
+
+    def test_command(self) -> None:
+        """Команда 'repair_counters' сбрасывает кэш исправленных объектов."""
+        self.assert_repaired(
+            lambda: call_command('repair_counters', stdout=StringIO())
+        )
+
+    def test_job(self) -> None:
+        """Задача пересчета счетчиков сбрасывает кэш."""
+        self.assert_repaired(
+            lambda: run_job(enqueue(Job.Kind.REPAIR_COUNTERS).pk)
+        )
+
+    def test_nothing_repaired(self) -> None:
+        """Если счетчики верны, кэш не сбрасывается."""
+        self.counters()
+        versions: list[int] = get_versions(
+            [MUSICIANS_SCOPE, musician_scope('musician')]
+        )
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            call_command('repair_counters', stdout=StringIO())
+        self.assertEqual(callbacks, [])
+        self.assertEqual(
+            get_versions([MUSICIANS_SCOPE, musician_scope('musician')]),
+            versions
+        )
@@ -0,0 +1,57 @@
+from django.test import TestCase
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from music.models import User, Musician
+
+
+class ConditionalGetTests(TestCase):
+    """Тесты условных запросов к каталогу."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+        for number in range(2):
+            Musician.objects.create(
+                name=f'Musician {number}', slug=f'musician-{number}'
+            )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+    def test_list_etag_after_delete(self) -> None:
+        """
+        Список не возвращает Last-Modified, а его ETag меняется
+        после удаления записи.
+        """
+        response = self.client.get('/api/v1/musicians/')
+        self.assertNotIn('Last-Modified', response.headers)
+        etag: str = response.headers['ETag']
+        self.assertEqual(
+            self.client.get(
+                '/api/v1/musicians/', HTTP_IF_NONE_MATCH=etag
+            ).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+        self.client.force_authenticate(self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete('/api/v1/musicians/musician-0/')
+        self.client.force_authenticate(None)
+        response = self.client.get(
+            '/api/v1/musicians/', HTTP_IF_NONE_MATCH=etag,
+            HTTP_IF_MODIFIED_SINCE=http_date()
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_retrieve_last_modified(self) -> None:
+        """Объект отвечает 304 на If-Modified-Since."""
+        response = self.client.get('/api/v1/musicians/musician-1/')
+        self.assertEqual(
+            self.client.get(
+                '/api/v1/musicians/musician-1/',
+                HTTP_IF_MODIFIED_SINCE=response.headers['Last-Modified']
+            ).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
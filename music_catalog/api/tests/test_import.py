@@ -0,0 +1,48 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from music.models import User, Musician
+
+
+class CatalogImportTests(TestCase):
+    """Тесты загрузки каталога через API."""
+    url = '/api/v1/import/'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def upload(self, name: str, content: bytes) -> object:
+        """Отправляет файл загрузки."""
+        return self.client.post(
+            self.url, {'file': SimpleUploadedFile(name, content)},
+            format='multipart'
+        )
+
+    def test_not_utf8(self) -> None:
+        """Файл не в кодировке UTF-8 отклоняется целиком."""
+        content: bytes = (
+            'musician_name,musician_slug\nOne,one\nДва,two\n'
+        ).encode('cp1251')
+        response = self.upload('catalog.csv', content)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('file', response.json())
+        self.assertFalse(Musician.objects.exists())
+
+    def test_invalid_nested_records(self) -> None:
+        """Некорректные вложенные записи возвращаются ошибками строк."""
+        response = self.upload(
+            'catalog.ndjson',
+            b'{"name": "One", "slug": "one", "albums": "oops"}\n'
+            b'{"name": "Two", "slug": "two", "albums": []}\n'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['error_count'], 1)
+        self.assertEqual(response.json()['errors'][0]['line'], 1)
+        self.assertTrue(Musician.objects.filter(slug='two').exists())
@@ -0,0 +1,133 @@
+from typing import Any
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api.cache import slug_cache
+from music.models import User, Musician, Song, Album, AlbumSong
+
+# Адреса, в которых дочерний объект принадлежит другому родителю
+# или родителя нет.
+MISMATCHED_URLS: list[str] = [
+    '/api/v1/musicians/other/albums/album/',
+    '/api/v1/musicians/other/albums/album/songs/',
+    '/api/v1/musicians/other/albums/album/songs/song/',
+    '/api/v1/musicians/musician/albums/album/songs/other-song/',
+    '/api/v1/musicians/musician/albums/other-album/songs/song/',
+    '/api/v1/musicians/musician/albums/other-album/songs/',
+    '/api/v1/musicians/missing/albums/',
+    '/api/v1/musicians/musician/albums/missing/songs/',
+]
+
+
+class NestedParentTests(TestCase):
+    """Тесты вложенных адресов с чужими или отсутствующими родителями."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+        for musician_slug, prefix in (('musician', ''), ('other', 'other-')):
+            musician = Musician.objects.create(
+                name=f'{prefix}Musician', slug=musician_slug
+            )
+            album = Album.objects.create(
+                name=f'{prefix}Album', slug=f'{prefix}album',
+                musician=musician, year_of_release=2000
+            )
+            AlbumSong.objects.create(
+                album=album, number_in_album=1,
+                song=Song.objects.create(
+                    name=f'{prefix}Song', slug=f'{prefix}song'
+                )
+            )
+
+    def setUp(self) -> None:
+        cache.clear()
+        slug_cache.clear()
+        self.client = APIClient()
+
+    def warm_up(self) -> None:
+        """Кэширует ответы и первичные ключи слагов верных адресов."""
+        for url in (
+            '/api/v1/musicians/musician/albums/album/songs/song/',
+            '/api/v1/musicians/other/albums/other-album/songs/other-song/',
+            '/api/v1/musicians/musician/albums/album/songs/',
+            '/api/v1/musicians/other/albums/other-album/songs/',
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_read(self) -> None:
+        """Чтение по адресу с чужим родителем возвращает 404."""
+        for warm in (False, True):
+            if warm:
+                self.warm_up()
+            for url in MISMATCHED_URLS:
+                with self.subTest(url=url, warm=warm):
+                    response = self.client.get(url)
+                    self.assertEqual(
+                        response.status_code, status.HTTP_404_NOT_FOUND
+                    )
+
+    def test_write(self) -> None:
+        """Изменение по адресу с чужим родителем возвращает 404."""
+        self.warm_up()
+        self.client.force_authenticate(self.admin)
+        requests: list[tuple[str, str, dict[str, Any]]] = [
+            ('post', '/api/v1/musicians/other/albums/album/songs/', {
+                'name': 'New', 'slug': 'new', 'number_in_album': 2,
+            }),
+            ('patch', '/api/v1/musicians/other/albums/album/', {
+                'name': 'Renamed',
+            }),
+            ('patch', '/api/v1/musicians/other/albums/album/songs/song/', {
+                'name': 'Renamed', 'number_in_album': 1,
+            }),
+            ('put', '/api/v1/musicians/other/albums/album/tracklist/', {
+                'songs': [],
+            }),
+            ('delete', '/api/v1/musicians/other/albums/album/', {}),
+            (
+                'delete',
+                '/api/v1/musicians/musician/albums/album/songs/other-song/',
+                {}
+            ),
+        ]
+        for method, url, data in requests:
+            with self.subTest(method=method, url=url):
+                response = getattr(self.client, method)(
+                    url, data, format='json'
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_404_NOT_FOUND
+                )
+        self.assertEqual(
+            list(Album.objects.order_by('slug').values_list(
+                'slug', 'name', 'musician__slug', 'total_songs'
+            )),
+            [
+                ('album', 'Album', 'musician', 1),
+                ('other-album', 'other-Album', 'other', 1),
+            ]
+        )
+        self.assertEqual(
+            list(Song.objects.order_by('slug').values_list('slug', 'name')),
+            [('other-song', 'other-Song'), ('song', 'Song')]
+        )
+
+    def test_lists(self) -> None:
+        """Списки содержат только объекты родителя из адреса."""
+        self.warm_up()
+        response = self.client.get('/api/v1/musicians/other/albums/')
+        self.assertEqual(
+            [album['slug'] for album in response.json()['results']],
+            ['other-album']
+        )
+        response = self.client.get(
+            '/api/v1/musicians/musician/albums/album/songs/'
+        )
+        self.assertEqual(
+            [song['slug'] for song in response.json()['results']], ['song']
+        )
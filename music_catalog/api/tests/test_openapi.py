@@ -0,0 +1,79 @@
+import gzip
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework import status
+
+from api.openapi import accepts_gzip
+from api.signals import schema_changed
+
+SCHEMA_URL = '/api/v1/schema/'
+
+
+class AcceptsGzipTests(TestCase):
+    """Тесты разбора заголовка 'Accept-Encoding'."""
+
+    def test_accepts_gzip(self) -> None:
+        """Учитываются q-значения и кодировка '*'."""
+        for header, expected in (
+            ('gzip', True),
+            ('deflate, GZIP;q=0.5', True),
+            ('gzip;q=0', False),
+            ('gzip; q=0.0, deflate', False),
+            ('*', True),
+            ('*;q=0', False),
+            ('gzip;q=0, *', False),
+            ('br, *;q=0.1', True),
+            ('gzip;q=oops', False),
+            ('x-gzipped', False),
+            ('', False),
+        ):
+            with self.subTest(header=header):
+                self.assertIs(accepts_gzip(header), expected)
+
+
+class CachedSchemaTests(TestCase):
+    """Тесты схемы OpenAPI из кэша ответов."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        # Предупреждения drf-spectacular о параметрах пути не нужны тестам.
+        self.enterContext(redirect_stderr(StringIO()))
+
+    def test_schema(self) -> None:
+        """Схема совпадает с несжатой схемой drf-spectacular."""
+        request = RequestFactory().get(SCHEMA_URL)
+        expected = SpectacularAPIView.as_view()(request)
+        expected.render()
+        for header in ('', 'gzip;q=0', 'gzip'):
+            with self.subTest(header=header):
+                response = self.client.get(
+                    SCHEMA_URL, HTTP_ACCEPT_ENCODING=header
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                content: bytes = response.content
+                if header == 'gzip':
+                    self.assertEqual(response['Content-Encoding'], 'gzip')
+                    content = gzip.decompress(content)
+                else:
+                    self.assertNotIn('Content-Encoding', response)
+                self.assertEqual(content, expected.content)
+
+    def test_schema_cache(self) -> None:
+        """Схема генерируется один раз до следующих миграций."""
+        with patch.object(
+            SpectacularAPIView, '_get_schema_response', autospec=True,
+            side_effect=SpectacularAPIView._get_schema_response
+        ) as generate:
+            for _ in range(2):
+                for header in ('', 'gzip'):
+                    self.client.get(SCHEMA_URL, HTTP_ACCEPT_ENCODING=header)
+            self.client.get(SCHEMA_URL, {'format': 'json'})
+            self.assertEqual(generate.call_count, 2)
+            schema_changed()
+            self.client.get(SCHEMA_URL)
+            self.assertEqual(generate.call_count, 3)
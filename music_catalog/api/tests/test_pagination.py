@@ -0,0 +1,68 @@
+import json
+from base64 import urlsafe_b64encode
+from typing import Any
+
+from django.test import TestCase
+from rest_framework import status
+
+from music.models import Musician, Song, Album, AlbumSong
+
+
+def cursor(position: Any) -> str:
+    """Кодирует позицию курсора так же, как 'KeysetPagination'."""
+    return urlsafe_b64encode(json.dumps({'p': position}).encode()).decode()
+
+
+class KeysetPaginationTests(TestCase):
+    """Тесты пагинации по ключу."""
+    url = '/api/v1/musicians/musician/albums/album/songs/'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        musician = Musician.objects.create(name='Musician', slug='musician')
+        album = Album.objects.create(
+            name='Album', slug='album', musician=musician,
+            year_of_release=2000
+        )
+        for number in range(1, 13):
+            AlbumSong.objects.create(
+                album=album, number_in_album=number,
+                song=Song.objects.create(
+                    name=f'Song {number}', slug=f'song-{number}'
+                )
+            )
+
+    def get_page(self, url: str) -> dict[str, Any]:
+        """Возвращает страницу списка песен."""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_pages(self) -> None:
+        """Страницы вперед и назад не пропускают и не повторяют записи."""
+        page: dict[str, Any] = self.get_page(f'{self.url}?pagination=cursor')
+        slugs: list[str] = [song['slug'] for song in page['results']]
+        while page['next']:
+            page = self.get_page(page['next'])
+            slugs += [song['slug'] for song in page['results']]
+        self.assertEqual(slugs, [f'song-{number}' for number in range(1, 13)])
+        page = self.get_page(page['previous'])
+        self.assertEqual(
+            [song['slug'] for song in page['results']],
+            [f'song-{number}' for number in range(6, 11)]
+        )
+
+    def test_invalid_cursor(self) -> None:
+        """На измененный курсор возвращается ответ 404."""
+        for value in (
+            'not-base64!', cursor(['abc', 'x']), cursor([1]),
+            cursor([None, 1]), cursor([1, 10 ** 30]), cursor({'a': 1}),
+            urlsafe_b64encode(b'[1, 2]').decode(),
+        ):
+            with self.subTest(cursor=value):
+                response = self.client.get(
+                    self.url, {'pagination': 'cursor', 'cursor': value}
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_404_NOT_FOUND
+                )
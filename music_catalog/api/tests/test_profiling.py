@@ -0,0 +1,100 @@
+import json
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api.profiling import profile_stats
+from music.models import User, Musician
+
+
+class ProfilingTestsMixin:
+    """Общая подготовка тестов профилирования."""
+    url = '/api/v1/musicians/'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+        Musician.objects.create(name='Musician', slug='musician')
+
+    def setUp(self) -> None:
+        cache.clear()
+        profile_stats.reset()
+        self.client = APIClient()
+
+
+@override_settings(CATALOG_PROFILING=True)
+class ProfilingEnabledTests(ProfilingTestsMixin, TestCase):
+    """Тесты профилирования при включенной настройке."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.logs = self.enterContext(
+            self.assertLogs('api.profiling', 'INFO')
+        )
+
+    def test_server_timing(self) -> None:
+        """Ответ представления каталога содержит все измерения."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        metrics: list[str] = [
+            metric.split(';')[0]
+            for metric in response['Server-Timing'].split(', ')
+        ]
+        self.assertEqual(metrics, ['db', 'auth', 'handler', 'total'])
+        record = json.loads(self.logs.records[0].getMessage())
+        self.assertEqual(record['view'], 'GET musicians-list')
+        self.assertEqual(record['status'], status.HTTP_200_OK)
+
+    def test_stats(self) -> None:
+        """Статистика учитывает запросы представлений."""
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.client.force_authenticate(self.admin)
+        response = self.client.get('/api/v1/profiling/', {'limit': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.json()
+        self.assertEqual(len(stats['slowest_views']), 1)
+        views = {
+            view['view']: view for view in profile_stats.as_dict()[
+                'slowest_views'
+            ]
+        }
+        self.assertEqual(views['GET musicians-list']['requests'], 2)
+        self.assertGreater(views['GET musicians-list']['mean_queries'], 0)
+        self.assertEqual(len(stats['repeated_queries']), 1)
+
+    def test_reset(self) -> None:
+        """
+        Администратор сбрасывает статистику: остается только
+        сам запрос сброса.
+        """
+        self.client.get(self.url)
+        self.client.force_authenticate(self.admin)
+        response = self.client.delete('/api/v1/profiling/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(
+            [view['view'] for view in profile_stats.as_dict()[
+                'slowest_views'
+            ]],
+            ['DELETE profiling']
+        )
+
+    def test_admin_only(self) -> None:
+        """Статистика доступна только администратору."""
+        response = self.client.get('/api/v1/profiling/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.delete('/api/v1/profiling/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProfilingDisabledTests(ProfilingTestsMixin, TestCase):
+    """Тесты без профилирования."""
+
+    def test_no_server_timing(self) -> None:
+        """Без настройки ответ не содержит измерений."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(profile_stats.as_dict()['slowest_views'], [])
@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+
+from api.cache import slug_cache
+from constants import SONGS_IN_ALBUM
+from music.models import Musician, Song, Album, AlbumSong
+
+# Количество SQL-запросов при холодном кэше: список песен - проверка
+# ETag, чтение альбома, подсчет и страница; песня - проверка ETag,
+# чтение альбома и песни.
+SONG_LIST_QUERIES = 4
+SONG_DETAIL_QUERIES = 3
+
+
+class SongQueryCountTests(TestCase):
+    """
+    Тесты количества SQL-запросов к песням: оно не должно зависеть
+    от количества песен в альбоме.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        musician = Musician.objects.create(name='Musician', slug='musician')
+        for size in (1, SONGS_IN_ALBUM):
+            album = Album.objects.create(
+                name=f'Album {size}', slug=f'album-{size}',
+                musician=musician, year_of_release=2000
+            )
+            for number in range(1, size + 1):
+                AlbumSong.objects.create(
+                    album=album, number_in_album=number,
+                    song=Song.objects.create(
+                        name=f'Song {size}-{number}',
+                        slug=f'song-{size}-{number}'
+                    )
+                )
+
+    def setUp(self) -> None:
+        cache.clear()
+        slug_cache.clear()
+
+    def assert_queries(self, url: str, queries: int) -> None:
+        """Проверяет количество SQL-запросов ответа с холодным кэшем."""
+        with self.assertNumQueries(queries):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_song_list(self) -> None:
+        """Список песен альбома из одной и из 50 песен."""
+        for size in (1, SONGS_IN_ALBUM):
+            with self.subTest(size=size):
+                self.setUp()
+                self.assert_queries(
+                    f'/api/v1/musicians/musician/albums/album-{size}/songs/',
+                    SONG_LIST_QUERIES
+                )
+
+    def test_song_detail(self) -> None:
+        """Песня альбома из одной и из 50 песен."""
+        for size in (1, SONGS_IN_ALBUM):
+            with self.subTest(size=size):
+                self.setUp()
+                self.assert_queries(
+                    f'/api/v1/musicians/musician/albums/album-{size}/songs/'
+                    f'song-{size}-1/',
+                    SONG_DETAIL_QUERIES
+                )
@@ -0,0 +1,54 @@
+from random import Random
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from api.benchmark import (
+    SCENARIOS, CatalogScale, capture_plans, seed_catalog
+)
+from api.cache import slug_cache
+from music.models import Song
+
+
+class QueryPlanTests(TestCase):
+    """
+    Тесты планов выполнения запросов сценариев 'benchmark_catalog':
+    таблицы не просматриваются без индекса, а сортировка
+    без индекса допускается только там, где ее разрешает сценарий.
+    """
+    scale = CatalogScale(musicians=20, albums=3, songs=5)
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        seed_catalog(cls.scale)
+
+    def test_scenarios(self) -> None:
+        """Планы SELECT-запросов сценариев без проблем."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('Планы проверяются только для SQLite.')
+        client = APIClient()
+        for scenario in SCENARIOS:
+            with self.subTest(scenario=scenario.name):
+                cache.clear()
+                slug_cache.clear()
+                url: str = scenario.url(Random(0), self.scale)
+                plans, problems = capture_plans(
+                    lambda: getattr(client, scenario.method)(
+                        url, data=scenario.data, format='json'
+                    ),
+                    scenario.sorts_in_memory
+                )
+                self.assertTrue(plans)
+                self.assertEqual(problems, [])
+
+    def test_song_name_ordering(self) -> None:
+        """Песни по названию читаются по индексу без сортировки."""
+        if connection.vendor != 'sqlite':
+            self.skipTest('Планы проверяются только для SQLite.')
+        plans, problems = capture_plans(
+            lambda: list(Song.objects.order_by('name', 'id')[:10])
+        )
+        self.assertEqual(problems, [])
+        self.assertIn('song_name_id_idx', ' '.join(plans[0]['plan']))
@@ -0,0 +1,142 @@
+import warnings
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from api.mixins import ReplicaReadMixin
+from core.routers import replica_reads
+from music.models import User, Musician
+
+REPLICA = 'replica_0'
+
+
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    Тесты маршрутизации чтения на реплику. Реплика - второе соединение
+    с той же тестовой базой, поэтому она видит зафиксированные данные.
+    Тесты без транзакции теста, чтобы проверить чтение внутри
+    транзакций представлений.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        replica: dict[str, Any] = {
+            **connections[DEFAULT_DB_ALIAS].settings_dict
+        }
+        with warnings.catch_warnings():
+            # Django предупреждает, что соединения не перечитывают
+            # DATABASES, поэтому реплика регистрируется и в 'connections'.
+            warnings.simplefilter('ignore')
+            self.enterContext(override_settings(
+                DATABASES={**settings.DATABASES, REPLICA: replica},
+                DATABASE_REPLICAS=[REPLICA]
+            ))
+        connections.settings[REPLICA] = replica
+        self.addCleanup(self.remove_replica)
+        self.admin = User.objects.create_superuser('root', password='root')
+        Musician.objects.create(name='Musician', slug='musician')
+        self.client = APIClient()
+
+    @staticmethod
+    def remove_replica() -> None:
+        """Закрывает соединение с репликой и удаляет ее из 'connections'."""
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.settings[REPLICA]
+
+    def queries(
+        self, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> tuple[int, int, Any]:
+        """
+        Выполняет 'method' и возвращает количество запросов
+        к основной базе и к реплике и результат.
+        """
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary:
+            with CaptureQueriesContext(connections[REPLICA]) as replica:
+                result = method(*args, **kwargs)
+        return len(primary), len(replica), result
+
+    def test_safe_requests(self) -> None:
+        """Список и объект читаются с реплики."""
+        for url in ('/api/v1/musicians/', '/api/v1/musicians/musician/'):
+            with self.subTest(url=url):
+                cache.clear()
+                primary, replica, response = self.queries(
+                    self.client.get, url
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(primary, 0)
+                self.assertGreater(replica, 0)
+
+    def test_use_primary_header(self) -> None:
+        """Заголовок 'X-Use-Primary' закрепляет запрос за основной базой."""
+        primary, replica, response = self.queries(
+            self.client.get, '/api/v1/musicians/', HTTP_X_USE_PRIMARY='1'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_write(self) -> None:
+        """
+        Изменяющий запрос читает и пишет основную базу, а клиент
+        после него читает основную базу по cookie.
+        """
+        self.client.force_authenticate(self.admin)
+        primary, replica, response = self.queries(
+            self.client.post, '/api/v1/musicians/',
+            {'name': 'Created', 'slug': 'created'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+        self.assertIn(ReplicaReadMixin.primary_cookie, response.cookies)
+        primary, replica, response = self.queries(
+            self.client.get, '/api/v1/musicians/created/'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_read_after_write(self) -> None:
+        """После записи чтение до конца блока идет на основную базу."""
+        def read_after_write() -> None:
+            with replica_reads():
+                Musician.objects.create(name='Other', slug='other')
+                list(Musician.objects.all())
+
+        primary, replica, _ = self.queries(read_after_write)
+        self.assertEqual(primary, 2)
+        self.assertEqual(replica, 0)
+
+    def test_transaction(self) -> None:
+        """Чтение внутри транзакции основной базы остается в ней."""
+        def read_in_transaction() -> None:
+            with replica_reads():
+                list(Musician.objects.all())
+                with transaction.atomic():
+                    list(Musician.objects.all())
+
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary:
+            _, replica, _ = self.queries(read_in_transaction)
+        self.assertEqual(replica, 1)
+        self.assertEqual(len([
+            query for query in primary
+            if query['sql'].startswith('SELECT')
+        ]), 1)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self) -> None:
+        """Без реплик безопасные запросы читают основную базу."""
+        primary, replica, response = self.queries(
+            self.client.get, '/api/v1/musicians/'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
@@ -0,0 +1,122 @@
+from typing import Any
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework import status
+
+from music.models import Musician
+
+NAMES: list[str] = [
+    'The Beatles',
+    'Beatles Revival Orchestra And Friends',
+    'Beat Happening',
+    'Radiohead',
+    'Nirvana',
+    'Beatles Tribute',
+    'Beats Antique',
+    'The Beat',
+]
+
+
+class SearchTestsMixin:
+    """Общие тесты поиска исполнителей через API."""
+    url = '/api/v1/musicians/'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        for number, name in enumerate(NAMES):
+            Musician.objects.create(name=name, slug=f'musician-{number}')
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def search(self, query: str, **params: str) -> dict[str, Any]:
+        """Возвращает ответ списка исполнителей с поиском 'query'."""
+        response = self.client.get(self.url, {'search': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def names(self, query: str) -> list[str]:
+        """Возвращает названия найденных исполнителей по порядку."""
+        return [
+            musician['name'] for musician in self.search(query)['results']
+        ]
+
+    def test_all_terms(self) -> None:
+        """Находятся названия со всеми словами запроса."""
+        self.assertEqual(
+            set(self.names('beatles the')), {'The Beatles'}
+        )
+        self.assertEqual(self.names('radiohead nirvana'), [])
+
+    def test_cursor_pages(self) -> None:
+        """Страницы по ключу повторяют порядок постраничного поиска."""
+        expected: list[str] = []
+        for number in (1, 2):
+            page = self.search('beat', page=str(number))
+            expected += [musician['slug'] for musician in page['results']]
+        self.assertEqual(len(expected), 6)
+        page = self.search('beat', pagination='cursor')
+        slugs: list[str] = [musician['slug'] for musician in page['results']]
+        while page['next']:
+            response = self.client.get(page['next'])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            page = response.json()
+            slugs += [musician['slug'] for musician in page['results']]
+        self.assertEqual(slugs, expected)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Бэкенд только для SQLite.')
+class SQLiteFTSSearchTests(SearchTestsMixin, TestCase):
+    """Тесты поиска по индексу SQLite FTS5."""
+
+    def test_ranking(self) -> None:
+        """Короткие названия со словом запроса - выше длинных."""
+        names: list[str] = self.names('beatles')
+        self.assertEqual(set(names), {
+            'The Beatles', 'Beatles Tribute',
+            'Beatles Revival Orchestra And Friends',
+        })
+        self.assertEqual(names[-1], 'Beatles Revival Orchestra And Friends')
+
+    def test_partial_words(self) -> None:
+        """Находятся части слов без учета регистра."""
+        self.assertEqual(self.names('ADIOHE'), ['Radiohead'])
+        self.assertEqual(self.names('rvan'), ['Nirvana'])
+
+    def test_typos(self) -> None:
+        """Триграммный индекс FTS5 не находит слова с опечатками."""
+        self.assertEqual(self.names('radiohaed'), [])
+
+    def test_short_terms(self) -> None:
+        """Слова короче трех символов ищутся через 'icontains'."""
+        self.assertEqual(self.names('ir'), ['Nirvana'])
+        self.assertEqual(self.names('th beat'), ['The Beat', 'The Beatles'])
+
+
+@override_settings(CATALOG_SEARCH_BACKEND='music.search.SearchBackend')
+class BaseSearchTests(SearchTestsMixin, TestCase):
+    """Тесты базового поиска без индекса."""
+
+    def test_ordering(self) -> None:
+        """Без ранжирования записи упорядочены по названию."""
+        self.assertEqual(self.names('beatles'), [
+            'Beatles Revival Orchestra And Friends', 'Beatles Tribute',
+            'The Beatles',
+        ])
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Бэкенд только для PostgreSQL.')
+class PostgreSQLTrigramSearchTests(SearchTestsMixin, TestCase):
+    """Тесты поиска по триграммному индексу PostgreSQL."""
+
+    def test_ranking(self) -> None:
+        """Самое похожее на запрос название - первое."""
+        self.assertEqual(self.names('beatles')[0], 'The Beatles')
+
+    def test_typos(self) -> None:
+        """Находятся названия с опечатками."""
+        self.assertIn('Radiohead', self.names('radiohaed'))
+        self.assertIn('The Beatles', self.names('beatels'))
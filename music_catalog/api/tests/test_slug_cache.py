@@ -0,0 +1,119 @@
+from django.core.cache import cache
+from django.http import Http404
+from django.test import TestCase
+from rest_framework import status
+
+from api.cache import SlugCache, get_by_slug, slug_cache
+from music.models import Musician, Album
+
+
+class SlugCacheInvalidationTests(TestCase):
+    """Тесты сброса первичных ключей слагов при изменении объектов."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.musician = Musician.objects.create(
+            name='Musician', slug='musician'
+        )
+        cls.album = Album.objects.create(
+            name='Album', slug='album', musician=cls.musician,
+            year_of_release=2000
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        slug_cache.clear()
+
+    def test_rename(self) -> None:
+        """Прежний слаг переименованного объекта забывается."""
+        get_by_slug(Musician.objects.all(), 'musician')
+        self.assertEqual(
+            slug_cache.get(Musician, 'musician'), self.musician.pk
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.musician.slug = 'renamed'
+            self.musician.save()
+        self.assertIsNone(slug_cache.get(Musician, 'musician'))
+        response = self.client.get('/api/v1/musicians/musician/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get('/api/v1/musicians/renamed/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_delete(self) -> None:
+        """Слаг удаленного объекта забывается."""
+        url: str = '/api/v1/musicians/musician/albums/album/'
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertEqual(slug_cache.get(Album, 'album'), self.album.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.album.delete()
+        self.assertIsNone(slug_cache.get(Album, 'album'))
+        self.assertEqual(
+            self.client.get(url).status_code, status.HTTP_404_NOT_FOUND
+        )
+
+    def test_stale_key(self) -> None:
+        """
+        Устаревший ключ, оставшийся в другом процессе, не возвращает
+        чужой объект: объект ищется и по слагу.
+        """
+        get_by_slug(Musician.objects.all(), 'musician')
+        Musician.objects.filter(pk=self.musician.pk).update(slug='moved')
+        other: Musician = Musician.objects.create(
+            name='Other', slug='musician'
+        )
+        self.assertEqual(
+            get_by_slug(Musician.objects.all(), 'musician'), other
+        )
+        self.assertEqual(slug_cache.get(Musician, 'musician'), other.pk)
+        with self.assertRaises(Http404):
+            get_by_slug(Musician.objects.all(), 'missing')
+
+
+class SlugCacheLRUTests(TestCase):
+    """Тесты LRU процесса поверх общего кэша Django."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.slugs = SlugCache(maxsize=2)
+
+    def test_eviction(self) -> None:
+        """Вытесняется ключ, который дольше всех не запрашивался."""
+        self.slugs.set(Musician, 'first', 1)
+        self.slugs.set(Musician, 'second', 2)
+        self.slugs.get(Musician, 'first')
+        self.slugs.set(Musician, 'third', 3)
+        self.assertEqual(list(self.slugs.entries), [
+            ('music.musician', 'first'), ('music.musician', 'third')
+        ])
+
+    def test_shared_cache_fallback(self) -> None:
+        """
+        Вытесненный из LRU ключ берется из общего кэша и снова
+        запоминается в процессе.
+        """
+        self.slugs.set(Musician, 'first', 1)
+        self.slugs.set(Musician, 'second', 2)
+        self.slugs.set(Musician, 'third', 3)
+        self.assertNotIn(('music.musician', 'first'), self.slugs.entries)
+        self.assertEqual(self.slugs.get(Musician, 'first'), 1)
+        self.assertIn(('music.musician', 'first'), self.slugs.entries)
+
+    def test_other_process(self) -> None:
+        """Ключ, найденный другим процессом, доступен через общий кэш."""
+        SlugCache(maxsize=2).set(Album, 'album', 5)
+        self.assertEqual(self.slugs.get(Album, 'album'), 5)
+        self.assertIsNone(self.slugs.get(Musician, 'album'))
+
+    def test_delete(self) -> None:
+        """
+        Удаление забывает ключ в своем процессе и в общем кэше,
+        а в LRU других процессов ключ остается до вытеснения.
+        """
+        other = SlugCache(maxsize=2)
+        self.slugs.set(Musician, 'first', 1)
+        other.get(Musician, 'first')
+        self.slugs.delete(Musician, ['first'])
+        self.assertIsNone(self.slugs.get(Musician, 'first'))
+        self.assertEqual(other.entries, {('music.musician', 'first'): 1})
+        other.clear()
+        self.assertIsNone(other.get(Musician, 'first'))
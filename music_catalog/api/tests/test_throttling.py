@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+LOGIN_URL = reverse('login')
+
+
+@override_settings(REST_FRAMEWORK={
+    **settings.REST_FRAMEWORK,
+    'DEFAULT_THROTTLE_RATES': {'login': '2/min', 'login_username': None},
+})
+class LoginThrottleTests(TestCase):
+    """Тесты ограничения попыток входа по IP-адресу."""
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def login(self, forwarded_for: str) -> int:
+        """Выполняет попытку входа и возвращает код ответа."""
+        return self.client.post(
+            LOGIN_URL, {'username': 'root', 'password': 'wrong'},
+            HTTP_X_FORWARDED_FOR=forwarded_for
+        ).status_code
+
+    def test_forwarded_for_ignored(self) -> None:
+        """Подмена 'X-Forwarded-For' не обходит ограничение."""
+        codes: list[int] = [
+            self.login(f'10.0.0.{number}') for number in range(3)
+        ]
+        self.assertNotEqual(codes[1], status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(codes[2], status.HTTP_429_TOO_MANY_REQUESTS)
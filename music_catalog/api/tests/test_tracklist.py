@@ -0,0 +1,63 @@
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from music.models import User, Musician, Song, Album, AlbumSong
+
+
+class AlbumTracklistTests(TestCase):
+    """Тесты замены списка песен альбома."""
+    url = '/api/v1/musicians/musician/albums/album/tracklist/'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+        musician = Musician.objects.create(name='Musician', slug='musician')
+        cls.album = Album.objects.create(
+            name='Album', slug='album', musician=musician,
+            year_of_release=2000
+        )
+        for number in range(3):
+            AlbumSong.objects.create(
+                album=cls.album, number_in_album=number + 1,
+                song=Song.objects.create(
+                    name=f'Song {number}', slug=f'x{number}'
+                )
+            )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def put_tracklist(self, slugs: list[str]) -> list[str]:
+        """Заменяет список песен и возвращает слаги песен по порядку."""
+        response = self.client.put(
+            self.url,
+            {'songs': [{'name': slug, 'slug': slug} for slug in slugs]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return list(AlbumSong.objects.filter(album=self.album).order_by(
+            'number_in_album'
+        ).values_list('song__slug', flat=True))
+
+    def test_reorder(self) -> None:
+        """Песни переставляются без создания новых."""
+        slugs: list[str] = ['x2', 'x0', 'x1']
+        self.assertEqual(self.put_tracklist(slugs), slugs)
+        self.assertEqual(Song.objects.count(), 3)
+
+    def test_grow_and_reorder(self) -> None:
+        """
+        Новые номера переставляемых песен могут превышать
+        текущий последний номер альбома.
+        """
+        slugs: list[str] = ['n1', 'x2', 'n2', 'n3', 'x0', 'x1']
+        self.assertEqual(self.put_tracklist(slugs), slugs)
+        self.album.refresh_from_db()
+        self.assertEqual(self.album.total_songs, 6)
+
+    def test_shrink(self) -> None:
+        """Убранные из альбома песни не удаляются."""
+        self.assertEqual(self.put_tracklist(['x1']), ['x1'])
+        self.assertEqual(Song.objects.count(), 3)
@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+
+from api.views import AlbumViewSet, MusicianViewSet, SongViewSet
+from music.models import Musician, Song, Album, AlbumSong
+
+# Адреса списков с быстрым сериализатором и параметры запросов:
+# страницы, пагинация по ключу, поиск и игнорируемое списком вложение.
+ENDPOINTS: list[tuple[type, str, list[dict[str, str]]]] = [
+    (MusicianViewSet, '/api/v1/musicians/', [
+        {}, {'page': '2'}, {'pagination': 'cursor'}, {'search': 'группа'},
+        {'expand': 'albums'},
+    ]),
+    (AlbumViewSet, '/api/v1/musicians/musician-0/albums/', [
+        {}, {'pagination': 'cursor'}, {'search': 'альбом'},
+        {'expand': 'songs'},
+    ]),
+    (SongViewSet, '/api/v1/musicians/musician-0/albums/album-0/songs/', [
+        {}, {'pagination': 'cursor'}, {'search': 'песня'},
+    ]),
+]
+
+
+class ValuesSerializerTests(TestCase):
+    """
+    Тесты совпадения ответов списков, построенных из строк
+    'QuerySet.values()', с ответами сериализаторов моделей.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        Musician.objects.create(name='Без альбомов', slug='musician-empty')
+        for number in range(12):
+            musician = Musician.objects.create(
+                name=f'Группа «{number}»', slug=f'musician-{number}'
+            )
+            for album_number in range(3):
+                album = Album.objects.create(
+                    name=f'Альбом {album_number} — "{number}"',
+                    slug=f'album-{number}-{album_number}'
+                    if album_number or number else 'album-0',
+                    musician=musician, year_of_release=1950 + album_number
+                )
+                for song_number in range(1, album_number + 2):
+                    AlbumSong.objects.create(
+                        album=album, number_in_album=song_number,
+                        song=Song.objects.create(
+                            name=f'Песня {song_number}',
+                            slug=f'song-{number}-{album_number}-'
+                                 f'{song_number}'
+                        )
+                    )
+
+    def get(self, url: str, params: dict[str, str]) -> bytes:
+        """Возвращает тело ответа при холодном кэше."""
+        cache.clear()
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.content
+
+    def test_same_response(self) -> None:
+        """Ответы быстрого пути и сериализатора модели совпадают."""
+        for view, url, queries in ENDPOINTS:
+            for params in queries:
+                with self.subTest(url=url, params=params):
+                    content: bytes = self.get(url, params)
+                    self.assertNotIn(b'"results":[]', content)
+                    with patch.object(view, 'values_serializer_class', None):
+                        expected: bytes = self.get(url, params)
+                    self.assertEqual(content, expected)
@@ -0,0 +1,57 @@
+from collections.abc import Mapping
+from hashlib import md5
+
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework.views import APIView
+
+
+class CatalogRateThrottle(SimpleRateThrottle):
+    """
+    Ограничение частоты запросов, читающее частоту
+    из текущих настроек DRF при каждом запросе, а не при импорте.
+    Частота 'None' отключает ограничение.
+    """
+    def get_rate(self) -> str | None:
+        """Возвращает частоту области из 'DEFAULT_THROTTLE_RATES'."""
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+
+class LoginIPThrottle(CatalogRateThrottle):
+    """Ограничивает попытки входа с одного IP-адреса."""
+    scope = 'login'
+
+    def get_cache_key(self, request: Request, view: APIView) -> str:
+        """
+        Ключ по IP-адресу клиента: 'X-Forwarded-For' учитывается,
+        только если в 'NUM_PROXIES' задано количество прокси-серверов.
+        """
+        return self.cache_format % {
+            'scope': self.scope, 'ident': self.get_ident(request)
+        }
+
+
+class LoginUsernameThrottle(CatalogRateThrottle):
+    """
+    Ограничивает попытки входа под одним именем пользователя
+    независимо от IP-адреса, с которого они выполняются.
+    """
+    scope = 'login_username'
+
+    def get_cache_key(
+        self, request: Request, view: APIView
+    ) -> str | None:
+        """Ключ по имени пользователя; без имени ограничение не действует."""
+        username = (
+            request.data.get('username')
+            if isinstance(request.data, Mapping) else None
+        )
+        if not isinstance(username, str) or not username:
+            return None
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': md5(
+                username.lower().encode(), usedforsecurity=False
+            ).hexdigest(),
+        }
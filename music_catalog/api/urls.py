@@ -1,10 +1,15 @@
 from django.urls import path, include
-from rest_framework import routers
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularSwaggerView
 
-from .views import MusicianViewSet, AdminLoginView, SongViewSet, AlbumViewSet
+from .routers import BulkRouter
+from .openapi import CachedSpectacularAPIView
+from .views import (
+    MusicianViewSet, AdminLoginView, AdminTokenRefreshView, SongViewSet,
+    AlbumViewSet, CacheStatsView, CatalogExportView, CatalogImportView,
+    JobViewSet, ProfilingStatsView
+)
 
-router = routers.DefaultRouter()
+router = BulkRouter()
 router.register(r'musicians', MusicianViewSet, basename='musicians')
 router.register(
     (album_url := r'musicians/(?P<musician>[^/.]+)/albums'),
@@ -14,13 +19,24 @@ router.register(
     album_url + r'/(?P<album>[^/.]+)/songs',
     SongViewSet, basename='songs'
 )
+router.register(r'jobs', JobViewSet, basename='jobs')
 
 urlpatterns = [
     path('v1/login/', AdminLoginView.as_view(), name='login'),
+    path(
+        'v1/login/refresh/', AdminTokenRefreshView.as_view(),
+        name='login-refresh'
+    ),
+    path('v1/cache/stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path(
+        'v1/profiling/', ProfilingStatsView.as_view(), name='profiling'
+    ),
+    path('v1/import/', CatalogImportView.as_view(), name='import'),
+    path('v1/export/', CatalogExportView.as_view(), name='export'),
     path('v1/', include(router.urls)),
     path(
         'v1/schema/',
-        SpectacularAPIView.as_view(),
+        CachedSpectacularAPIView.as_view(),
         name='schema'
     ),
     path(
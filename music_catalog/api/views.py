@@ -1,29 +1,72 @@
+from io import TextIOWrapper
 from typing import Any
 
-from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework import viewsets, generics, status
+from django.db import transaction
+from django.db.models import F, Prefetch, QuerySet
+from django.http import (
+    FileResponse, Http404, StreamingHttpResponse
+)
+from drf_spectacular.utils import (
+    OpenApiParameter, extend_schema, extend_schema_view, inline_serializer
+)
+from drf_spectacular.types import OpenApiTypes
+from rest_framework import (
+    mixins, serializers, viewsets, generics, status
+)
+from rest_framework.decorators import action
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework.reverse import reverse
+from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenRefreshView
 
-from .mixins import PermissionFilterSearchMixin
+from .cache import album_scope, get_cache_stats, musician_scope
+from .profiling import profile_stats
+from .mixins import (
+    BulkMixin, CachedResponseMixin, ConditionalGetMixin, ExpandMixin,
+    NestedParentMixin, PermissionFilterSearchMixin, ProfilingMixin,
+    ReplicaReadMixin, SlugLookupMixin, ValuesListMixin
+)
 from .serializers import (
-    AdminLoginSerializer, MusicianSerializer, SongSerialiser, AlbumSerialiser
+    AdminLoginSerializer, AlbumTracklistSerializer, CatalogImportSerializer,
+    JobCreateSerializer, JobSerializer, MusicianSerializer, MusicianValuesSerializer,
+    MusicianWithAlbumsSerializer, SongSerialiser, SongValuesSerializer,
+    AlbumSerialiser, AlbumValuesSerializer, AlbumWithSongsSerialiser
+)
+from .throttling import LoginIPThrottle, LoginUsernameThrottle
+from constants import (
+    JOB_SCHEMA, MUSICIAN_SCHEMA, SONG_SCHEMA, ALBUM_SCHEMA
 )
-from constants import MUSICIAN_SCHEMA, SONG_SCHEMA, ALBUM_SCHEMA
-from music.models import User, Musician, Song, Album
+from jobs.handlers import job_path
+from jobs.models import Job
+from music.bulk import (
+    create_albums, create_musicians, delete_albums, delete_musicians,
+    update_albums, update_musicians
+)
+from music.exporter import EXPORT_FORMATS, export_catalog
+from music.importer import import_catalog
+from music.models import User, Musician, Song, Album, AlbumSong
 
 
 class AdminLoginView(generics.CreateAPIView):
-    """Представление для выполнения входа администратора."""
+    """
+    Представление для выполнения входа администратора.
+    Попытки входа ограничиваются по IP-адресу и имени пользователя.
+    """
     serializer_class = AdminLoginSerializer
+    authentication_classes = ()
+    throttle_classes = (LoginIPThrottle, LoginUsernameThrottle)
 
     @extend_schema(
         summary='Вход в систему.',
         responses={
-            status.HTTP_200_OK: TokenRefreshSerializer
+            status.HTTP_200_OK: inline_serializer('TokenPair', {
+                'access': serializers.CharField(),
+                'refresh': serializers.CharField(),
+            })
         }
     )
     def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
@@ -35,49 +78,376 @@ class AdminLoginView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user: User = serializer.context['user']
         refresh = RefreshToken.for_user(user)
-        return Response({'access': str(refresh.access_token)})
+        # Права проверяются по утверждению без запроса пользователя.
+        refresh['is_staff'] = user.is_staff
+        return Response({
+            'access': str(refresh.access_token), 'refresh': str(refresh)
+        })
+
+
+class AdminTokenRefreshView(TokenRefreshView):
+    """
+    Представление для получения нового токена доступа по токену
+    обновления без повторной проверки пароля.
+    """
+    @extend_schema(summary='Обновление токена доступа.')
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Возвращает новый токен доступа."""
+        return super().post(request, *args, **kwargs)
 
 
 @extend_schema_view(**MUSICIAN_SCHEMA)
-class MusicianViewSet(PermissionFilterSearchMixin, viewsets.ModelViewSet):
+class MusicianViewSet(
+    ProfilingMixin, ReplicaReadMixin, ConditionalGetMixin,
+    CachedResponseMixin, ExpandMixin, BulkMixin, PermissionFilterSearchMixin,
+    SlugLookupMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """Представление для управления информацией об исполнителях музыки."""
     queryset = Musician.objects.all()
     serializer_class = MusicianSerializer
+    values_serializer_class = MusicianValuesSerializer
+    expand_serializers = {'albums': MusicianWithAlbumsSerializer}
     lookup_field = 'slug'
     lookup_url_kwarg = 'musician'
 
+    def get_queryset(self) -> QuerySet[Musician]:
+        """С 'expand=albums' альбомы предзагружаются одним запросом."""
+        queryset: QuerySet[Musician] = super().get_queryset()
+        if self.get_expand() == 'albums':
+            queryset = queryset.prefetch_related('albums')
+        return queryset
+
+    def perform_bulk_create(self, items: list[dict[str, Any]]) -> int:
+        """Создает исполнителей одним запросом."""
+        return create_musicians(items)
+
+    def perform_bulk_update(
+        self, objects: list[Musician], fields: set[str]
+    ) -> int:
+        """Сохраняет изменения исполнителей одним запросом."""
+        return update_musicians(objects, fields)
+
+    def perform_bulk_destroy(self, queryset: QuerySet[Musician]) -> int:
+        """Удаляет исполнителей вместе с их альбомами."""
+        return delete_musicians(queryset)
+
 
 @extend_schema_view(**SONG_SCHEMA)
-class SongViewSet(PermissionFilterSearchMixin, viewsets.ModelViewSet):
+class SongViewSet(
+    ProfilingMixin, ReplicaReadMixin, ConditionalGetMixin,
+    CachedResponseMixin, NestedParentMixin, PermissionFilterSearchMixin,
+    SlugLookupMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """Представление для управления информацией о музыкальных произведениях."""
     serializer_class = SongSerialiser
+    values_serializer_class = SongValuesSerializer
     lookup_field = 'slug'
     lookup_url_kwarg = 'song'
+    parent_url_kwargs = ('musician', 'album')
+    keyset_ordering = ('number_in_album', 'id')
+    conditional_fields = (
+        'song__modified', 'album__modified', 'album__musician__modified'
+    )
+    conditional_lookup = 'song__slug'
 
-    def get_queryset(self) -> Song:
-        """Оптимизирует запрос музыкальных произведений."""
-        return Song.objects.filter(albums=self.get_album())
+    def get_queryset(self) -> QuerySet[Song]:
+        """
+        Оптимизирует запрос музыкальных произведений:
+        порядковый номер в альбоме выбирается тем же запросом.
+        """
+        return Song.objects.filter(
+            songs__album=self.get_album()
+        ).annotate(number_in_album=F('songs__number_in_album'))
 
-    def get_album(self) -> Album:
-        """Получает объект альбома по параметрам URL."""
-        return get_object_or_404(Album, slug=self.kwargs['album'])
+    def get_conditional_queryset(self) -> QuerySet[AlbumSong]:
+        """
+        Песни альбома из URL вместе с альбомом и исполнителем,
+        выбираемые без отдельного запроса альбома.
+        """
+        return AlbumSong.objects.filter(
+            album__slug=self.kwargs['album'],
+            album__musician__slug=self.kwargs['musician']
+        )
+
+    def get_cache_scopes(self) -> list[str]:
+        """Песни зависят от исполнителя и альбома из URL."""
+        return [
+            musician_scope(self.kwargs['musician']),
+            album_scope(self.kwargs['album'])
+        ]
 
 
 @extend_schema_view(**ALBUM_SCHEMA)
-class AlbumViewSet(PermissionFilterSearchMixin, viewsets.ModelViewSet):
+class AlbumViewSet(
+    ProfilingMixin, ReplicaReadMixin, ConditionalGetMixin,
+    CachedResponseMixin, ExpandMixin, BulkMixin, NestedParentMixin,
+    PermissionFilterSearchMixin, SlugLookupMixin, ValuesListMixin,
+    viewsets.ModelViewSet
+):
     """Представление для управления информацией об альбомах."""
     serializer_class = AlbumSerialiser
+    values_serializer_class = AlbumValuesSerializer
+    expand_serializers = {'songs': AlbumWithSongsSerialiser}
     lookup_field = 'slug'
     lookup_url_kwarg = 'album'
+    conditional_fields = ('modified', 'musician__modified')
+
+    def get_cache_scopes(self) -> list[str]:
+        """
+        Альбомы зависят от исполнителя из URL,
+        а альбом с песнями - еще и от песен альбома.
+        """
+        scopes: list[str] = [musician_scope(self.kwargs['musician'])]
+        if self.get_expand() == 'songs':
+            scopes.append(album_scope(self.kwargs['album']))
+        return scopes
+
+    def get_conditional_fields(self) -> tuple[str, ...]:
+        """Альбом с песнями меняется и при изменении песен."""
+        if self.get_expand() == 'songs':
+            return (*self.conditional_fields, 'albums__song__modified')
+        return self.conditional_fields
+
+    def get_queryset(self) -> QuerySet[Album]:
+        """
+        Оптимизирует запрос альбомов: исполнитель присоединяется,
+        а с 'expand=songs' песни альбома предзагружаются одним запросом
+        в порядке номеров в альбоме.
+        """
+        queryset: QuerySet[Album] = Album.objects.filter(
+            musician__slug=self.kwargs['musician']
+        ).select_related('musician')
+        if self.get_expand() == 'songs':
+            queryset = queryset.prefetch_related(Prefetch(
+                'albums', queryset=AlbumSong.objects.select_related(
+                    'song'
+                ).order_by('number_in_album')
+            ))
+        return queryset
+
+    def perform_bulk_create(self, items: list[dict[str, Any]]) -> int:
+        """Создает альбомы исполнителя из URL одним запросом."""
+        return create_albums(self.get_musician(), items)
 
-    def get_musician(self) -> Musician:
-        """Получает объект музыканта по параметрам URL."""
-        return get_object_or_404(Musician, slug=self.kwargs['musician'])
+    def perform_bulk_update(
+        self, objects: list[Album], fields: set[str]
+    ) -> int:
+        """Сохраняет изменения альбомов исполнителя одним запросом."""
+        return update_albums(self.get_musician(), objects, fields)
 
-    def get_queryset(self) -> Album:
-        """Оптимизирует запрос запрос альбомов."""
-        return Album.objects.filter(musician=self.get_musician())
+    def perform_bulk_destroy(self, queryset: QuerySet[Album]) -> int:
+        """Удаляет альбомы и пересчитывает счетчики исполнителя."""
+        return delete_albums(self.get_musician(), queryset)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Возвращает альбомы исполнителя.
+        Существование исполнителя проверяется, только если альбомов нет.
+        """
+        response: Response = super().list(request, *args, **kwargs)
+        if (
+            response.status_code == status.HTTP_200_OK
+            and not response.data['results']
+        ):
+            self.get_musician()
+        return response
 
+    @transaction.atomic
     def perform_create(self, serializer: AlbumSerialiser) -> None:
-        """Создает новый альбом и связывает его с музыкантом."""
+        """
+        Создает новый альбом и связывает его с музыкантом.
+        Счетчики исполнителя обновляются в той же транзакции.
+        """
         serializer.save(musician=self.get_musician())
+
+    @action(
+        detail=True, methods=['put'],
+        serializer_class=AlbumTracklistSerializer
+    )
+    def tracklist(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Response:
+        """Заменяет список песен альбома за постоянное число запросов."""
+        serializer: AlbumTracklistSerializer = self.get_serializer(
+            self.get_object(), data=request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
+class CacheStatsView(APIView):
+    """Представление статистики кэша ответов каталога."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary='Статистика кэша.',
+        description=(
+            'Количество попаданий и промахов кэша ответов каталога. '
+            'Доступно только администратору.'
+        ),
+        responses={status.HTTP_200_OK: OpenApiTypes.OBJECT}
+    )
+    def get(self, request: Request) -> Response:
+        """Возвращает количество попаданий и промахов кэша."""
+        return Response(get_cache_stats())
+
+
+class ProfilingStatsView(APIView):
+    """Представление статистики профилирования запросов."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary='Статистика профилирования.',
+        description=(
+            'Самые медленные представления и самые частые SQL-запросы '
+            'текущего процесса. Собирается при включенной настройке '
+            'CATALOG_PROFILING. Доступно только администратору.'
+        ),
+        parameters=[
+            OpenApiParameter(
+                'limit', int, description='Количество записей (10).'
+            ),
+        ],
+        responses={status.HTTP_200_OK: OpenApiTypes.OBJECT}
+    )
+    def get(self, request: Request) -> Response:
+        """Возвращает накопленную статистику."""
+        try:
+            limit: int = int(request.query_params.get('limit', 10))
+        except ValueError:
+            limit = 10
+        return Response(profile_stats.as_dict(limit))
+
+    @extend_schema(
+        summary='Сбросить статистику профилирования.',
+        responses={status.HTTP_204_NO_CONTENT: None}
+    )
+    def delete(self, request: Request) -> Response:
+        """Очищает накопленную статистику."""
+        profile_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class CatalogImportView(generics.GenericAPIView):
+    """Представление для массовой загрузки каталога из файла."""
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+    serializer_class = CatalogImportSerializer
+
+    @extend_schema(
+        summary='Загрузить каталог.',
+        description=(
+            'Загружает исполнителей, альбомы и песни из файла NDJSON '
+            'или CSV частями в отдельных транзакциях. '
+            'Доступно только администратору.'
+        ),
+        responses={status.HTTP_200_OK: OpenApiTypes.OBJECT}
+    )
+    def post(self, request: Request) -> Response:
+        """Загружает файл и возвращает итоги загрузки."""
+        serializer: CatalogImportSerializer = self.get_serializer(
+            data=request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        report = import_catalog(
+            TextIOWrapper(
+                serializer.validated_data['file'],
+                encoding='utf-8', newline=''
+            ),
+            serializer.validated_data['format'],
+            chunk_size=serializer.validated_data['chunk_size']
+        )
+        return Response(report.as_dict())
+
+
+class CatalogExportView(APIView):
+    """Представление для потоковой выгрузки всего каталога."""
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary='Выгрузить каталог.',
+        description=(
+            'Выгружает всех исполнителей с альбомами и песнями потоком '
+            'NDJSON или CSV. Доступно только администратору.'
+        ),
+        parameters=[
+            OpenApiParameter(
+                'output', str, enum=list(EXPORT_FORMATS),
+                description='Формат выгрузки, по умолчанию ndjson.'
+            ),
+        ],
+        responses={status.HTTP_200_OK: OpenApiTypes.BINARY}
+    )
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """Возвращает каталог потоком строк."""
+        file_format: str = request.query_params.get('output', 'ndjson')
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {'output': 'Допустимые форматы: '
+                 f'{", ".join(EXPORT_FORMATS)}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return StreamingHttpResponse(
+            export_catalog(file_format),
+            content_type=EXPORT_FORMATS[file_format],
+            headers={
+                'Content-Disposition':
+                f'attachment; filename="catalog.{file_format}"'
+            }
+        )
+
+
+@extend_schema_view(**JOB_SCHEMA)
+class JobViewSet(
+    mixins.CreateModelMixin, mixins.ListModelMixin,
+    mixins.RetrieveModelMixin, viewsets.GenericViewSet
+):
+    """
+    Представление фоновых задач. Задача ставится в очередь
+    и выполняется командой 'run_jobs', а ее статус и прогресс
+    запрашиваются по ссылке из ответа.
+    """
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    permission_classes = [IsAdminUser]
+    parser_classes = [JSONParser, MultiPartParser]
+    keyset_ordering = ('-id',)
+
+    def get_serializer_class(self) -> type[serializers.Serializer]:
+        """Для постановки в очередь используется отдельный сериализатор."""
+        if self.action == 'create':
+            return JobCreateSerializer
+        return super().get_serializer_class()
+
+    @extend_schema(responses={status.HTTP_202_ACCEPTED: JobSerializer})
+    def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Ставит задачу в очередь и возвращает ее со статусом 202."""
+        serializer: JobCreateSerializer = self.get_serializer(
+            data=request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        job: Job = serializer.save()
+        return Response(
+            serializer.data, status=status.HTTP_202_ACCEPTED,
+            headers={'Location': reverse(
+                'jobs-detail', kwargs={'pk': job.pk}, request=request
+            )}
+        )
+
+    @extend_schema(responses={status.HTTP_200_OK: OpenApiTypes.BINARY})
+    @action(detail=True)
+    def result(self, request: Request, pk: str) -> FileResponse:
+        """Возвращает файл выгрузки выполненной задачи."""
+        job: Job = self.get_object()
+        if (
+            job.kind != Job.Kind.EXPORT_CATALOG
+            or job.status != Job.Status.SUCCEEDED
+            or not job_path(job.result['file']).is_file()
+        ):
+            raise Http404
+        return FileResponse(
+            job_path(job.result['file']).open('rb'), as_attachment=True,
+            filename=f'catalog.{job.result["format"]}',
+            content_type=EXPORT_FORMATS[job.result['format']]
+        )
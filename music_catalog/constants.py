@@ -1,13 +1,52 @@
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 
 SONGS_IN_ALBUM: int = 50
 
+CURSOR_PAGINATION_MODE: str = 'cursor'
+
+EXPAND_QUERY_PARAM: str = 'expand'
+
+BULK_CHUNK_SIZE: int = 500
+
+BULK_MAX_ITEMS: int = 10000
+
 DESCRIPTION_PROJECT = (
     'Проект Django Rest Framework (DRF) представляет собой веб-приложение '
     'для управления информацией о музыкальных исполнителях, их альбомах и '
     'содержащихся в них песнях.'
 )
 
+BULK_DESCRIPTION: str = (
+    'Со списком в теле запроса обрабатывает до {} объектов частями '
+    'по {} в отдельных транзакциях и возвращает количество обработанных '
+    'объектов и ошибки с индексами объектов в списке. '
+    'Доступно только администратору.'
+).format(BULK_MAX_ITEMS, BULK_CHUNK_SIZE)
+
+
+BULK_SCHEMA: dict[str, extend_schema] = {
+    'bulk_update': extend_schema(
+        summary='Массово изменить объекты.',
+        description=(
+            'Изменить объекты, найденные по полю "slug". ' + BULK_DESCRIPTION
+        ),
+        request={'application/json': {
+            'type': 'array', 'items': {'type': 'object'}
+        }},
+        responses={200: OpenApiTypes.OBJECT},
+    ),
+    'bulk_destroy': extend_schema(
+        summary='Массово удалить объекты.',
+        description='Удалить объекты по слагам. ' + BULK_DESCRIPTION,
+        request={'application/json': {
+            'type': 'array', 'items': {'type': 'string'}
+        }},
+        responses={200: OpenApiTypes.OBJECT},
+    ),
+}
+
+
 MUSICIAN_SCHEMA: dict[str, extend_schema] = {
     'list': extend_schema(
         summary='Получить всех исполнителей.',
@@ -20,15 +59,23 @@ MUSICIAN_SCHEMA: dict[str, extend_schema] = {
         summary='Создать исполнителя.',
         description=(
             'Создать информацию о исполнителе музыки. '
-            'Доступно только администратору.'
+            'Доступно только администратору. '
+            'Со списком исполнителей создает их массово.'
         ),
     ),
     'retrieve': extend_schema(
         summary='Получить исполнителя.',
         description=(
             'Получить информацию о конкретном исполнителе музыки. '
-            'Доступно всем пользователям.'
+            'С параметром "expand=albums" возвращает исполнителя '
+            'вместе с альбомами. Доступно всем пользователям.'
         ),
+        parameters=[
+            OpenApiParameter(
+                EXPAND_QUERY_PARAM, str, enum=['albums'],
+                description='Вложить в ответ альбомы исполнителя.'
+            ),
+        ],
     ),
     'update': extend_schema(
         summary='Обновить информацию исполнителя.',
@@ -110,15 +157,24 @@ ALBUM_SCHEMA: dict[str, extend_schema] = {
         summary='Создать альбом.',
         description=(
             'Создать информацию о новом альбоме. '
-            'Доступно только администратору.'
+            'Доступно только администратору. '
+            'Со списком альбомов создает их массово.'
         ),
     ),
     'retrieve': extend_schema(
         summary='Получить альбом.',
         description=(
             'Получить информацию о конкретном альбоме. '
+            'С параметром "expand=songs" возвращает альбом '
+            'вместе со всеми песнями по порядку. '
             'Доступно всем пользователям.'
         ),
+        parameters=[
+            OpenApiParameter(
+                EXPAND_QUERY_PARAM, str, enum=['songs'],
+                description='Вложить в ответ песни альбома.'
+            ),
+        ],
     ),
     'update': extend_schema(
         summary='Обновить информацию о альбоме.',
@@ -141,4 +197,48 @@ ALBUM_SCHEMA: dict[str, extend_schema] = {
             'Доступно только администратору.'
         ),
     ),
+    'tracklist': extend_schema(
+        summary='Заменить список песен альбома.',
+        description=(
+            'Заменить все песни альбома списком песен по порядку. '
+            'Песни находятся по слагам, отсутствующие создаются. '
+            'Изменения применяются в одной транзакции. '
+            'Доступно только администратору.'
+        ),
+    ),
+}
+
+JOB_SCHEMA: dict[str, extend_schema] = {
+    'list': extend_schema(
+        summary='Получить фоновые задачи.',
+        description=(
+            'Получить фоновые задачи, начиная с последней. '
+            'Доступно только администратору.'
+        ),
+    ),
+    'create': extend_schema(
+        summary='Поставить фоновую задачу в очередь.',
+        description=(
+            'Поставить в очередь загрузку или выгрузку каталога, '
+            'пересчет счетчиков или перестроение поискового индекса. '
+            'Задачу выполняет команда "run_jobs"; для загрузки '
+            'каталога нужен файл NDJSON или CSV. Возвращает задачу '
+            'со ссылкой на нее в заголовке Location. '
+            'Доступно только администратору.'
+        ),
+    ),
+    'retrieve': extend_schema(
+        summary='Получить фоновую задачу.',
+        description=(
+            'Получить статус, прогресс и результат фоновой задачи. '
+            'Доступно только администратору.'
+        ),
+    ),
+    'result': extend_schema(
+        summary='Скачать выгрузку каталога.',
+        description=(
+            'Скачать файл выполненной задачи выгрузки каталога. '
+            'Доступно только администратору.'
+        ),
+    ),
 }
@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+def configure_sqlite(
+    sender: type, connection: BaseDatabaseWrapper, **kwargs: Any
+) -> None:
+    """
+    Применяет PRAGMA из настройки 'SQLITE_PRAGMAS' к новому
+    соединению SQLite: журнал WAL позволяет читать во время записи,
+    а 'busy_timeout' заставляет ждать блокировку вместо ошибки.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {pragma} = {value}')
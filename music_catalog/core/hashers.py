@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, ScryptPasswordHasher
+)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """
+    scrypt со стоимостью из настройки 'SCRYPT_WORK_FACTOR'.
+    После изменения стоимости хэш пересчитывается при следующем входе.
+    """
+    work_factor = settings.SCRYPT_WORK_FACTOR
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id с параметрами из настроек 'ARGON2_TIME_COST',
+    'ARGON2_MEMORY_COST' и 'ARGON2_PARALLELISM'.
+    Требует пакет 'argon2-cffi'.
+    """
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
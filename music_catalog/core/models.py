@@ -15,3 +15,14 @@ class NameSlugField(models.Model):
     def __str__(self) -> str:
         """Возвращает строковое представление 'name'."""
         return self.name
+
+
+class ModifiedField(models.Model):
+    """
+    Абстрактная модель, включающая в себя поле 'modified'
+    с датой последнего изменения объекта.
+    """
+    modified = models.DateTimeField('Дата изменения', auto_now=True)
+
+    class Meta:
+        abstract = True
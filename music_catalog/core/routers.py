@@ -0,0 +1,53 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from random import choice
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+
+replica_reads_enabled: ContextVar[bool] = ContextVar(
+    'replica_reads_enabled', default=False
+)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Направляет чтение внутри блока на реплики."""
+    token = replica_reads_enabled.set(True)
+    try:
+        yield
+    finally:
+        replica_reads_enabled.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Маршрутизатор основной базы и реплик из 'DATABASE_REPLICAS'.
+    Чтение идет на случайную реплику только внутри 'replica_reads',
+    остальное чтение и любая запись - на основную базу.
+    После записи чтение до конца блока тоже идет на основную базу,
+    чтобы запрос видел свои изменения. Чтение внутри транзакции
+    основной базы тоже остается в ней.
+    """
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:
+        """
+        Возвращает реплику, если чтение с реплик разрешено
+        и основная база не в транзакции.
+        """
+        if (
+            settings.DATABASE_REPLICAS and replica_reads_enabled.get()
+            and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return choice(settings.DATABASE_REPLICAS)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:
+        """Возвращает основную базу и запрещает дальнейшее чтение с реплик."""
+        replica_reads_enabled.set(False)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+        """Реплики содержат те же данные, что и основная база."""
+        return True
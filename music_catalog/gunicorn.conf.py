@@ -0,0 +1,44 @@
+"""
+Настройки gunicorn для запуска в production.
+
+По умолчанию запускается WSGI-приложение 'music_catalog.wsgi'
+в многопоточных воркерах gthread: асинхронных представлений нет,
+и в нагрузочном тесте uvicorn медленнее. SERVER_INTERFACE=asgi
+запускает ASGI-приложение в воркерах uvicorn.
+
+Кэш ответов, состояние пользователей для JWT и ограничения входа
+хранятся в кэше Django. С общим кэшем (REDIS_URL) по умолчанию
+запускается по одному процессу на ядро процессора. Контейнер без
+REDIS_URL запускает локальный Redis (docker-entrypoint.sh), поэтому
+по умолчанию тоже работает в нескольких процессах. Без общего кэша
+он свой у каждого процесса: запускается один процесс, а больше
+одного не допускается.
+"""
+from multiprocessing import cpu_count
+from os import getenv
+from pathlib import Path
+
+INTERFACES: dict[str, tuple[str, str]] = {
+    'asgi': (
+        'music_catalog.asgi:application', 'uvicorn.workers.UvicornWorker'
+    ),
+    'wsgi': ('music_catalog.wsgi:application', 'gthread'),
+}
+
+interface: str = getenv('SERVER_INTERFACE', 'wsgi')
+wsgi_app, worker_class = INTERFACES[interface]
+
+chdir = str(Path(__file__).resolve().parent)
+bind = getenv('GUNICORN_BIND', '0.0.0.0:8000')
+shared_cache: bool = bool(getenv('REDIS_URL'))
+workers = int(getenv('GUNICORN_WORKERS', cpu_count() if shared_cache else 1))
+if workers > 1 and not shared_cache:
+    raise SystemExit(
+        'GUNICORN_WORKERS > 1 требует общего кэша: задайте REDIS_URL.'
+    )
+threads = int(getenv('GUNICORN_THREADS', 4))
+timeout = int(getenv('GUNICORN_TIMEOUT', 60))
+keepalive = 5
+max_requests = int(getenv('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+accesslog = '-'
@@ -0,0 +1,108 @@
+from io import TextIOWrapper
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from .models import Job
+from music.bulk import repair_catalog_counters
+from music.exporter import export_catalog
+from music.importer import import_catalog
+from music.models import Musician
+from music.search import SearchBackend, get_search_backend
+
+# Получает количество выполненных шагов и общее количество шагов.
+Progress = Callable[[int, int], None]
+
+
+def job_path(name: str) -> Path:
+    """Возвращает путь файла задачи в каталоге 'JOBS_DIR'."""
+    return Path(settings.JOBS_DIR) / Path(name).name
+
+
+def save_upload(upload: UploadedFile) -> str:
+    """
+    Сохраняет загруженный файл в 'JOBS_DIR' под уникальным именем
+    и возвращает это имя.
+    """
+    name: str = f'import-{uuid4().hex}-{Path(upload.name).name}'
+    path: Path = job_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('wb') as stream:
+        for chunk in upload.chunks():
+            stream.write(chunk)
+    return name
+
+
+def import_catalog_job(job: Job, progress: Progress) -> dict[str, Any]:
+    """
+    Загружает каталог из сохраненного файла. Прогресс считается
+    по прочитанной части файла. Загруженные строки при повторной
+    попытке пропускаются, поэтому повтор безопасен.
+    После успешной загрузки файл удаляется.
+    """
+    path: Path = job_path(job.params['file'])
+    size: int = path.stat().st_size
+    with path.open('rb') as raw:
+        report = import_catalog(
+            TextIOWrapper(raw, encoding='utf-8', newline=''),
+            job.params['format'], chunk_size=job.params['chunk_size'],
+            progress=lambda current: progress(raw.tell(), size)
+        )
+    path.unlink()
+    return report.as_dict()
+
+
+def export_catalog_job(job: Job, progress: Progress) -> dict[str, Any]:
+    """
+    Выгружает каталог во временный файл и переименовывает его
+    после завершения, поэтому файл результата всегда полный.
+    Прогресс считается по количеству выгруженных исполнителей.
+    """
+    file_format: str = job.params['format']
+    name: str = f'export-{job.pk}.{file_format}'
+    path: Path = job_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial: Path = path.with_name(f'{name}.part')
+    total: int = Musician.objects.count()
+    with partial.open('w', encoding='utf-8', newline='') as stream:
+        stream.writelines(export_catalog(
+            file_format, job.params['chunk_size'],
+            progress=lambda done: progress(done, total)
+        ))
+    partial.replace(path)
+    return {
+        'file': name,
+        'format': file_format,
+        'musicians': total,
+        'bytes': path.stat().st_size,
+    }
+
+
+def repair_counters_job(job: Job, progress: Progress) -> dict[str, Any]:
+    """
+    Пересчитывает счетчики каталога одной транзакцией
+    и сбрасывает кэш исправленных объектов после ее фиксации.
+    """
+    with transaction.atomic():
+        return repair_catalog_counters()
+
+
+def rebuild_search_index_job(
+    job: Job, progress: Progress
+) -> dict[str, Any]:
+    """Перестраивает поисковый индекс."""
+    backend: SearchBackend = get_search_backend(DEFAULT_DB_ALIAS)
+    backend.rebuild(connections[DEFAULT_DB_ALIAS])
+    return {'backend': type(backend).__name__}
+
+
+HANDLERS: dict[str, Callable[[Job, Progress], dict[str, Any]]] = {
+    Job.Kind.IMPORT_CATALOG: import_catalog_job,
+    Job.Kind.EXPORT_CATALOG: export_catalog_job,
+    Job.Kind.REPAIR_COUNTERS: repair_counters_job,
+    Job.Kind.REBUILD_SEARCH_INDEX: rebuild_search_index_job,
+}
@@ -0,0 +1,115 @@
+import signal
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from os import getpid
+from socket import gethostname
+from threading import Event
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from jobs.models import Job
+from jobs.pool import create_pool
+from jobs.queue import (
+    claim_job, fail_lost_jobs, release_job, renew_leases, run_job
+)
+
+
+class Command(BaseCommand):
+    """Команда для выполнения фоновых задач из очереди."""
+    help = (
+        'Выполняет фоновые задачи из очереди в пуле процессов. '
+        'SIGTERM и Ctrl+C останавливают воркер после завершения '
+        'начатых задач.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--workers', type=int, default=settings.JOBS_WORKERS,
+            help='Количество одновременно выполняемых задач.'
+        )
+        parser.add_argument(
+            '--poll-interval', type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help='Пауза в секундах между проверками очереди.'
+        )
+        parser.add_argument(
+            '--kind', action='append', choices=Job.Kind.values,
+            dest='kinds', help='Выполнять только задачи этого типа.'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Выполнить готовые задачи и завершиться.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Захватывает задачи, пока в пуле есть свободные процессы,
+        и на каждой итерации продлевает захват выполняемых задач.
+        """
+        self.stopping = Event()
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        worker: str = f'{gethostname()}:{getpid()}'
+        workers: int = options['workers']
+        running: dict[Future, Job] = {}
+        pool: ProcessPoolExecutor = create_pool(workers)
+        self.stdout.write(f'Воркер {worker} запущен, процессов: {workers}.')
+        try:
+            while not self.stopping.is_set():
+                renew_leases(running.values())
+                fail_lost_jobs()
+                while len(running) < workers:
+                    job: Job | None = claim_job(worker, options['kinds'])
+                    if job is None:
+                        break
+                    self.stdout.write(f'Задача #{job.pk} {job.kind} начата.')
+                    running[pool.submit(run_job, job.pk)] = job
+                if not running:
+                    if options['once']:
+                        break
+                    self.stopping.wait(options['poll_interval'])
+                    continue
+                done, _ = wait(
+                    running, timeout=options['poll_interval'],
+                    return_when=FIRST_COMPLETED
+                )
+                if not all(self.finish(future, running) for future in done):
+                    # Упавший процесс ломает весь пул: остальные задачи
+                    # пула тоже завершены ошибкой и возвращаются в очередь.
+                    for future in list(running):
+                        self.finish(future, running)
+                    pool.shutdown(wait=True)
+                    pool = create_pool(workers)
+        finally:
+            while running:
+                renew_leases(running.values())
+                done, _ = wait(running, timeout=options['poll_interval'])
+                for future in done:
+                    self.finish(future, running)
+            pool.shutdown(wait=True)
+        self.stdout.write(self.style.SUCCESS(f'Воркер {worker} остановлен.'))
+
+    def finish(self, future: Future, running: dict[Future, Job]) -> bool:
+        """
+        Выводит итог выполненной задачи. Если процесс задачи упал,
+        возвращает ее в очередь или завершает ошибкой и возвращает False.
+        """
+        job_id: int = running.pop(future).pk
+        try:
+            status: str = future.result()
+        except BrokenProcessPool as error:
+            release_job(job_id, f'Процесс воркера упал: {error}')
+            self.stderr.write(f'Задача #{job_id}: процесс воркера упал.')
+            return False
+        except Exception as error:
+            status = release_job(job_id, f'{type(error).__name__}: {error}')
+        self.stdout.write(f'Задача #{job_id}: {Job.Status(status).label}.')
+        return True
+
+    def stop(self, signum: int, frame: Any) -> None:
+        """Останавливает захват новых задач."""
+        self.stopping.set()
@@ -0,0 +1,63 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Модель фоновой задачи. Задачи выполняет команда 'run_jobs':
+    свободная задача захватывается условным обновлением строки,
+    поэтому одну задачу не выполнят два воркера.
+    """
+    class Kind(models.TextChoices):
+        IMPORT_CATALOG = 'import_catalog', 'Загрузка каталога'
+        EXPORT_CATALOG = 'export_catalog', 'Выгрузка каталога'
+        REPAIR_COUNTERS = 'repair_counters', 'Пересчет счетчиков'
+        REBUILD_SEARCH_INDEX = (
+            'rebuild_search_index', 'Перестроение поискового индекса'
+        )
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'В очереди'
+        RUNNING = 'running', 'Выполняется'
+        SUCCEEDED = 'succeeded', 'Выполнена'
+        FAILED = 'failed', 'Ошибка'
+
+    kind = models.CharField('Тип', max_length=32, choices=Kind.choices)
+    params = models.JSONField('Параметры', default=dict, blank=True)
+    status = models.CharField(
+        'Статус', max_length=16, choices=Status.choices,
+        default=Status.QUEUED
+    )
+    progress = models.PositiveSmallIntegerField('Прогресс, %', default=0)
+    result = models.JSONField('Результат', null=True, blank=True)
+    error = models.TextField('Ошибка', blank=True)
+    attempts = models.PositiveSmallIntegerField('Попытки', default=0)
+    max_attempts = models.PositiveSmallIntegerField(
+        'Максимум попыток', default=1
+    )
+    run_after = models.DateTimeField(
+        'Выполнить после', default=timezone.now
+    )
+    locked_until = models.DateTimeField(
+        'Захвачена до', null=True, blank=True
+    )
+    worker = models.CharField('Воркер', max_length=100, blank=True)
+    created = models.DateTimeField('Дата создания', auto_now_add=True)
+    started = models.DateTimeField('Дата запуска', null=True, blank=True)
+    finished = models.DateTimeField(
+        'Дата завершения', null=True, blank=True
+    )
+
+    class Meta:
+        verbose_name = 'Фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        ordering = ['-id']
+        indexes = [
+            models.Index(
+                fields=['status', 'run_after'], name='job_status_run_after_idx'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Возвращает тип и статус задачи."""
+        return f'{self.get_kind_display()} #{self.pk}: {self.status}'
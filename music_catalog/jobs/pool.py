@@ -0,0 +1,27 @@
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+
+
+def init_worker() -> None:
+    """
+    Настраивает Django в дочернем процессе. Ctrl+C обрабатывает
+    родительский процесс, который дожидается начатых задач.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    django.setup()
+
+
+def create_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Создает пул процессов для задач. Процессы запускаются через 'spawn',
+    чтобы не наследовать соединения с базой данных родителя.
+    Модуль не импортирует модели: он загружается в дочернем процессе
+    до настройки Django.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker,
+        mp_context=multiprocessing.get_context('spawn')
+    )
@@ -0,0 +1,171 @@
+import logging
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
+
+from .handlers import HANDLERS
+from .models import Job
+
+logger = logging.getLogger('jobs')
+
+LOST_JOB_ERROR = 'Воркер не завершил задачу за отведенное время.'
+
+
+def enqueue(
+    kind: str, params: dict[str, Any] | None = None,
+    max_attempts: int | None = None
+) -> Job:
+    """Ставит задачу в очередь."""
+    return Job.objects.create(
+        kind=kind, params=params or {},
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS
+    )
+
+
+def lease_until() -> datetime:
+    """Возвращает время окончания захвата задачи, продленного сейчас."""
+    return timezone.now() + timedelta(seconds=settings.JOBS_LEASE_SECONDS)
+
+
+def renew_leases(jobs: Iterable[Job]) -> int:
+    """
+    Продлевает захват выполняемых задач. Воркер вызывает ее
+    на каждой итерации цикла, поэтому захват истекает, только если
+    воркер перестал работать. Попытки, захват которых уже истек
+    и задача которых передана другому воркеру, не продлеваются.
+    """
+    condition = Q()
+    for job in jobs:
+        condition |= Q(pk=job.pk, attempts=job.attempts)
+    if not condition:
+        return 0
+    return Job.objects.filter(
+        condition, status=Job.Status.RUNNING
+    ).update(locked_until=lease_until())
+
+
+def fail_lost_jobs() -> int:
+    """
+    Завершает ошибкой задачи, воркер которых перестал продлевать
+    их захват, если попытки задачи исчерпаны.
+    Остальные такие задачи снова захватывает 'claim_job'.
+    """
+    return Job.objects.filter(
+        status=Job.Status.RUNNING, locked_until__lt=timezone.now(),
+        attempts__gte=F('max_attempts')
+    ).update(
+        status=Job.Status.FAILED, finished=timezone.now(),
+        locked_until=None, error=LOST_JOB_ERROR
+    )
+
+
+def claim_job(worker: str, kinds: Iterable[str] | None = None) -> Job | None:
+    """
+    Захватывает первую готовую к выполнению задачу: задачу из очереди
+    или задачу, захват которой истек. Строка изменяется условным
+    обновлением по статусу и числу попыток, поэтому из нескольких
+    воркеров задачу получает только один, и блокировка строк
+    'select_for_update', которой нет в SQLite, не нужна.
+    """
+    now = timezone.now()
+    candidates = Job.objects.filter(
+        Q(status=Job.Status.QUEUED, run_after__lte=now)
+        | Q(
+            status=Job.Status.RUNNING, locked_until__lt=now,
+            attempts__lt=F('max_attempts')
+        )
+    ).order_by('run_after', 'id')
+    if kinds:
+        candidates = candidates.filter(kind__in=kinds)
+    for pk, status, attempts in candidates.values_list(
+        'pk', 'status', 'attempts'
+    )[:10]:
+        if Job.objects.filter(
+            pk=pk, status=status, attempts=attempts
+        ).update(
+            status=Job.Status.RUNNING, attempts=attempts + 1,
+            started=now, finished=None, locked_until=lease_until(),
+            worker=worker, progress=0
+        ):
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def owned(job: Job) -> QuerySet[Job]:
+    """
+    Возвращает строку задачи, пока ее выполняет эта попытка.
+    После истечения захвата задачу может получить другой воркер,
+    и изменения этой попытки уже не сохраняются.
+    """
+    return Job.objects.filter(
+        pk=job.pk, status=Job.Status.RUNNING, attempts=job.attempts
+    )
+
+
+class JobProgress:
+    """
+    Сохраняет прогресс задачи не чаще раза в 'interval' секунд
+    и при каждом сохранении продлевает захват задачи воркером.
+    """
+    def __init__(self, job: Job, interval: float = 1.0) -> None:
+        self.job = job
+        self.interval = interval
+        self.saved: float = monotonic()
+
+    def __call__(self, done: int, total: int) -> None:
+        """Учитывает выполнение 'done' из 'total' шагов."""
+        if monotonic() - self.saved < self.interval:
+            return
+        self.saved = monotonic()
+        progress: int = min(done * 100 // total, 99) if total > 0 else 0
+        owned(self.job).update(progress=progress, locked_until=lease_until())
+
+
+def retry_or_fail(job: Job, error: str) -> str:
+    """
+    Возвращает задачу в очередь с экспоненциальной задержкой
+    или, если попытки исчерпаны, завершает ее ошибкой.
+    Возвращает новый статус задачи.
+    """
+    if job.attempts < job.max_attempts:
+        delay: int = settings.JOBS_RETRY_DELAY * 2 ** (job.attempts - 1)
+        owned(job).update(
+            status=Job.Status.QUEUED, locked_until=None, error=error,
+            run_after=timezone.now() + timedelta(seconds=delay)
+        )
+        return Job.Status.QUEUED
+    owned(job).update(
+        status=Job.Status.FAILED, locked_until=None, error=error,
+        finished=timezone.now()
+    )
+    return Job.Status.FAILED
+
+
+def release_job(job_id: int, error: str) -> str:
+    """Возвращает в очередь или завершает задачу упавшего воркера."""
+    return retry_or_fail(Job.objects.get(pk=job_id), error)
+
+
+def run_job(job_id: int) -> str:
+    """
+    Выполняет захваченную задачу обработчиком ее типа
+    и сохраняет результат. Исключение обработчика приводит
+    к повторной попытке или к ошибке задачи. Возвращает новый статус.
+    """
+    close_old_connections()
+    job: Job = Job.objects.get(pk=job_id)
+    try:
+        result: dict[str, Any] = HANDLERS[job.kind](job, JobProgress(job))
+    except Exception as error:
+        logger.exception('Задача #%s завершилась ошибкой.', job.pk)
+        return retry_or_fail(job, f'{type(error).__name__}: {error}')
+    owned(job).update(
+        status=Job.Status.SUCCEEDED, progress=100, result=result,
+        error='', locked_until=None, finished=timezone.now()
+    )
+    return Job.Status.SUCCEEDED
@@ -0,0 +1,69 @@
+import json
+from tempfile import TemporaryDirectory
+
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from jobs.models import Job
+from jobs.queue import claim_job, run_job
+from music.models import User, Musician
+
+
+class JobResultTests(TestCase):
+    """Тесты постановки задачи выгрузки и получения ее файла."""
+    url = '/api/v1/jobs/'
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.admin = User.objects.create_superuser('root', password='root')
+        Musician.objects.create(name='Musician', slug='musician')
+
+    def setUp(self) -> None:
+        directory = self.enterContext(TemporaryDirectory())
+        self.enterContext(override_settings(JOBS_DIR=directory))
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_export_result(self) -> None:
+        """Файл выгрузки доступен только после выполнения задачи."""
+        response = self.client.post(
+            self.url, {'kind': Job.Kind.EXPORT_CATALOG}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        result_url: str = f'{response["Location"]}result/'
+        self.assertEqual(
+            self.client.get(result_url).status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+        run_job(claim_job('one').pk)
+        response = self.client.get(response['Location'])
+        self.assertEqual(response.data['status'], Job.Status.SUCCEEDED)
+        self.assertEqual(response.data['result']['musicians'], 1)
+        response = self.client.get(result_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('catalog.ndjson', response['Content-Disposition'])
+        lines: list[dict] = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual([line['slug'] for line in lines], ['musician'])
+
+    def test_result_of_other_kind(self) -> None:
+        """У задач, кроме выгрузки, нет файла результата."""
+        response = self.client.post(
+            self.url, {'kind': Job.Kind.REPAIR_COUNTERS}, format='json'
+        )
+        run_job(claim_job('one').pk)
+        self.assertEqual(
+            self.client.get(f'{response["Location"]}result/').status_code,
+            status.HTTP_404_NOT_FOUND
+        )
+
+    def test_admin_only(self) -> None:
+        """Задачи доступны только администратору."""
+        self.client.force_authenticate(None)
+        self.assertEqual(
+            self.client.get(self.url).status_code,
+            status.HTTP_401_UNAUTHORIZED
+        )
@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import (
+    LOST_JOB_ERROR, claim_job, enqueue, fail_lost_jobs, owned,
+    renew_leases, retry_or_fail, run_job
+)
+
+
+@override_settings(JOBS_RETRY_DELAY=30, JOBS_LEASE_SECONDS=300)
+class JobQueueTests(TestCase):
+    """Тесты захвата, повторов и истечения захвата задач."""
+
+    def expire(self, job: Job) -> None:
+        """Делает захват задачи истекшим."""
+        Job.objects.filter(pk=job.pk).update(
+            locked_until=timezone.now() - timedelta(seconds=1)
+        )
+
+    def test_claim(self) -> None:
+        """Задачи захватываются по порядку и только один раз."""
+        first: Job = enqueue(Job.Kind.REPAIR_COUNTERS)
+        second: Job = enqueue(Job.Kind.REBUILD_SEARCH_INDEX)
+        self.assertIsNone(claim_job('one', [Job.Kind.EXPORT_CATALOG]))
+        job: Job = claim_job('one')
+        self.assertEqual(job.pk, first.pk)
+        self.assertEqual(job.status, Job.Status.RUNNING)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.worker, 'one')
+        self.assertGreater(job.locked_until, timezone.now())
+        self.assertEqual(claim_job('two').pk, second.pk)
+        self.assertIsNone(claim_job('three'))
+
+    def test_retry(self) -> None:
+        """Ошибка возвращает задачу в очередь, пока есть попытки."""
+        enqueue(Job.Kind.REPAIR_COUNTERS, max_attempts=2)
+        job: Job = claim_job('one')
+        self.assertEqual(retry_or_fail(job, 'Error'), Job.Status.QUEUED)
+        job.refresh_from_db()
+        self.assertEqual(job.error, 'Error')
+        self.assertGreater(
+            job.run_after, timezone.now() + timedelta(seconds=20)
+        )
+        self.assertIsNone(claim_job('one'))
+        Job.objects.update(run_after=timezone.now())
+        job = claim_job('one')
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(retry_or_fail(job, 'Error'), Job.Status.FAILED)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertIsNotNone(job.finished)
+
+    def test_lease_expiry(self) -> None:
+        """Задачу с истекшим захватом получает другой воркер."""
+        enqueue(Job.Kind.REPAIR_COUNTERS, max_attempts=2)
+        lost: Job = claim_job('one')
+        self.assertIsNone(claim_job('two'))
+        self.expire(lost)
+        job: Job = claim_job('two')
+        self.assertEqual(job.pk, lost.pk)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.worker, 'two')
+        self.assertFalse(owned(lost).exists())
+        self.assertTrue(owned(job).exists())
+
+    def test_renew_leases(self) -> None:
+        """Продленный захват не истекает, старая попытка не продлевается."""
+        enqueue(Job.Kind.REPAIR_COUNTERS, max_attempts=2)
+        job: Job = claim_job('one')
+        self.expire(job)
+        self.assertEqual(renew_leases([job]), 1)
+        self.assertIsNone(claim_job('two'))
+        self.expire(job)
+        self.assertEqual(claim_job('two').attempts, 2)
+        self.assertEqual(renew_leases([job]), 0)
+        self.assertEqual(renew_leases([]), 0)
+
+    def test_fail_lost_jobs(self) -> None:
+        """Потерянная задача без попыток завершается ошибкой."""
+        enqueue(Job.Kind.REPAIR_COUNTERS, max_attempts=1)
+        job: Job = claim_job('one')
+        self.assertEqual(fail_lost_jobs(), 0)
+        self.expire(job)
+        self.assertIsNone(claim_job('two'))
+        self.assertEqual(fail_lost_jobs(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertEqual(job.error, LOST_JOB_ERROR)
+        self.assertIsNone(job.locked_until)
+        self.assertEqual(run_job(job.pk), Job.Status.SUCCEEDED)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+
+    def test_run_job(self) -> None:
+        """Результат обработчика сохраняется в задаче."""
+        enqueue(Job.Kind.REPAIR_COUNTERS)
+        job: Job = claim_job('one')
+        self.assertEqual(run_job(job.pk), Job.Status.SUCCEEDED)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(job.progress, 100)
+        self.assertIsNone(job.locked_until)
+        self.assertIsInstance(job.result, dict)
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from time import sleep
+from typing import Any
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+
+from jobs.handlers import HANDLERS, Progress
+from jobs.models import Job
+from jobs.queue import enqueue
+
+
+def slow_job(job: Job, progress: Progress) -> dict[str, Any]:
+    """Выполняется дольше захвата и не сообщает о прогрессе."""
+    sleep(2.5)
+    return {'done': True}
+
+
+@override_settings(JOBS_LEASE_SECONDS=1)
+class RunJobsTests(TransactionTestCase):
+    """
+    Тесты команды 'run_jobs'. Задачи выполняются в пуле потоков:
+    процессы пула не видят тестовую базу данных.
+    """
+
+    def test_lease_renewed(self) -> None:
+        """Задача дольше захвата выполняется один раз."""
+        job: Job = enqueue(Job.Kind.REPAIR_COUNTERS, max_attempts=2)
+        with patch.dict(HANDLERS, {Job.Kind.REPAIR_COUNTERS: slow_job}), \
+                patch(
+                    'jobs.management.commands.run_jobs.create_pool',
+                    ThreadPoolExecutor
+                ):
+            call_command(
+                'run_jobs', '--once', workers=2, poll_interval=0.1,
+                stdout=StringIO()
+            )
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.SUCCEEDED)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.result, {'done': True})
@@ -1,5 +1,7 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
+from django.db.models.signals import (
+    post_delete, post_migrate, post_save, pre_save
+)
 
 from .superuser import create_admin_user
 
@@ -9,4 +11,20 @@ class MusicConfig(AppConfig):
     name = 'music'
 
     def ready(self) -> None:
+        from . import signals
+
         post_migrate.connect(create_admin_user, sender=self)
+        pre_save.connect(
+            signals.remember_previous_state, sender='music.Musician'
+        )
+        pre_save.connect(
+            signals.remember_previous_state, sender='music.Album'
+        )
+        post_save.connect(signals.album_saved, sender='music.Album')
+        post_delete.connect(signals.album_deleted, sender='music.Album')
+        post_save.connect(
+            signals.album_song_saved, sender='music.AlbumSong'
+        )
+        post_delete.connect(
+            signals.album_song_deleted, sender='music.AlbumSong'
+        )
@@ -0,0 +1,141 @@
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.utils import timezone
+
+from .counters import (
+    change_musician_counters, repair_counters, stale_counters
+)
+from .models import Musician, Album, AlbumSong
+from .signals import catalog_changed
+
+
+def raw_delete(queryset: QuerySet) -> int:
+    """
+    Удаляет строки одним запросом без сигналов и каскадного удаления.
+    На модели каталога подписаны обработчики 'post_delete', поэтому
+    'QuerySet.delete' никогда не удаляет одним запросом: он загружает
+    объекты и вызывает обработчики для каждой строки. Связанные строки
+    удаляются заранее, счетчики и кэш обновляет вызывающий код.
+    Триггеры поискового индекса срабатывают для каждой строки запроса.
+    Использует закрытый 'QuerySet._raw_delete' Django 4.2, на котором
+    построен быстрый путь 'QuerySet.delete'; поведение закреплено
+    в music/tests/test_bulk.py и проверяется при обновлении Django.
+    """
+    return queryset._raw_delete(queryset.db)
+
+
+def notify_changed(
+    musicians: Iterable[str] = (), albums: Iterable[str] = ()
+) -> None:
+    """Отправляет 'catalog_changed' после фиксации транзакции."""
+    musicians, albums = set(musicians), set(albums)
+    transaction.on_commit(lambda: catalog_changed.send(
+        sender=Musician, musicians=musicians, albums=albums
+    ))
+
+
+def repair_catalog_counters() -> dict[str, int]:
+    """
+    Исправляет разошедшиеся счетчики всего каталога и после фиксации
+    транзакции отправляет 'catalog_changed' с исправленными
+    исполнителями и альбомами, чтобы кэш не отдавал старые счетчики.
+    """
+    musicians: set[str] = set()
+    albums: set[str] = set()
+    for queryset, _ in stale_counters().values():
+        if queryset.model is Album:
+            for slug, musician in queryset.values_list(
+                'slug', 'musician__slug'
+            ):
+                albums.add(slug)
+                musicians.add(musician)
+        else:
+            musicians.update(queryset.values_list('slug', flat=True))
+    repaired: dict[str, int] = repair_counters()
+    if musicians or albums:
+        notify_changed(musicians, albums)
+    return repaired
+
+
+def update_objects(objects: list[Model], fields: Iterable[str]) -> int:
+    """
+    Сохраняет поля 'fields' объектов одной модели одним 'bulk_update'
+    и обновляет дату их изменения.
+    """
+    if not objects:
+        return 0
+    modified = timezone.now()
+    for instance in objects:
+        instance.modified = modified
+    return type(objects[0]).objects.bulk_update(
+        objects, [*fields, 'modified']
+    )
+
+
+def create_musicians(items: list[dict[str, Any]]) -> int:
+    """Создает исполнителей одним 'bulk_create'."""
+    musicians: list[Musician] = Musician.objects.bulk_create(
+        Musician(**item) for item in items
+    )
+    notify_changed(musicians=[musician.slug for musician in musicians])
+    return len(musicians)
+
+
+def update_musicians(musicians: list[Musician], fields: set[str]) -> int:
+    """Сохраняет изменения исполнителей одним 'bulk_update'."""
+    notify_changed(musicians=[musician.slug for musician in musicians])
+    return update_objects(musicians, fields)
+
+
+def delete_musicians(musicians: QuerySet[Musician]) -> int:
+    """
+    Удаляет исполнителей вместе с их альбомами и песнями в альбомах
+    за постоянное количество запросов. Песни не удаляются.
+    Должна вызываться в транзакции.
+    """
+    slugs: dict[int, str] = dict(musicians.values_list('pk', 'slug'))
+    raw_delete(AlbumSong.objects.filter(album__musician__in=slugs))
+    raw_delete(Album.objects.filter(musician__in=slugs))
+    notify_changed(musicians=slugs.values())
+    return raw_delete(Musician.objects.filter(pk__in=slugs))
+
+
+def create_albums(musician: Musician, items: list[dict[str, Any]]) -> int:
+    """
+    Создает альбомы исполнителя одним 'bulk_create'
+    и увеличивает счетчик альбомов исполнителя.
+    """
+    albums: list[Album] = Album.objects.bulk_create(
+        Album(musician=musician, **item) for item in items
+    )
+    change_musician_counters(musician.pk, len(albums))
+    notify_changed([musician.slug], [album.slug for album in albums])
+    return len(albums)
+
+
+def update_albums(
+    musician: Musician, albums: list[Album], fields: set[str]
+) -> int:
+    """
+    Сохраняет изменения альбомов исполнителя одним 'bulk_update'
+    и обновляет дату изменения исполнителя.
+    """
+    change_musician_counters(musician.pk)
+    notify_changed([musician.slug], [album.slug for album in albums])
+    return update_objects(albums, fields)
+
+
+def delete_albums(musician: Musician, albums: QuerySet[Album]) -> int:
+    """
+    Удаляет альбомы исполнителя вместе с песнями в альбомах
+    за постоянное количество запросов и пересчитывает счетчики
+    исполнителя. Песни не удаляются. Должна вызываться в транзакции.
+    """
+    slugs: dict[int, str] = dict(albums.values_list('pk', 'slug'))
+    raw_delete(AlbumSong.objects.filter(album__in=slugs))
+    count: int = raw_delete(Album.objects.filter(pk__in=slugs))
+    repair_counters(albums=[], musicians=[musician.pk])
+    notify_changed([musician.slug], slugs.values())
+    return count
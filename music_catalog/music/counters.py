@@ -0,0 +1,98 @@
+from django.db.models import Count, F, OuterRef, Subquery, QuerySet
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Musician, Album, AlbumSong
+
+
+def change_album_counters(album_id: int, songs: int = 0) -> None:
+    """
+    Изменяет счетчики песен альбома и его исполнителя на 'songs'
+    и обновляет дату их изменения.
+    """
+    modified = timezone.now()
+    Album.objects.filter(pk=album_id).update(
+        total_songs=F('total_songs') + songs, modified=modified
+    )
+    Musician.objects.filter(albums=album_id).update(
+        total_songs=F('total_songs') + songs, modified=modified
+    )
+
+
+def change_musician_counters(
+    musician_id: int, albums: int = 0, songs: int = 0
+) -> None:
+    """
+    Изменяет счетчики альбомов и песен исполнителя
+    и обновляет дату его изменения.
+    """
+    Musician.objects.filter(pk=musician_id).update(
+        total_albums=F('total_albums') + albums,
+        total_songs=F('total_songs') + songs,
+        modified=timezone.now()
+    )
+
+
+def _count(queryset: QuerySet, field: str) -> Coalesce:
+    """Возвращает подзапрос количества строк, связанных с 'OuterRef'."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{field: OuterRef('pk')}).order_by()
+            .values(field).annotate(count=Count('pk')).values('count')
+        ),
+        0
+    )
+
+
+def stale_counters(
+    albums: list[int] | None = None,
+    musicians: list[int] | None = None
+) -> dict[str, tuple[QuerySet, dict[str, Coalesce]]]:
+    """
+    Возвращает по каждому счетчику строки альбомов и исполнителей
+    с разошедшимся значением и пересчитанные значения счетчика.
+    Если идентификаторы не переданы, проверяется весь каталог.
+    """
+    album_qs: QuerySet[Album] = Album.objects.all()
+    if albums is not None:
+        album_qs = album_qs.filter(pk__in=albums)
+    musician_qs: QuerySet[Musician] = Musician.objects.all()
+    if musicians is not None:
+        musician_qs = musician_qs.filter(pk__in=musicians)
+    album_songs = _count(AlbumSong.objects.all(), 'album')
+    musician_albums = _count(Album.objects.all(), 'musician')
+    musician_songs = _count(AlbumSong.objects.all(), 'album__musician')
+    return {
+        'album_songs': (
+            album_qs.exclude(total_songs=album_songs),
+            {'total_songs': album_songs}
+        ),
+        'musician_albums': (
+            musician_qs.exclude(total_albums=musician_albums),
+            {'total_albums': musician_albums}
+        ),
+        'musician_songs': (
+            musician_qs.exclude(total_songs=musician_songs),
+            {'total_songs': musician_songs}
+        ),
+    }
+
+
+def repair_counters(
+    albums: list[int] | None = None,
+    musicians: list[int] | None = None
+) -> dict[str, int]:
+    """
+    Пересчитывает счетчики альбомов и исполнителей одним запросом
+    на каждый счетчик и исправляет только разошедшиеся строки.
+    Если идентификаторы не переданы, проверяется весь каталог.
+    Возвращает количество исправленных строк по каждому счетчику.
+    Кэш ответов не сбрасывается: это делает вызывающий код.
+    """
+    modified = timezone.now()
+    return {
+        counter: queryset.update(**values, modified=modified)
+        for counter, (queryset, values) in stale_counters(
+            albums, musicians
+        ).items()
+    }
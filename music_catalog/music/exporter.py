@@ -0,0 +1,112 @@
+import csv
+import json
+from typing import Any, Callable, Iterator
+
+from django.db.models import Prefetch, QuerySet
+
+from .importer import CSV_COLUMNS
+from .models import Musician, Album, AlbumSong
+
+EXPORT_FORMATS: dict[str, str] = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+class Echo:
+    """Буфер для 'csv.writer', возвращающий записанную строку."""
+    def write(self, value: str) -> str:
+        """Возвращает строку вместо записи в буфер."""
+        return value
+
+
+def catalog_queryset() -> QuerySet[Musician]:
+    """
+    Возвращает исполнителей с предзагрузкой альбомов в порядке
+    'Album.Meta.ordering' и песен в порядке номера в альбоме.
+    """
+    return Musician.objects.order_by('pk').prefetch_related(
+        Prefetch('albums', queryset=Album.objects.order_by(
+            *Album._meta.ordering
+        )),
+        Prefetch('albums__albums', queryset=AlbumSong.objects.select_related(
+            'song'
+        ).order_by('number_in_album'))
+    )
+
+
+def iter_catalog(
+    chunk_size: int = 500, progress: Callable[[int], None] | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Обходит каталог курсором базы данных частями по 'chunk_size'
+    исполнителей с предзагрузкой их альбомов и песен для каждой части,
+    поэтому потребление памяти не зависит от размера каталога.
+    'progress' получает количество обработанных исполнителей.
+    """
+    for number, musician in enumerate(
+        catalog_queryset().iterator(chunk_size=chunk_size), 1
+    ):
+        yield {
+            'name': musician.name,
+            'slug': musician.slug,
+            'albums': [
+                {
+                    'name': album.name,
+                    'slug': album.slug,
+                    'year_of_release': album.year_of_release,
+                    'songs': [
+                        {
+                            'name': track.song.name,
+                            'slug': track.song.slug,
+                            'number_in_album': track.number_in_album,
+                        }
+                        for track in album.albums.all()
+                    ],
+                }
+                for album in musician.albums.all()
+            ],
+        }
+        if progress is not None:
+            progress(number)
+
+
+def iter_rows(musician: dict[str, Any]) -> Iterator[list[Any]]:
+    """Разворачивает исполнителя в строки CSV в порядке 'CSV_COLUMNS'."""
+    if not musician['albums']:
+        yield [musician['name'], musician['slug']]
+    for album in musician['albums']:
+        album_row: list[Any] = [
+            musician['name'], musician['slug'],
+            album['name'], album['slug'], album['year_of_release']
+        ]
+        if not album['songs']:
+            yield album_row
+        for song in album['songs']:
+            yield [
+                *album_row,
+                song['name'], song['slug'], song['number_in_album']
+            ]
+
+
+def export_catalog(
+    file_format: str, chunk_size: int = 500,
+    progress: Callable[[int], None] | None = None
+) -> Iterator[str]:
+    """
+    Возвращает каталог построчно в формате NDJSON,
+    по одному исполнителю с альбомами и песнями в строке,
+    или CSV в формате загрузки 'import_catalog'.
+    'progress' получает количество выгруженных исполнителей.
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f'Неизвестный формат: {file_format}.')
+    if file_format == 'ndjson':
+        for musician in iter_catalog(chunk_size, progress):
+            yield json.dumps(musician, ensure_ascii=False) + '\n'
+        return
+    writer = csv.writer(Echo())
+    yield writer.writerow(CSV_COLUMNS)
+    for musician in iter_catalog(chunk_size, progress):
+        for row in iter_rows(musician):
+            yield writer.writerow(row)
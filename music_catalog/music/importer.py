@@ -0,0 +1,369 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from .counters import repair_counters
+from .models import Musician, Album, Song, AlbumSong
+from .signals import catalog_changed
+
+IMPORT_FORMATS: tuple[str, ...] = ('ndjson', 'csv')
+
+MUSICIAN_COLUMNS: dict[str, tuple[type, str]] = {
+    'musician_name': (Musician, 'name'),
+    'musician_slug': (Musician, 'slug'),
+}
+ALBUM_COLUMNS: dict[str, tuple[type, str]] = {
+    'album_name': (Album, 'name'),
+    'album_slug': (Album, 'slug'),
+    'year_of_release': (Album, 'year_of_release'),
+}
+SONG_COLUMNS: dict[str, tuple[type, str]] = {
+    'song_name': (Song, 'name'),
+    'song_slug': (Song, 'slug'),
+    'number_in_album': (AlbumSong, 'number_in_album'),
+}
+CSV_COLUMNS: tuple[str, ...] = (
+    *MUSICIAN_COLUMNS, *ALBUM_COLUMNS, *SONG_COLUMNS
+)
+
+
+def guess_format(name: str) -> str:
+    """Определяет формат файла по расширению."""
+    return 'csv' if name.lower().endswith('.csv') else 'ndjson'
+
+
+@dataclass
+class ImportReport:
+    """Итоги загрузки каталога."""
+    rows: int = 0
+    musicians: int = 0
+    albums: int = 0
+    songs: int = 0
+    tracks: int = 0
+    error_count: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    seconds: float = 0
+    max_errors: int = 100
+
+    def add_error(self, line: int, message: str) -> None:
+        """Учитывает ошибку строки и сохраняет первые 'max_errors' из них."""
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'line': line, 'error': message})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Возвращает итоги загрузки со скоростью обработки строк."""
+        return {
+            'rows': self.rows,
+            'created': {
+                'musicians': self.musicians,
+                'albums': self.albums,
+                'songs': self.songs,
+                'tracks': self.tracks,
+            },
+            'error_count': self.error_count,
+            'errors': self.errors,
+            'seconds': round(self.seconds, 3),
+            'rows_per_second': (
+                round(self.rows / self.seconds) if self.seconds else 0
+            ),
+        }
+
+
+@dataclass
+class ImportRow:
+    """Строка загрузки: исполнитель и, при наличии, альбом и песня."""
+    line: int
+    musician: dict[str, Any]
+    album: dict[str, Any] | None = None
+    song: dict[str, Any] | None = None
+
+
+def nested_records(record: dict[str, Any], key: str) -> list[dict[str, Any]]:
+    """
+    Возвращает вложенные записи 'key': список объектов.
+    Отсутствующий ключ означает пустой список.
+    """
+    records: Any = record.get(key) or []
+    if not isinstance(records, list) or not all(
+        isinstance(nested, dict) for nested in records
+    ):
+        raise ValueError(f'{key}: должен быть список JSON-объектов.')
+    return records
+
+
+def flatten_record(record: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Разворачивает вложенную запись 'исполнитель -> альбомы -> песни'
+    в плоские строки. Плоская запись возвращается без изменений.
+    Вызывает ValueError, если альбомы или песни не списки объектов.
+    """
+    if 'albums' not in record:
+        return [record]
+    musician: dict[str, Any] = {
+        'musician_name': record.get('name'),
+        'musician_slug': record.get('slug'),
+    }
+    rows: list[dict[str, Any]] = []
+    for album in nested_records(record, 'albums'):
+        album_row: dict[str, Any] = {
+            **musician,
+            'album_name': album.get('name'),
+            'album_slug': album.get('slug'),
+            'year_of_release': album.get('year_of_release'),
+        }
+        songs: list[dict[str, Any]] = nested_records(album, 'songs')
+        rows += [
+            {
+                **album_row,
+                'song_name': song.get('name'),
+                'song_slug': song.get('slug'),
+                'number_in_album': song.get('number_in_album'),
+            }
+            for song in songs
+        ] or [album_row]
+    return rows or [musician]
+
+
+def read_records(
+    stream: TextIO, file_format: str
+) -> Iterator[tuple[int, dict[str, Any] | ValueError]]:
+    """
+    Построчно читает NDJSON или CSV и возвращает номер строки и запись.
+    Нечитаемая строка возвращается как ошибка, чтобы не прерывать загрузку.
+    Текст не в кодировке UTF-8 возвращается как ошибка и завершает
+    чтение: поток декодируется блоками, и продолжить его нельзя.
+    """
+    line: int = 0
+    try:
+        if file_format == 'csv':
+            for line, record in enumerate(csv.DictReader(stream), start=2):
+                yield line, {
+                    key: value for key, value in record.items() if value
+                }
+            return
+        for line, text in enumerate(stream, start=1):
+            if not text.strip():
+                continue
+            try:
+                record: Any = json.loads(text)
+                if not isinstance(record, dict):
+                    raise ValueError('Строка должна быть JSON-объектом.')
+                rows: list[dict[str, Any]] = flatten_record(record)
+            except json.JSONDecodeError as error:
+                yield line, ValueError(f'Некорректный JSON: {error}')
+                continue
+            except ValueError as error:
+                yield line, error
+                continue
+            for row in rows:
+                yield line, row
+    except UnicodeDecodeError as error:
+        yield line + 1, ValueError(
+            f'Файл не в кодировке UTF-8, чтение остановлено: {error.reason}.'
+        )
+
+
+def is_utf8(chunks: Iterable[bytes]) -> bool:
+    """Проверяет, что части файла образуют текст в кодировке UTF-8."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for chunk in chunks:
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def clean_values(
+    record: dict[str, Any], columns: dict[str, tuple[type, str]]
+) -> dict[str, Any] | None:
+    """
+    Проверяет значения колонок валидаторами полей моделей.
+    Возвращает None, если ни одна колонка не заполнена.
+    """
+    if all(record.get(column) in (None, '') for column in columns):
+        return None
+    values: dict[str, Any] = {}
+    for column, (model, field_name) in columns.items():
+        try:
+            values[field_name] = model._meta.get_field(field_name).clean(
+                record.get(column), None
+            )
+        except ValidationError as error:
+            raise ValidationError(f'{column}: {" ".join(error.messages)}')
+    return values
+
+
+def parse_row(line: int, record: dict[str, Any]) -> ImportRow:
+    """Проверяет запись и возвращает строку загрузки."""
+    musician = clean_values(record, MUSICIAN_COLUMNS)
+    album = clean_values(record, ALBUM_COLUMNS)
+    song = clean_values(record, SONG_COLUMNS)
+    if musician is None:
+        raise ValidationError('Не указан исполнитель.')
+    if song is not None and album is None:
+        raise ValidationError('Для песни не указан альбом.')
+    return ImportRow(line, musician, album, song)
+
+
+def chunked(
+    iterable: Iterable[Any], size: int
+) -> Iterator[list[Any]]:
+    """Разбивает поток на списки не длиннее 'size'."""
+    iterator: Iterator[Any] = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def create_missing(
+    model: type, objects: dict[str, dict[str, Any]]
+) -> tuple[dict[str, int], int]:
+    """
+    Создает отсутствующие в базе объекты одним 'bulk_create'.
+    Возвращает идентификаторы всех объектов по слагам
+    и количество созданных объектов.
+    """
+    ids: dict[str, int] = dict(
+        model.objects.filter(slug__in=objects).values_list('slug', 'id')
+    )
+    missing: list[str] = [slug for slug in objects if slug not in ids]
+    model.objects.bulk_create(
+        model(slug=slug, **objects[slug]) for slug in missing
+    )
+    if missing:
+        ids.update(
+            model.objects.filter(slug__in=missing).values_list('slug', 'id')
+        )
+    return ids, len(missing)
+
+
+def import_chunk(rows: list[ImportRow], report: ImportReport) -> None:
+    """
+    Загружает часть строк в одной транзакции. Уникальность слагов и
+    ограничения 'AlbumSong' проверяются для всей части сразу,
+    а строки с ошибками пропускаются.
+    """
+    musicians: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        musicians.setdefault(row.musician['slug'], {
+            'name': row.musician['name']
+        })
+    musician_ids, created_musicians = create_missing(Musician, musicians)
+
+    album_owners: dict[str, int] = dict(Album.objects.filter(
+        slug__in={row.album['slug'] for row in rows if row.album}
+    ).values_list('slug', 'musician_id'))
+    albums: dict[str, dict[str, Any]] = {}
+    valid_rows: list[ImportRow] = []
+    for row in rows:
+        if row.album is not None:
+            musician_id: int = musician_ids[row.musician['slug']]
+            owner: int = album_owners.setdefault(
+                row.album['slug'], musician_id
+            )
+            if owner != musician_id:
+                report.add_error(
+                    row.line, 'Альбом с таким слагом '
+                    'принадлежит другому исполнителю.'
+                )
+                continue
+            albums.setdefault(row.album['slug'], {
+                'name': row.album['name'],
+                'year_of_release': row.album['year_of_release'],
+                'musician_id': musician_id,
+            })
+        valid_rows.append(row)
+    album_ids, created_albums = create_missing(Album, albums)
+
+    songs: dict[str, dict[str, Any]] = {}
+    for row in valid_rows:
+        if row.song is not None:
+            songs.setdefault(row.song['slug'], {'name': row.song['name']})
+    song_ids, created_songs = create_missing(Song, songs)
+
+    existing: set[tuple[int, int, int]] = set(AlbumSong.objects.filter(
+        album__in=album_ids.values()
+    ).values_list('album_id', 'song_id', 'number_in_album'))
+    taken: set[tuple[int, int]] = {
+        (album_id, number) for album_id, _, number in existing
+    }
+    tracks: list[AlbumSong] = []
+    for row in valid_rows:
+        if row.song is None:
+            continue
+        track: tuple[int, int, int] = (
+            album_ids[row.album['slug']], song_ids[row.song['slug']],
+            row.song['number_in_album']
+        )
+        if track in existing:
+            continue
+        if track[::2] in taken:
+            report.add_error(
+                row.line,
+                'В альбоме уже есть песня с таким порядковым номером.'
+            )
+            continue
+        existing.add(track)
+        taken.add(track[::2])
+        tracks.append(AlbumSong(
+            album_id=track[0], song_id=track[1], number_in_album=track[2]
+        ))
+    AlbumSong.objects.bulk_create(tracks)
+
+    repair_counters(
+        albums=list(album_ids.values()),
+        musicians=list(musician_ids.values())
+    )
+    report.musicians += created_musicians
+    report.albums += created_albums
+    report.songs += created_songs
+    report.tracks += len(tracks)
+
+
+def import_catalog(
+    stream: TextIO, file_format: str,
+    chunk_size: int = 1000, max_errors: int = 100,
+    progress: Callable[[ImportReport], None] | None = None
+) -> ImportReport:
+    """
+    Загружает каталог из потока NDJSON или CSV частями по 'chunk_size'
+    строк. Каждая часть загружается в своей транзакции, поэтому
+    потребление памяти не зависит от размера файла.
+    'progress' вызывается с текущими итогами после каждой части.
+    """
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f'Неизвестный формат: {file_format}.')
+    report = ImportReport(max_errors=max_errors)
+    started: float = perf_counter()
+    for chunk in chunked(read_records(stream, file_format), chunk_size):
+        rows: list[ImportRow] = []
+        for line, record in chunk:
+            report.rows += 1
+            if isinstance(record, ValueError):
+                report.add_error(line, str(record))
+                continue
+            try:
+                rows.append(parse_row(line, record))
+            except ValidationError as error:
+                report.add_error(line, ' '.join(error.messages))
+        if rows:
+            with transaction.atomic():
+                import_chunk(rows, report)
+            catalog_changed.send(
+                sender=Musician,
+                musicians={row.musician['slug'] for row in rows},
+                albums={row.album['slug'] for row in rows if row.album}
+            )
+        if progress is not None:
+            progress(report)
+    report.seconds = perf_counter() - started
+    return report
@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+from typing import Any, TextIO
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from music.exporter import EXPORT_FORMATS, export_catalog
+
+
+class Command(BaseCommand):
+    """Команда для выгрузки всего каталога в NDJSON или CSV."""
+    help = (
+        'Выгружает исполнителей, альбомы и песни в файл NDJSON или CSV. '
+        'Без пути данные выводятся в стандартный вывод.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--format', choices=EXPORT_FORMATS, default='ndjson',
+            dest='file_format', help='Формат выгрузки.'
+        )
+        parser.add_argument('--output', help='Путь к файлу выгрузки.')
+        parser.add_argument(
+            '--chunk-size', type=int, default=500,
+            help='Количество исполнителей, читаемых из базы за раз.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Записывает каталог построчно в файл или стандартный вывод."""
+        if options['output'] is None:
+            self.write(sys.stdout, options)
+            return
+        with Path(options['output']).open(
+            'w', encoding='utf-8', newline=''
+        ) as stream:
+            self.write(stream, options)
+
+    def write(self, stream: TextIO, options: dict[str, Any]) -> None:
+        """Записывает строки выгрузки в поток."""
+        stream.writelines(
+            export_catalog(options['file_format'], options['chunk_size'])
+        )
@@ -0,0 +1,50 @@
+import json
+import sys
+from pathlib import Path
+from typing import Any, TextIO
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from music.importer import (
+    IMPORT_FORMATS, ImportReport, guess_format, import_catalog
+)
+
+
+class Command(BaseCommand):
+    """Команда для массовой загрузки каталога из NDJSON или CSV."""
+    help = (
+        'Загружает исполнителей, альбомы и песни из файла NDJSON или CSV. '
+        'Путь "-" читает данные из стандартного ввода.'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help='Путь к файлу или "-".')
+        parser.add_argument(
+            '--format', choices=IMPORT_FORMATS, dest='file_format',
+            help='Формат файла. По умолчанию определяется по расширению.'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help='Количество строк, загружаемых в одной транзакции.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Загружает файл и выводит итоги в формате JSON."""
+        path: str = options['path']
+        file_format: str = options['file_format'] or guess_format(path)
+        if path == '-':
+            report: ImportReport = self.load(
+                sys.stdin, file_format, options['chunk_size']
+            )
+        else:
+            with Path(path).open(encoding='utf-8', newline='') as stream:
+                report = self.load(stream, file_format, options['chunk_size'])
+        self.stdout.write(
+            json.dumps(report.as_dict(), ensure_ascii=False, indent=2)
+        )
+
+    def load(
+        self, stream: TextIO, file_format: str, chunk_size: int
+    ) -> ImportReport:
+        """Загружает каталог из открытого потока."""
+        return import_catalog(stream, file_format, chunk_size=chunk_size)
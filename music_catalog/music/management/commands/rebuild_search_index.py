@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from music.search import SearchBackend, get_search_backend
+
+
+class Command(BaseCommand):
+    """Команда для перестроения поискового индекса каталога."""
+    help = 'Перестраивает поисковый индекс каталога.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help='База данных, индекс которой нужно перестроить.'
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Перестраивает индекс, созданный миграциями."""
+        using: str = options['database']
+        backend: SearchBackend = get_search_backend(using)
+        backend.rebuild(connections[using])
+        self.stdout.write(self.style.SUCCESS(
+            f'Поисковый индекс перестроен: {type(backend).__name__}.'
+        ))
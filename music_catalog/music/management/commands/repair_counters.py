@@ -0,0 +1,22 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from music.bulk import repair_catalog_counters
+
+
+class Command(BaseCommand):
+    """Команда для пересчета денормализованных счетчиков каталога."""
+    help = 'Пересчитывает и исправляет счетчики альбомов и песен.'
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """
+        Исправляет разошедшиеся счетчики одной транзакцией
+        и сбрасывает кэш исправленных объектов после ее фиксации.
+        """
+        with transaction.atomic():
+            repaired: dict[str, int] = repair_catalog_counters()
+        for counter, rows in repaired.items():
+            self.stdout.write(f'{counter}: исправлено строк - {rows}')
+        self.stdout.write(self.style.SUCCESS('Счетчики пересчитаны.'))
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.5 on 2026-10-18 07:53
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    """Заполняет счетчики по уже существующим данным каталога."""
+    Musician = apps.get_model('music', 'Musician')
+    Album = apps.get_model('music', 'Album')
+    AlbumSong = apps.get_model('music', 'AlbumSong')
+
+    def count(queryset, field):
+        return Coalesce(
+            Subquery(
+                queryset.filter(**{field: OuterRef('pk')}).order_by()
+                .values(field).annotate(count=Count('pk')).values('count')
+            ),
+            0
+        )
+
+    Album.objects.update(total_songs=count(AlbumSong.objects, 'album'))
+    Musician.objects.update(
+        total_albums=count(Album.objects, 'musician'),
+        total_songs=count(AlbumSong.objects, 'album__musician')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0004_alter_albumsong_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='album',
+            name='total_songs',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество песен'),
+        ),
+        migrations.AddField(
+            model_name='musician',
+            name='total_albums',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество альбомов'),
+        ),
+        migrations.AddField(
+            model_name='musician',
+            name='total_songs',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество песен'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.5 on 2026-10-18 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0005_denormalized_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='album',
+            index=models.Index(fields=['musician', 'name', '-year_of_release', 'id'], name='album_musician_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='musician',
+            index=models.Index(fields=['name', 'id'], name='musician_name_id_idx'),
+        ),
+    ]
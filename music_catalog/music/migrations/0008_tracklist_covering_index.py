@@ -0,0 +1,17 @@
+# Generated by Django 4.2.5 on 2026-10-18 08:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0007_modified_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='albumsong',
+            index=models.Index(fields=['album', 'number_in_album', 'song'], name='albumsong_album_order_idx'),
+        ),
+    ]
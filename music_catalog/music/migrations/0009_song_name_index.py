@@ -0,0 +1,17 @@
+# Generated by Django 4.2.5 on 2026-10-18 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0008_tracklist_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='song',
+            index=models.Index(fields=['name', 'id'], name='song_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,152 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+import music.models
+
+SEARCH_MODELS = {
+    'musician': 'music_musician',
+    'album': 'music_album',
+    'song': 'music_song',
+}
+
+
+def create_fts_sql(table: str) -> list[str]:
+    """
+    Возвращает SQL внешней FTS5-таблицы с триграммным токенизатором
+    и триггеров, синхронизирующих ее с таблицей 'table'.
+    Таблица могла быть создана прежней установкой поиска
+    после миграций, поэтому она перестраивается.
+    """
+    fts_table = f'{table}_fts'
+    return [
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} '
+        f"USING fts5(name, content='{table}', "
+        "content_rowid='id', tokenize='trigram')",
+        f'CREATE TRIGGER IF NOT EXISTS {fts_table}_insert '
+        f'AFTER INSERT ON {table} BEGIN '
+        f'INSERT INTO {fts_table}(rowid, name) '
+        'VALUES (new.id, new.name); END',
+        f'CREATE TRIGGER IF NOT EXISTS {fts_table}_delete '
+        f'AFTER DELETE ON {table} BEGIN '
+        f'INSERT INTO {fts_table}({fts_table}, rowid, name) '
+        "VALUES ('delete', old.id, old.name); END",
+        f'CREATE TRIGGER IF NOT EXISTS {fts_table}_update '
+        f'AFTER UPDATE OF name ON {table} BEGIN '
+        f'INSERT INTO {fts_table}({fts_table}, rowid, name) '
+        "VALUES ('delete', old.id, old.name); "
+        f'INSERT INTO {fts_table}(rowid, name) '
+        'VALUES (new.id, new.name); END',
+        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+def drop_fts_sql(table: str) -> list[str]:
+    """Возвращает SQL удаления FTS5-таблицы и ее триггеров."""
+    fts_table = f'{table}_fts'
+    return [
+        f'DROP TRIGGER IF EXISTS {fts_table}_{event}'
+        for event in ('insert', 'delete', 'update')
+    ] + [f'DROP TABLE IF EXISTS {fts_table}']
+
+
+class SQLiteRunSQL(migrations.RunSQL):
+    """'RunSQL', который выполняется только в SQLite."""
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == 'sqlite':
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == 'sqlite':
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+
+class PostgreSQLTrigramExtension(TrigramExtension):
+    """
+    'TrigramExtension', который и при откате миграции
+    обращается только к PostgreSQL.
+    """
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+
+class PostgreSQLAddIndex(migrations.AddIndex):
+    """
+    'AddIndex', который создает индекс только в PostgreSQL и не меняет
+    состояние моделей: в SQLite GIN-индексов нет.
+    """
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            # Индекс мог быть создан прежней установкой поиска.
+            schema_editor.execute(f'DROP INDEX IF EXISTS {self.index.name}')
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            model = from_state.apps.get_model(app_label, self.model_name)
+            schema_editor.remove_index(model, self.index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('music', '0009_song_name_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name=f'{model_name.capitalize()}SearchEntry',
+            fields=[
+                ('name', music.models.SearchField()),
+                ('rank', models.FloatField()),
+                (model_name, models.OneToOneField(
+                    db_column='rowid', on_delete=models.DO_NOTHING,
+                    primary_key=True, related_name='search_entry',
+                    serialize=False, to=f'music.{model_name}'
+                )),
+            ],
+            options={
+                'db_table': f'{table}_fts',
+                'abstract': False,
+                'managed': False,
+            },
+        )
+        for model_name, table in SEARCH_MODELS.items()
+    ] + [
+        SQLiteRunSQL(
+            create_fts_sql(table), reverse_sql=drop_fts_sql(table)
+        )
+        for table in SEARCH_MODELS.values()
+    ] + [
+        PostgreSQLTrigramExtension(),
+    ] + [
+        PostgreSQLAddIndex(
+            model_name=model_name,
+            index=GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name=f'{table}_name_trgm'
+            ),
+        )
+        for model_name, table in SEARCH_MODELS.items()
+    ]
@@ -1,33 +1,48 @@
 import datetime as dt
 
 from django.db import models
+from django.db.models import Lookup
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractBaseUser
 from django.core.validators import MaxValueValidator
 
 from constants import SONGS_IN_ALBUM
-from core.models import NameSlugField
+from core.models import ModifiedField, NameSlugField
 
 User: AbstractBaseUser = get_user_model()
 
 
-class Musician(NameSlugField, models.Model):
+class Musician(NameSlugField, ModifiedField, models.Model):
     """Модель для представления исполнителей."""
+    total_albums = models.PositiveIntegerField(
+        'Количество альбомов', default=0, editable=False
+    )
+    total_songs = models.PositiveIntegerField(
+        'Количество песен', default=0, editable=False
+    )
+
     class Meta:
         verbose_name = 'Исполнитель'
         verbose_name_plural = 'Исполнители'
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name', 'id'], name='musician_name_id_idx'),
+            models.Index(fields=['modified'], name='musician_modified_idx'),
+        ]
 
 
-class Song(NameSlugField, models.Model):
+class Song(NameSlugField, ModifiedField, models.Model):
     """Модель для представления песен."""
     class Meta:
         verbose_name = 'Песня'
         verbose_name_plural = 'Песни'
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name', 'id'], name='song_name_id_idx'),
+        ]
 
 
-class Album(NameSlugField, models.Model):
+class Album(NameSlugField, ModifiedField, models.Model):
     """Модель для представления музыкальных альбомов."""
     musician = models.ForeignKey(
         Musician, related_name='albums',
@@ -46,11 +61,20 @@ class Album(NameSlugField, models.Model):
         related_name='albums',
         verbose_name='Песни в альбоме'
     )
+    total_songs = models.PositiveIntegerField(
+        'Количество песен', default=0, editable=False
+    )
 
     class Meta:
         verbose_name = 'Альбом'
         verbose_name_plural = 'Альбомы'
         ordering = ['name', '-year_of_release']
+        indexes = [
+            models.Index(
+                fields=['musician', 'name', '-year_of_release', 'id'],
+                name='album_musician_order_idx'
+            ),
+        ]
 
 
 class AlbumSong(models.Model):
@@ -83,3 +107,72 @@ class AlbumSong(models.Model):
             ['album', 'number_in_album']
         ]
         ordering = ['number_in_album']
+        indexes = [
+            models.Index(
+                fields=['album', 'number_in_album', 'song'],
+                name='albumsong_album_order_idx'
+            ),
+        ]
+
+
+class SearchField(models.TextField):
+    """Столбец FTS5-таблицы, в котором ищут выражением MATCH."""
+
+
+@SearchField.register_lookup
+class Match(Lookup):
+    """Поиск по FTS5-столбцу: 'search_entry__name__match'."""
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection) -> tuple[str, list]:
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
+
+
+class SearchEntry(models.Model):
+    """
+    Строка поискового индекса SQLite FTS5 по названию.
+    FTS5-таблицы и триггеры создает миграция, поэтому модели
+    не управляются Django. Связь с записью каталога позволяет
+    отбирать записи и ранг bm25 соединением с FTS5-таблицей.
+    """
+    name = SearchField()
+    rank = models.FloatField()
+
+    class Meta:
+        abstract = True
+        managed = False
+
+
+class MusicianSearchEntry(SearchEntry):
+    """Строка поискового индекса исполнителей."""
+    musician = models.OneToOneField(
+        Musician, on_delete=models.DO_NOTHING, primary_key=True,
+        db_column='rowid', related_name='search_entry'
+    )
+
+    class Meta(SearchEntry.Meta):
+        db_table = 'music_musician_fts'
+
+
+class AlbumSearchEntry(SearchEntry):
+    """Строка поискового индекса альбомов."""
+    album = models.OneToOneField(
+        Album, on_delete=models.DO_NOTHING, primary_key=True,
+        db_column='rowid', related_name='search_entry'
+    )
+
+    class Meta(SearchEntry.Meta):
+        db_table = 'music_album_fts'
+
+
+class SongSearchEntry(SearchEntry):
+    """Строка поискового индекса песен."""
+    song = models.OneToOneField(
+        Song, on_delete=models.DO_NOTHING, primary_key=True,
+        db_column='rowid', related_name='search_entry'
+    )
+
+    class Meta(SearchEntry.Meta):
+        db_table = 'music_song_fts'
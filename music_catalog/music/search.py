@@ -0,0 +1,163 @@
+from typing import Any
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import F, Model, Q, QuerySet
+from django.db.models.functions import Upper
+from django.utils.module_loading import import_string
+
+from .models import Musician, Album, Song
+
+SEARCH_MODELS: tuple[type[Model], ...] = (Musician, Album, Song)
+
+# Аннотация релевантности найденных записей.
+SEARCH_RANK = 'search_rank'
+
+
+class SearchBackend:
+    """
+    Базовый поиск по полю 'name' без индекса:
+    каждое слово запроса ищется через 'icontains'.
+    Поисковые индексы бэкендов создаются миграциями.
+    """
+    # Сортировка по аннотации 'search_rank' от лучших записей к худшим.
+    rank_ordering: str = SEARCH_RANK
+
+    def search(self, queryset: QuerySet, terms: list[str]) -> QuerySet:
+        """Возвращает записи, название которых содержит все слова запроса."""
+        for term in terms:
+            queryset = queryset.filter(name__icontains=term)
+        return queryset
+
+    def rebuild(self, connection: BaseDatabaseWrapper) -> None:
+        """Перестраивает поисковый индекс по текущим данным."""
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """
+    Полнотекстовый поиск SQLite FTS5 с триграммным токенизатором.
+    Для каждой модели миграция создает внешнюю FTS5-таблицу,
+    синхронизируемую триггерами при вставке, изменении и удалении строк.
+    Записи соединяются с ней через связь 'search_entry'.
+    Триграммный индекс находит части слов без учета регистра,
+    но не слова с опечатками. Слова короче трех символов
+    он не находит, поэтому для них используется 'icontains'.
+    """
+    min_term_length: int = 3
+
+    @staticmethod
+    def fts_table(model: type[Model]) -> str:
+        """Возвращает имя FTS5-таблицы модели."""
+        return f'{model._meta.db_table}_fts'
+
+    @staticmethod
+    def match_query(terms: list[str]) -> str:
+        """Экранирует слова запроса для выражения FTS5 MATCH."""
+        return ' AND '.join(
+            '"{}"'.format(term.replace('"', '""')) for term in terms
+        )
+
+    def search(self, queryset: QuerySet, terms: list[str]) -> QuerySet:
+        """
+        Возвращает найденные записи, отсортированные по релевантности.
+        Записи отбираются соединением с FTS5-таблицей, а ранг bm25
+        доступен в аннотации 'search_rank': чем меньше, тем лучше.
+        """
+        indexed: list[str] = [
+            term for term in terms if len(term) >= self.min_term_length
+        ]
+        queryset = super().search(
+            queryset, [term for term in terms if term not in indexed]
+        )
+        if not indexed:
+            return queryset
+        return queryset.filter(
+            search_entry__name__match=self.match_query(indexed)
+        ).annotate(**{
+            SEARCH_RANK: F('search_entry__rank')
+        }).order_by(self.rank_ordering, *queryset.model._meta.ordering)
+
+    def rebuild(self, connection: BaseDatabaseWrapper) -> None:
+        """Перестраивает FTS5-таблицы по содержимому таблиц каталога."""
+        with connection.cursor() as cursor:
+            for model in SEARCH_MODELS:
+                fts_table: str = self.fts_table(model)
+                cursor.execute(
+                    f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"
+                )
+
+
+class PostgreSQLTrigramBackend(SearchBackend):
+    """
+    Поиск PostgreSQL по триграммному GIN-индексу 'pg_trgm' по UPPER(name),
+    который создает миграция. Находятся названия, содержащие все слова
+    запроса ('icontains' сравнивает UPPER(name)), и похожие на запрос
+    названия с опечатками. Триграммы не зависят от регистра, поэтому
+    оба условия используют один индекс. Релевантность определяется
+    триграммным сходством с запросом.
+    """
+    rank_ordering: str = f'-{SEARCH_RANK}'
+
+    @staticmethod
+    def index_name(model: type[Model]) -> str:
+        """Возвращает имя триграммного индекса модели."""
+        return f'{model._meta.db_table}_name_trgm'
+
+    def search(self, queryset: QuerySet, terms: list[str]) -> QuerySet:
+        """
+        Возвращает найденные записи, отсортированные по релевантности.
+        Сходство с запросом доступно в аннотации 'search_rank'.
+        """
+        from django.contrib.postgres.lookups import TrigramSimilar
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        if not terms:
+            return queryset
+        query: str = ' '.join(terms)
+        contains = Q()
+        for term in terms:
+            contains &= Q(name__icontains=term)
+        return queryset.filter(
+            contains | Q(TrigramSimilar(Upper('name'), query))
+        ).annotate(**{
+            SEARCH_RANK: TrigramSimilarity(Upper('name'), query)
+        }).order_by(self.rank_ordering, *queryset.model._meta.ordering)
+
+    def rebuild(self, connection: BaseDatabaseWrapper) -> None:
+        """Перестраивает триграммные индексы."""
+        with connection.cursor() as cursor:
+            for model in SEARCH_MODELS:
+                cursor.execute(f'REINDEX INDEX {self.index_name(model)}')
+
+
+VENDOR_BACKENDS: dict[str, type[SearchBackend]] = {
+    'sqlite': SQLiteFTSBackend,
+    'postgresql': PostgreSQLTrigramBackend,
+}
+
+
+def get_search_backend(using: str = DEFAULT_DB_ALIAS) -> SearchBackend:
+    """
+    Возвращает поисковый бэкенд из настройки 'CATALOG_SEARCH_BACKEND'
+    или, если она не задана, бэкенд для используемой базы данных.
+    """
+    path: str | None = getattr(settings, 'CATALOG_SEARCH_BACKEND', None)
+    if path:
+        return import_string(path)()
+    return VENDOR_BACKENDS.get(connections[using].vendor, SearchBackend)()
+
+
+def search_catalog(queryset: QuerySet, terms: list[str]) -> QuerySet:
+    """Выполняет поиск бэкендом базы данных, к которой обращен запрос."""
+    return get_search_backend(queryset.db).search(queryset, terms)
+
+
+def search_ordering(queryset: QuerySet) -> tuple[str, ...]:
+    """
+    Возвращает сортировку по релевантности, если записи найдены
+    поиском с ранжированием, иначе пустой кортеж.
+    """
+    if SEARCH_RANK not in queryset.query.annotations:
+        return ()
+    return (get_search_backend(queryset.db).rank_ordering,)
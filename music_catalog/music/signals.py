@@ -0,0 +1,103 @@
+from typing import Any
+
+from django.db.models import Model, QuerySet
+from django.dispatch import Signal
+
+from .counters import change_album_counters, change_musician_counters
+from .models import Musician, Album, AlbumSong
+
+# Отправляется после массовых изменений каталога в обход сигналов моделей.
+# Аргументы: 'musicians' и 'albums' - слаги затронутых объектов.
+catalog_changed = Signal()
+
+
+def deleted_with(origin: Model | QuerySet | None, *models: type) -> bool:
+    """Проверяет, вызвано ли удаление удалением объектов из 'models'."""
+    if isinstance(origin, QuerySet):
+        return origin.model in models
+    return isinstance(origin, models)
+
+
+PREVIOUS_STATE_FIELDS: dict[type[Model], tuple[str, ...]] = {
+    Musician: ('slug',),
+    Album: ('slug', 'musician_id'),
+}
+
+
+def remember_previous_state(
+    sender: type[Model], instance: Model, raw: bool = False, **kwargs: Any
+) -> None:
+    """
+    Запоминает сохраненные в базе значения полей перед изменением объекта.
+    Они доступны обработчикам 'post_save' в атрибуте '_previous'.
+    """
+    if raw or instance.pk is None:
+        return
+    instance._previous = sender.objects.filter(pk=instance.pk).values(
+        *PREVIOUS_STATE_FIELDS[sender]
+    ).first()
+
+
+def album_saved(
+    sender: type[Album], instance: Album, created: bool,
+    raw: bool = False, **kwargs: Any
+) -> None:
+    """
+    Обновляет счетчики и дату изменения исполнителей
+    после сохранения альбома.
+    """
+    if raw:
+        return
+    if created:
+        change_musician_counters(instance.musician_id, 1, 0)
+        return
+    previous: int | None = (
+        getattr(instance, '_previous', None) or {}
+    ).get('musician_id')
+    if previous is not None and previous != instance.musician_id:
+        change_musician_counters(previous, -1, -instance.total_songs)
+        change_musician_counters(
+            instance.musician_id, 1, instance.total_songs
+        )
+    else:
+        change_musician_counters(instance.musician_id)
+
+
+def album_deleted(
+    sender: type[Album], instance: Album,
+    origin: Model | QuerySet | None = None, **kwargs: Any
+) -> None:
+    """
+    Уменьшает счетчики исполнителя после удаления альбома.
+    При каскадном удалении исполнителя счетчики не изменяются.
+    """
+    if not deleted_with(origin, Musician):
+        change_musician_counters(
+            instance.musician_id, -1, -instance.total_songs
+        )
+
+
+def album_song_saved(
+    sender: type[AlbumSong], instance: AlbumSong, created: bool,
+    raw: bool = False, **kwargs: Any
+) -> None:
+    """
+    Увеличивает счетчики песен после добавления песни в альбом.
+    При изменении песни в альбоме обновляет дату изменения
+    альбома и исполнителя.
+    """
+    if not raw:
+        change_album_counters(instance.album_id, 1 if created else 0)
+
+
+def album_song_deleted(
+    sender: type[AlbumSong], instance: AlbumSong,
+    origin: Model | QuerySet | None = None, **kwargs: Any
+) -> None:
+    """
+    Уменьшает счетчики песен после удаления песни из альбома.
+    При каскадном удалении альбома или исполнителя счетчики
+    обновляются обработчиком удаления альбома.
+    """
+    if not deleted_with(origin, Musician, Album):
+        change_album_counters(instance.album_id, -1)
@@ -0,0 +1,97 @@
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.test import TestCase
+
+from music.bulk import delete_albums, delete_musicians, raw_delete
+from music.models import Musician, Song, Album, AlbumSong
+from music.search import SEARCH_MODELS, get_search_backend, search_catalog
+
+
+class BulkDeleteTests(TestCase):
+    """
+    Тесты массового удаления через закрытый 'QuerySet._raw_delete':
+    закрепляют поведение, на которое опирается 'raw_delete'.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.musicians: list[Musician] = []
+        for name in ('First', 'Second'):
+            musician = Musician.objects.create(
+                name=f'{name} musician', slug=name.lower()
+            )
+            for number in (1, 2):
+                album = Album.objects.create(
+                    name=f'{name} album {number}',
+                    slug=f'{name.lower()}-album-{number}',
+                    musician=musician, year_of_release=2000
+                )
+                AlbumSong.objects.create(
+                    album=album, number_in_album=1,
+                    song=Song.objects.create(
+                        name=f'{name} song {number}',
+                        slug=f'{name.lower()}-song-{number}'
+                    )
+                )
+            cls.musicians.append(musician)
+
+    def assertSearchIndexValid(self) -> None:
+        """
+        Проверяет, что FTS5-индекс совпадает с таблицами: FTS5 вызывает
+        ошибку 'integrity-check', если строки удалены мимо триггеров.
+        """
+        backend = get_search_backend()
+        if not hasattr(backend, 'fts_table'):
+            return
+        with connection.cursor() as cursor:
+            for model in SEARCH_MODELS:
+                table: str = backend.fts_table(model)
+                cursor.execute(
+                    f"INSERT INTO {table}({table}, rank) "
+                    "VALUES ('integrity-check', 1)"
+                )
+
+    def test_raw_delete(self) -> None:
+        """Одно удаление одним запросом без сигналов 'post_delete'."""
+        deleted: list = []
+
+        def receiver(**kwargs) -> None:
+            deleted.append(kwargs['instance'])
+
+        post_delete.connect(receiver)
+        try:
+            with self.assertNumQueries(1):
+                count: int = raw_delete(AlbumSong.objects.all())
+        finally:
+            post_delete.disconnect(receiver)
+        self.assertEqual(count, 4)
+        self.assertEqual(deleted, [])
+
+    def test_delete_musicians(self) -> None:
+        """Удаляются исполнитель, его альбомы и строки поиска."""
+        first, second = self.musicians
+        count: int = delete_musicians(Musician.objects.filter(pk=first.pk))
+        self.assertEqual(count, 1)
+        self.assertFalse(Album.objects.filter(musician=first).exists())
+        self.assertEqual(AlbumSong.objects.count(), 2)
+        self.assertEqual(Song.objects.count(), 4)
+        self.assertSearchIndexValid()
+        self.assertTrue(search_catalog(
+            Musician.objects.all(), ['second']
+        ).exists())
+
+    def test_delete_albums(self) -> None:
+        """Счетчики исполнителя пересчитываются один раз."""
+        first: Musician = self.musicians[0]
+        count: int = delete_albums(
+            first, Album.objects.filter(slug='first-album-1')
+        )
+        self.assertEqual(count, 1)
+        first.refresh_from_db()
+        self.assertEqual(first.total_albums, 1)
+        self.assertEqual(first.total_songs, 1)
+        self.assertEqual(
+            list(search_catalog(Album.objects.all(), ['first'])),
+            [Album.objects.get(slug='first-album-2')]
+        )
+        self.assertSearchIndexValid()
@@ -0,0 +1,60 @@
+import json
+from io import BytesIO, StringIO, TextIOWrapper
+
+from django.test import TestCase
+
+from music.importer import ImportReport, import_catalog
+from music.models import Musician, AlbumSong
+
+
+class ImportCatalogTests(TestCase):
+    """Тесты загрузки каталога."""
+
+    def test_nested_records(self) -> None:
+        """Альбомы и песни не в виде списков объектов - ошибки строк."""
+        lines: list[dict] = [
+            {'name': 'One', 'slug': 'one', 'albums': 'oops'},
+            {'name': 'Two', 'slug': 'two', 'albums': [
+                {'name': 'Album', 'slug': 'album', 'year_of_release': 2000,
+                 'songs': [1, 2]},
+            ]},
+            {'name': 'Three', 'slug': 'three', 'albums': None},
+            {'name': 'Four', 'slug': 'four', 'albums': [
+                {'name': 'Four album', 'slug': 'four-album',
+                 'year_of_release': 2001, 'songs': [
+                     {'name': 'Song', 'slug': 'song', 'number_in_album': 1},
+                 ]},
+            ]},
+        ]
+        report: ImportReport = import_catalog(
+            StringIO('\n'.join(map(json.dumps, lines))), 'ndjson'
+        )
+        self.assertEqual(
+            [error['line'] for error in report.errors], [1, 2]
+        )
+        self.assertEqual(
+            set(Musician.objects.values_list('slug', flat=True)),
+            {'three', 'four'}
+        )
+        self.assertEqual(AlbumSong.objects.count(), 1)
+
+    def test_not_utf8(self) -> None:
+        """
+        Текст не в кодировке UTF-8 завершает загрузку ошибкой строки,
+        а прочитанные до него строки загружаются.
+        """
+        text: str = (
+            'musician_name,musician_slug\n'
+            'One,one\n'
+            + ''.join(f'Исполнитель {number},m{number}\n'
+                      for number in range(2000))
+        )
+        report: ImportReport = import_catalog(
+            TextIOWrapper(
+                BytesIO(text.encode('cp1251')), encoding='utf-8', newline=''
+            ),
+            'csv'
+        )
+        self.assertEqual(report.error_count, 1)
+        self.assertIn('UTF-8', report.errors[0]['error'])
+        self.assertEqual(report.musicians, 0)
@@ -0,0 +1,95 @@
+from typing import Any
+
+from django.db.models import F
+from django.utils import timezone
+
+from .bulk import notify_changed, raw_delete
+from .counters import change_album_counters
+from .models import Album, Song, AlbumSong
+
+
+def replace_tracklist(
+    album: Album, songs: list[dict[str, Any]]
+) -> list[AlbumSong]:
+    """
+    Заменяет список песен альбома списком 'songs' с полями 'name'
+    и 'slug'; порядковые номера задаются порядком песен в списке.
+    Песни находятся по слагам, отсутствующие создаются, у найденных
+    обновляется название. Песни, которых нет в списке, убираются
+    из альбома, но не удаляются.
+    Выполняется за постоянное количество запросов: изменения
+    записываются через 'bulk_create' и 'bulk_update', а чтобы не нарушить
+    уникальность номеров, перенумерация выполняется в два этапа:
+    сначала переставляемые песни сдвигаются за последний текущий
+    и последний новый номер альбома.
+    Сигналы моделей не отправляются, поэтому счетчики обновляются здесь,
+    а кэш сбрасывается сигналом 'catalog_changed' после фиксации.
+    Должна вызываться в транзакции.
+    """
+    modified = timezone.now()
+    names: dict[str, str] = {song['slug']: song['name'] for song in songs}
+    existing: dict[str, Song] = Song.objects.in_bulk(
+        names, field_name='slug'
+    )
+    renamed: list[Song] = []
+    for song in existing.values():
+        if song.name != names[song.slug]:
+            song.name, song.modified = names[song.slug], modified
+            renamed.append(song)
+    Song.objects.bulk_update(renamed, ['name', 'modified'])
+    existing.update(
+        (song.slug, song) for song in Song.objects.bulk_create(
+            Song(name=name, slug=slug)
+            for slug, name in names.items() if slug not in existing
+        )
+    )
+    numbers: dict[int, int] = {
+        existing[slug].pk: number for number, slug in enumerate(names, 1)
+    }
+
+    kept: dict[int, AlbumSong] = {}
+    removed: list[int] = []
+    for track in AlbumSong.objects.filter(album=album):
+        if track.song_id in numbers and track.song_id not in kept:
+            kept[track.song_id] = track
+        else:
+            removed.append(track.pk)
+    if removed:
+        raw_delete(AlbumSong.objects.filter(pk__in=removed))
+    moved: list[AlbumSong] = [
+        track for song_id, track in kept.items()
+        if track.number_in_album != numbers[song_id]
+    ]
+    if moved:
+        AlbumSong.objects.filter(pk__in=[track.pk for track in moved]).update(
+            number_in_album=F('number_in_album') + max(
+                len(numbers),
+                *(track.number_in_album for track in kept.values())
+            )
+        )
+        for track in moved:
+            track.number_in_album = numbers[track.song_id]
+        AlbumSong.objects.bulk_update(moved, ['number_in_album'])
+    AlbumSong.objects.bulk_create(
+        AlbumSong(album=album, song_id=song_id, number_in_album=number)
+        for song_id, number in numbers.items() if song_id not in kept
+    )
+    change_album_counters(album.pk, len(numbers) - len(kept) - len(removed))
+
+    albums: set[str] = {album.slug}
+    musicians: set[str] = {album.musician.slug}
+    if renamed:
+        for slug, musician_slug in AlbumSong.objects.filter(
+            song__in=renamed
+        ).exclude(album=album).values_list(
+            'album__slug', 'album__musician__slug'
+        ):
+            albums.add(slug)
+            musicians.add(musician_slug)
+    notify_changed(musicians, albums)
+    return [
+        AlbumSong(
+            album=album, song=existing[slug], number_in_album=number
+        )
+        for number, slug in enumerate(names, 1)
+    ]
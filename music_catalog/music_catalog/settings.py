@@ -48,21 +48,35 @@ INSTALLED_APPS = [
     'api',
     'core',
     'music',
+    'jobs',
 
     'drf_spectacular',
     'rest_framework',
 ]
 
 REST_FRAMEWORK = {
-    'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_SCHEMA_CLASS': 'api.schema.CatalogAutoSchema',
 
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CatalogJWTAuthentication',
     ),
 
-    'DEFAULT_PAGINATION_CLASS': ('rest_framework'
-                                 '.pagination.PageNumberPagination'),
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.CatalogJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.CatalogPagination',
     'PAGE_SIZE': 5,
+
+    # Login attempts per client IP and per username.
+    'DEFAULT_THROTTLE_RATES': {
+        'login': getenv('LOGIN_THROTTLE_RATE', '20/min'),
+        'login_username': getenv('LOGIN_USERNAME_THROTTLE_RATE', '10/min'),
+    },
+    # Trusted proxies in front of gunicorn; with 0 the client IP is
+    # REMOTE_ADDR and X-Forwarded-For is ignored.
+    'NUM_PROXIES': int(getenv('NUM_PROXIES', 0)),
 }
 
 SPECTACULAR_SETTINGS = {
@@ -71,11 +85,24 @@ SPECTACULAR_SETTINGS = {
     'VERSION': '1.0',
 }
 
+# Dotted path to a 'music.search.SearchBackend' subclass.
+# By default the backend is chosen by the database vendor.
+CATALOG_SEARCH_BACKEND = getenv('CATALOG_SEARCH_BACKEND')
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+    # Tokens carry a hash of the password, so changing it revokes them.
+    'CHECK_REVOKE_TOKEN': True,
 }
 
+# Seconds a user's password hash and flags stay cached for JWT checks.
+# Saving or deleting the user resets the entry immediately; the timeout
+# bounds staleness for changes that bypass model signals.
+AUTH_STATE_CACHE_TIMEOUT = int(getenv('AUTH_STATE_CACHE_TIMEOUT', 30))
+
 MIDDLEWARE = [
+    'api.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -109,13 +136,170 @@ WSGI_APPLICATION = 'music_catalog.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DATABASE_ENGINE selects 'sqlite' (default) or 'postgresql'.
+# Connections are persistent for DB_CONN_MAX_AGE seconds and checked
+# before reuse. Django 4.2 has no built-in pool: put PgBouncer in
+# transaction mode in front of PostgreSQL and set DB_PGBOUNCER=1, which
+# disables server-side cursors that do not survive transaction pooling.
+
+DATABASE_ENGINE = getenv('DATABASE_ENGINE', 'sqlite')
+
+if DATABASE_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': getenv('POSTGRES_DB', 'catalog'),
+            'USER': getenv('POSTGRES_USER', 'catalog'),
+            'PASSWORD': getenv('POSTGRES_PASSWORD', ''),
+            'HOST': getenv('DB_HOST', 'localhost'),
+            'PORT': getenv('DB_PORT', '5432'),
+            'DISABLE_SERVER_SIDE_CURSORS': getenv('DB_PGBOUNCER') == '1',
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': getenv('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        }
+    }
+
+DATABASES['default'].update({
+    'CONN_MAX_AGE': int(getenv('DB_CONN_MAX_AGE', 60)),
+    'CONN_HEALTH_CHECKS': True,
+})
+
+# DATABASE_REPLICAS lists read replicas separated by commas: SQLite file
+# paths or PostgreSQL host[:port] with the primary's credentials.
+# Safe-method catalog requests read from a random replica; see
+# 'core.routers.PrimaryReplicaRouter' and 'api.mixins.ReplicaReadMixin'.
+# After a write the client reads from the primary for
+# REPLICA_PIN_SECONDS; the X-Use-Primary header pins a single request.
+
+DATABASE_REPLICAS = []
+
+for index, replica in enumerate(
+    filter(None, getenv('DATABASE_REPLICAS', '').split(','))
+):
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'], 'TEST': {'MIRROR': 'default'}
     }
+    if DATABASE_ENGINE == 'postgresql':
+        host, _, port = replica.strip().partition(':')
+        DATABASES[alias].update(
+            HOST=host, PORT=port or DATABASES['default']['PORT']
+        )
+    else:
+        DATABASES[alias]['NAME'] = replica.strip()
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+REPLICA_PIN_SECONDS = int(getenv('REPLICA_PIN_SECONDS', 10))
+
+# Applied to every new SQLite connection by 'core.db.configure_sqlite'.
+# busy_timeout is in milliseconds, a negative cache_size is in KiB.
+
+SQLITE_PRAGMAS = {
+    'journal_mode': getenv('SQLITE_JOURNAL_MODE', 'wal'),
+    'synchronous': getenv('SQLITE_SYNCHRONOUS', 'normal'),
+    'cache_size': int(getenv('SQLITE_CACHE_SIZE', -64000)),
+    'busy_timeout': int(getenv('SQLITE_BUSY_TIMEOUT', 5000)),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# The local-memory cache is per process: with several worker processes
+# set REDIS_URL so that invalidation reaches every worker. The container
+# entrypoint starts a local Redis and sets REDIS_URL when it is unset.
+
+if getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+
+CATALOG_CACHE_TIMEOUT = int(getenv('CATALOG_CACHE_TIMEOUT', 300))
+
+# Slug to primary key mappings: per-process LRU size and shared cache TTL.
+SLUG_CACHE_SIZE = int(getenv('SLUG_CACHE_SIZE', 10000))
+SLUG_CACHE_TIMEOUT = int(getenv('SLUG_CACHE_TIMEOUT', 3600))
+
+
+# Background jobs
+# Heavy admin operations are queued in the 'jobs' table and run by
+# 'manage.py run_jobs' in a pool of JOBS_WORKERS processes. A failed job
+# is retried up to JOBS_MAX_ATTEMPTS times with exponential backoff from
+# JOBS_RETRY_DELAY seconds. The worker renews the lease of its running
+# jobs on every poll; a job whose lease has not been renewed for
+# JOBS_LEASE_SECONDS is considered lost and is claimed again.
+# Uploaded imports and exports are stored in JOBS_DIR.
+
+JOBS_DIR = Path(getenv('JOBS_DIR', BASE_DIR / 'job_files'))
+JOBS_WORKERS = int(getenv('JOBS_WORKERS', 2))
+JOBS_MAX_ATTEMPTS = int(getenv('JOBS_MAX_ATTEMPTS', 3))
+JOBS_RETRY_DELAY = int(getenv('JOBS_RETRY_DELAY', 30))
+JOBS_LEASE_SECONDS = int(getenv('JOBS_LEASE_SECONDS', 300))
+JOBS_POLL_INTERVAL = float(getenv('JOBS_POLL_INTERVAL', 1))
+
+
+# Profiling
+# Adds Server-Timing headers and 'api.profiling' log lines with SQL and
+# total timings, plus authentication and handler timings for the catalog
+# views, and collects per-process stats served at /api/v1/profiling/.
+
+CATALOG_PROFILING = getenv('CATALOG_PROFILING', '').lower() in ('1', 'true')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'api.profiling': {'handlers': ['console'], 'level': 'INFO'},
+    },
+}
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/
+
+# PASSWORD_HASHER selects the hasher for new passwords: 'scrypt' (default),
+# 'argon2' (requires argon2-cffi) or 'pbkdf2'. The others stay enabled, so
+# existing hashes still verify and are rehashed on the next login, as are
+# hashes made with a different cost.
+
+PASSWORD_HASHER = getenv('PASSWORD_HASHER', 'scrypt')
+
+CATALOG_PASSWORD_HASHERS = {
+    'scrypt': 'core.hashers.TunedScryptPasswordHasher',
+    'argon2': 'core.hashers.TunedArgon2PasswordHasher',
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
 }
 
+PASSWORD_HASHERS = [CATALOG_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in CATALOG_PASSWORD_HASHERS.items()
+    if name != PASSWORD_HASHER
+]
+
+SCRYPT_WORK_FACTOR = int(getenv('SCRYPT_WORK_FACTOR', 2 ** 14))
+
+ARGON2_TIME_COST = int(getenv('ARGON2_TIME_COST', 2))
+ARGON2_MEMORY_COST = int(getenv('ARGON2_MEMORY_COST', 19456))
+ARGON2_PARALLELISM = int(getenv('ARGON2_PARALLELISM', 1))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators